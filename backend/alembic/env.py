@@ -13,6 +13,7 @@ sys.path.insert(0, os.path.join(BASE_DIR, "src"))
 from app.core.config import settings
 from app.db.session import Base
 from app.db import models  # noqa: F401  # Ensures models are imported
+from app.db.fulltext import is_fulltext_object
 
 config = context.config
 
@@ -24,11 +25,17 @@ config.set_main_option("sqlalchemy.url", settings.database_url)
 target_metadata = Base.metadata
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    # Tabelas FTS5 e índices GIN/pg_trgm vivem fora do metadata (app.db.fulltext)
+    return not (reflected and compare_to is None and is_fulltext_object(name))
+
+
 def run_migrations_offline() -> None:
     url = settings.database_url
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -48,6 +55,7 @@ def run_migrations_online() -> None:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,97 @@
+"""hiring funnel aggregates
+
+Revision ID: 01a4ea400385
+Revises: 716888564c02
+Create Date: 2026-10-18 15:39:12.224884
+"""
+import math
+from collections import Counter
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '01a4ea400385'
+down_revision = '716888564c02'
+branch_labels = None
+depends_on = None
+
+# Cópia congelada do replay de app.services.status_history.rebuild_funnel
+# (a migração não importa o código da aplicação)
+FUNNEL = ("aplicado", "em_analise", "entrevista", "oferecido")
+REJECTED = "rejeitado"
+BUCKET_BASE = 60.0
+BUCKET_RATIO = math.sqrt(2)
+BATCH_SIZE = 10_000
+
+
+def _bucket(seconds: float) -> int:
+    return 0 if seconds < BUCKET_BASE else int(math.log(seconds / BUCKET_BASE, BUCKET_RATIO))
+
+
+def _backfill_funnel(conn) -> None:
+    history = sa.table(
+        'application_status_history', sa.column('id'), sa.column('application_id'), sa.column('job_id'),
+        sa.column('to_status'), sa.column('changed_at', sa.DateTime()),
+    )
+    stats = sa.table('job_stage_stats', sa.column('job_id'), sa.column('stage'), sa.column('reached'), sa.column('rejected'))
+    durations = sa.table('job_stage_durations', sa.column('job_id'), sa.column('stage'), sa.column('bucket'), sa.column('count'))
+
+    reached, rejected, spent = Counter(), Counter(), Counter()
+    current, previous = None, []
+    result = conn.execute(
+        sa.select(history.c.application_id, history.c.job_id, history.c.to_status, history.c.changed_at)
+        .order_by(history.c.application_id, history.c.id)
+        .execution_options(yield_per=BATCH_SIZE)
+    )
+    for app_id, job_id, new, at in result:
+        if app_id != current:
+            current, previous = app_id, []
+        if previous:
+            old, entered_at = previous[-1]
+            spent[(job_id, old, _bucket(max((at - entered_at).total_seconds(), 0.0)))] += 1
+            if new == REJECTED:
+                rejected[(job_id, old)] += 1
+        if new in FUNNEL:
+            top = max((FUNNEL.index(s) for s, _ in previous if s in FUNNEL), default=-1)
+            for stage in FUNNEL[top + 1:FUNNEL.index(new) + 1]:
+                reached[(job_id, stage)] += 1
+        previous.append((new, at))
+
+    stage_rows = [
+        {"job_id": job_id, "stage": stage, "reached": reached[(job_id, stage)], "rejected": rejected[(job_id, stage)]}
+        for job_id, stage in sorted(set(reached) | set(rejected))
+    ]
+    duration_rows = [
+        {"job_id": job_id, "stage": stage, "bucket": bucket, "count": spent[(job_id, stage, bucket)]}
+        for job_id, stage, bucket in sorted(spent)
+    ]
+    if stage_rows:
+        conn.execute(stats.insert(), stage_rows)
+    if duration_rows:
+        conn.execute(durations.insert(), duration_rows)
+
+
+def upgrade() -> None:
+    op.create_table('job_stage_durations',
+    sa.Column('job_id', sa.String(length=36), nullable=False),
+    sa.Column('stage', sa.String(length=20), nullable=False),
+    sa.Column('bucket', sa.Integer(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('job_id', 'stage', 'bucket')
+    )
+    op.create_table('job_stage_stats',
+    sa.Column('job_id', sa.String(length=36), nullable=False),
+    sa.Column('stage', sa.String(length=20), nullable=False),
+    sa.Column('reached', sa.Integer(), nullable=False),
+    sa.Column('rejected', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('job_id', 'stage')
+    )
+
+    # Agregados do funil a partir do histórico já existente
+    _backfill_funnel(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_table('job_stage_stats')
+    op.drop_table('job_stage_durations')
@@ -0,0 +1,80 @@
+"""full text search
+
+Revision ID: 0b6f3d9a2c71
+Revises: e7a3c5910b4f
+Create Date: 2026-10-18 18:05:12.604117
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '0b6f3d9a2c71'
+down_revision = 'e7a3c5910b4f'
+branch_labels = None
+depends_on = None
+
+# DDL congelada de app.db.fulltext na época desta revisão (a migração não
+# importa o código da aplicação): (tabela, colunas, pesos do Postgres, colunas pg_trgm)
+SPECS = (
+    ("candidates", ("name", "email", "resume_text"), ("A", "B", "D"), ("name", "email")),
+    ("jobs", ("title", "short_description", "full_description"), ("A", "B", "D"), ("title",)),
+)
+TS_CONFIG = "simple"
+
+
+def _sqlite_statements(table, columns):
+    fts, cols = f"{table}_fts", ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    delete = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.rowid, {old});"
+    insert = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {new});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, content='{table}', "
+        f"content_rowid='rowid', tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN {delete} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN {delete} {insert} END",
+        # Popula a partir das linhas existentes
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def _postgres_statements(table, columns, weights, trigram):
+    tsvector = " || ".join(
+        f"setweight(to_tsvector('{TS_CONFIG}', coalesce({col}, '')), '{weight}')"
+        for col, weight in zip(columns, weights)
+    )
+    return [f"CREATE INDEX IF NOT EXISTS ix_{table}_fts ON {table} USING GIN (({tsvector}))"] + [
+        f"CREATE INDEX IF NOT EXISTS ix_{table}_{col}_trgm ON {table} USING GIN ({col} gin_trgm_ops)"
+        for col in trigram
+    ]
+
+
+def upgrade() -> None:
+    # FTS5 + triggers (SQLite) ou GIN tsvector + pg_trgm (Postgres)
+    conn = op.get_bind()
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, columns, weights, trigram in SPECS:
+        if dialect == "sqlite":
+            statements = _sqlite_statements(table, columns)
+        elif dialect == "postgresql":
+            statements = _postgres_statements(table, columns, weights, trigram)
+        else:
+            statements = []
+        for statement in statements:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for table, _, _, trigram in SPECS:
+        if dialect == "sqlite":
+            for suffix in ("ai", "ad", "au"):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {table}_fts")
+        elif dialect == "postgresql":
+            op.execute(f"DROP INDEX IF EXISTS ix_{table}_fts")
+            for col in trigram:
+                op.execute(f"DROP INDEX IF EXISTS ix_{table}_{col}_trgm")
@@ -0,0 +1,75 @@
+"""bm25 corpus stats
+
+Revision ID: 3a7f19c0d5e8
+Revises: b81d4e6f2c93
+Create Date: 2026-10-18 13:41:09.220871
+"""
+import re
+from collections import Counter
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '3a7f19c0d5e8'
+down_revision = 'b81d4e6f2c93'
+branch_labels = None
+depends_on = None
+
+# Cópia congelada de app.services.ai_resume_match.token_counts: a migração
+# não importa o código da aplicação
+_TOKEN_RE = re.compile(r"[a-zA-ZÀ-ÿ0-9\+\.\#]+")
+MAX_TOKEN_LENGTH = 128
+
+
+def token_counts(text: str) -> Counter:
+    return Counter(_TOKEN_RE.findall(text.lower()))
+
+
+def upgrade() -> None:
+    op.add_column('candidate_tokens', sa.Column('tf', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('candidates', sa.Column('doc_length', sa.Integer(), nullable=True))
+    op.create_table('term_stats',
+    sa.Column('token', sa.String(length=128), nullable=False),
+    sa.Column('df', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('token')
+    )
+    op.create_table('corpus_stats',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('doc_count', sa.Integer(), nullable=False),
+    sa.Column('total_length', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+    # Backfill: tf e doc_length por candidato, depois df/corpus agregados uma única vez
+    conn = op.get_bind()
+    candidates = sa.table('candidates', sa.column('id'), sa.column('resume_text'), sa.column('doc_length'))
+    postings = sa.table('candidate_tokens', sa.column('token'), sa.column('candidate_id'), sa.column('tf'))
+    for cand_id, resume_text in conn.execute(sa.select(candidates.c.id, candidates.c.resume_text)).all():
+        counts = {t: n for t, n in token_counts(resume_text or "").items() if len(t) <= MAX_TOKEN_LENGTH}
+        for token, tf in counts.items():
+            if tf > 1:
+                conn.execute(
+                    postings.update()
+                    .where(postings.c.candidate_id == cand_id, postings.c.token == token)
+                    .values(tf=tf)
+                )
+        conn.execute(candidates.update().where(candidates.c.id == cand_id).values(doc_length=sum(counts.values())))
+
+    op.execute(
+        "INSERT INTO term_stats (token, df) "
+        "SELECT token, COUNT(*) FROM candidate_tokens GROUP BY token"
+    )
+    op.execute(
+        "INSERT INTO corpus_stats (id, doc_count, total_length) "
+        "SELECT 1, COUNT(*), COALESCE(SUM(doc_length), 0) FROM candidates"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('corpus_stats')
+    op.drop_table('term_stats')
+    with op.batch_alter_table('candidates') as batch_op:
+        batch_op.drop_column('doc_length')
+    with op.batch_alter_table('candidate_tokens') as batch_op:
+        batch_op.drop_column('tf')
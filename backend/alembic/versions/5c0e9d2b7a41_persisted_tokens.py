@@ -0,0 +1,79 @@
+"""persisted tokens
+
+Revision ID: 5c0e9d2b7a41
+Revises: f37a396421b2
+Create Date: 2026-10-18 10:02:17.584113
+"""
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '5c0e9d2b7a41'
+down_revision = 'f37a396421b2'
+branch_labels = None
+depends_on = None
+
+# Cópia congelada do tokenizador e da serialização de app.services
+# (ai_resume_match / token_store) na versão 1: a migração não importa o
+# código da aplicação
+TOKENIZER_VERSION = 1
+BATCH_SIZE = 1000
+_TOKEN_RE = re.compile(r"[a-zA-ZÀ-ÿ0-9\+\.\#]+")
+
+
+def _serialize(text: str) -> str:
+    return " ".join(sorted(set(_TOKEN_RE.findall(text.lower()))))
+
+
+def _backfill(conn, table, text_columns, to_text) -> None:
+    """Grava tokens/tokens_version em lotes de BATCH_SIZE, percorrendo por id"""
+    last_id = ""
+    while True:
+        rows = conn.execute(
+            sa.select(table.c.id, *(table.c[c] for c in text_columns))
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        conn.execute(
+            table.update().where(table.c.id == sa.bindparam('_id')).values(
+                tokens=sa.bindparam('_tokens'), tokens_version=TOKENIZER_VERSION,
+            ),
+            [{"_id": row[0], "_tokens": _serialize(to_text(*row[1:]))} for row in rows],
+        )
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    op.add_column('jobs', sa.Column('tokens', sa.Text(), nullable=True))
+    op.add_column('jobs', sa.Column('tokens_version', sa.Integer(), nullable=True))
+    op.add_column('candidates', sa.Column('tokens', sa.Text(), nullable=True))
+    op.add_column('candidates', sa.Column('tokens_version', sa.Integer(), nullable=True))
+
+    # Backfill: as leituras só desserializam, sem retokenizar linhas antigas
+    conn = op.get_bind()
+    jobs = sa.table(
+        'jobs', sa.column('id'), sa.column('title'), sa.column('short_description'),
+        sa.column('full_description'), sa.column('tokens'), sa.column('tokens_version'),
+    )
+    candidates = sa.table(
+        'candidates', sa.column('id'), sa.column('resume_text'), sa.column('tokens'), sa.column('tokens_version'),
+    )
+    _backfill(
+        conn, jobs, ('title', 'short_description', 'full_description'),
+        lambda title, short, full: f"{title}\n{short}\n{full or ''}",
+    )
+    _backfill(conn, candidates, ('resume_text',), lambda resume_text: resume_text or "")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('candidates') as batch_op:
+        batch_op.drop_column('tokens_version')
+        batch_op.drop_column('tokens')
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.drop_column('tokens_version')
+        batch_op.drop_column('tokens')
@@ -0,0 +1,30 @@
+"""token vocabulary
+
+Revision ID: 6d2b8f04a1c7
+Revises: 9e4c2a71b6d0
+Create Date: 2026-10-18 16:02:11.384512
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+
+revision = '6d2b8f04a1c7'
+down_revision = '9e4c2a71b6d0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('vocabulary',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('token', sa.String(length=128), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('token')
+    )
+    # Todo token do índice invertido ganha id (index_candidate mantém daqui em diante)
+    op.execute("INSERT INTO vocabulary (token) SELECT DISTINCT token FROM candidate_tokens ORDER BY token")
+
+
+def downgrade() -> None:
+    op.drop_table('vocabulary')
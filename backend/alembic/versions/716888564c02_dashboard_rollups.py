@@ -0,0 +1,83 @@
+"""dashboard rollups
+
+Revision ID: 716888564c02
+Revises: 923da5fe2439
+Create Date: 2026-10-18 15:36:47.816692
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+
+revision = '716888564c02'
+down_revision = '923da5fe2439'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('daily_application_stats',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('applications', sa.Integer(), nullable=False),
+    sa.Column('score_sum', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+    op.create_table('daily_job_applications',
+    sa.Column('job_id', sa.String(length=36), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('applications', sa.Integer(), nullable=False),
+    sa.Column('score_sum', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('job_id', 'day')
+    )
+    op.create_index('ix_daily_job_applications_day', 'daily_job_applications', ['day'], unique=False)
+    op.create_table('daily_status_transitions',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('transitions', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'status')
+    )
+    op.create_table('rollup_state',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('watermark', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.create_table('application_status_history',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('application_id', sa.String(length=36), nullable=False),
+    sa.Column('job_id', sa.String(length=36), nullable=False),
+    sa.Column('from_status', sa.String(length=20), nullable=True),
+    sa.Column('to_status', sa.String(length=20), nullable=False),
+    sa.Column('changed_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['application_id'], ['applications.id'], ),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_application_status_history_application_id'), 'application_status_history', ['application_id'], unique=False)
+    op.create_index('ix_application_status_history_changed_at', 'application_status_history', ['changed_at'], unique=False)
+    op.create_index('ix_chat_messages_created_at', 'chat_messages', ['created_at'], unique=False)
+    op.create_index('ix_applications_updated_at_created_at', 'applications', ['updated_at', 'created_at'], unique=False)
+
+    # Histórico das candidaturas existentes: a criação e, se o status já
+    # mudou, uma transição aplicado -> status atual em updated_at
+    status = "lower(CAST(status AS VARCHAR(20)))"
+    op.execute(
+        "INSERT INTO application_status_history (application_id, job_id, from_status, to_status, changed_at) "
+        "SELECT id, job_id, NULL, 'aplicado', created_at FROM applications"
+    )
+    op.execute(
+        "INSERT INTO application_status_history (application_id, job_id, from_status, to_status, changed_at) "
+        f"SELECT id, job_id, 'aplicado', {status}, updated_at FROM applications WHERE {status} <> 'aplicado'"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applications_updated_at_created_at', table_name='applications')
+    op.drop_index('ix_chat_messages_created_at', table_name='chat_messages')
+    op.drop_index('ix_application_status_history_changed_at', table_name='application_status_history')
+    op.drop_index(op.f('ix_application_status_history_application_id'), table_name='application_status_history')
+    op.drop_table('application_status_history')
+    op.drop_table('rollup_state')
+    op.drop_table('daily_status_transitions')
+    op.drop_index('ix_daily_job_applications_day', table_name='daily_job_applications')
+    op.drop_table('daily_job_applications')
+    op.drop_table('daily_application_stats')
@@ -0,0 +1,31 @@
+"""job application counts
+
+Revision ID: 888104885997
+Revises: 01a4ea400385
+Create Date: 2026-10-18 16:12:40.518203
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+
+revision = '888104885997'
+down_revision = '01a4ea400385'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('job_application_counts',
+    sa.Column('job_id', sa.String(length=36), nullable=False),
+    sa.Column('applications', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('job_id')
+    )
+    op.execute(
+        "INSERT INTO job_application_counts (job_id, applications) "
+        "SELECT job_id, COUNT(*) FROM applications GROUP BY job_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('job_application_counts')
@@ -0,0 +1,29 @@
+"""metric counters
+
+Revision ID: 923da5fe2439
+Revises: e4528abc9644
+Create Date: 2026-10-18 15:28:38.591091
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+
+revision = '923da5fe2439'
+down_revision = 'e4528abc9644'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('metric_counters',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('value', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.create_index('ix_applications_status_match_score', 'applications', ['status', 'match_score'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applications_status_match_score', table_name='applications')
+    op.drop_table('metric_counters')
@@ -0,0 +1,42 @@
+"""scoring queue
+
+Revision ID: 9e4c2a71b6d0
+Revises: 3a7f19c0d5e8
+Create Date: 2026-10-18 15:08:52.671930
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+
+revision = '9e4c2a71b6d0'
+down_revision = '3a7f19c0d5e8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('applications', sa.Column('score_status', sa.String(length=20), server_default='done', nullable=False))
+    op.create_table('scoring_tasks',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('application_id', sa.String(length=36), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('claimed_by', sa.String(length=36), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('enqueued_at', sa.DateTime(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['application_id'], ['applications.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_scoring_tasks_application_id'), 'scoring_tasks', ['application_id'], unique=False)
+    op.create_index('ix_scoring_tasks_status_enqueued_at', 'scoring_tasks', ['status', 'enqueued_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_scoring_tasks_status_enqueued_at', table_name='scoring_tasks')
+    op.drop_index(op.f('ix_scoring_tasks_application_id'), table_name='scoring_tasks')
+    op.drop_table('scoring_tasks')
+    with op.batch_alter_table('applications') as batch_op:
+        batch_op.drop_column('score_status')
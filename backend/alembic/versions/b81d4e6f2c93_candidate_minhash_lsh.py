@@ -0,0 +1,81 @@
+"""candidate minhash lsh
+
+Revision ID: b81d4e6f2c93
+Revises: 5c0e9d2b7a41
+Create Date: 2026-10-18 11:20:38.902647
+"""
+import hashlib
+import re
+import zlib
+
+from alembic import op
+import numpy as np
+import sqlalchemy as sa
+
+
+revision = 'b81d4e6f2c93'
+down_revision = '5c0e9d2b7a41'
+branch_labels = None
+depends_on = None
+
+# Cópia congelada do tokenizador (app.services.ai_resume_match) e da
+# assinatura MinHash (app.services.minhash) da época desta revisão: a
+# migração não importa o código da aplicação. Os buckets gravados aqui são
+# os mesmos que a aplicação calcula enquanto esses parâmetros não mudarem.
+_TOKEN_RE = re.compile(r"[a-zA-ZÀ-ÿ0-9\+\.\#]+")
+MAX_TOKEN_LENGTH = 128
+NUM_PERM = 128
+LSH_BANDS = 64
+_PRIME = np.uint64((1 << 31) - 1)
+_rng = np.random.default_rng(20260210)
+_A = _rng.integers(1, (1 << 31) - 1, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, (1 << 31) - 1, size=NUM_PERM, dtype=np.uint64)
+
+
+def _tokenize(text: str) -> set[str]:
+    return {t for t in _TOKEN_RE.findall(text.lower()) if len(t) <= MAX_TOKEN_LENGTH}
+
+
+def _signature(tokens: set[str]) -> np.ndarray:
+    if not tokens:
+        return np.full(NUM_PERM, _PRIME, dtype=np.uint32)
+    x = np.fromiter((zlib.crc32(t.encode()) for t in tokens), dtype=np.uint64, count=len(tokens))
+    return ((_A[:, None] * x[None, :] + _B[:, None]) % _PRIME).min(axis=1).astype(np.uint32)
+
+
+def _band_buckets(sig: np.ndarray) -> list[str]:
+    return [
+        hashlib.blake2b(band.tobytes(), digest_size=8).hexdigest()
+        for band in sig.reshape(LSH_BANDS, NUM_PERM // LSH_BANDS)
+    ]
+
+
+def upgrade() -> None:
+    op.add_column('candidates', sa.Column('minhash', sa.LargeBinary(), nullable=True))
+    op.create_table('candidate_lsh_buckets',
+    sa.Column('band', sa.Integer(), nullable=False),
+    sa.Column('bucket', sa.String(length=16), nullable=False),
+    sa.Column('candidate_id', sa.String(length=36), nullable=False),
+    sa.ForeignKeyConstraint(['candidate_id'], ['candidates.id'], ),
+    sa.PrimaryKeyConstraint('band', 'bucket', 'candidate_id')
+    )
+    op.create_index(op.f('ix_candidate_lsh_buckets_candidate_id'), 'candidate_lsh_buckets', ['candidate_id'], unique=False)
+
+    # Backfill das assinaturas para os candidatos já existentes
+    conn = op.get_bind()
+    candidates = sa.table('candidates', sa.column('id'), sa.column('resume_text'), sa.column('minhash'))
+    buckets = sa.table('candidate_lsh_buckets', sa.column('band'), sa.column('bucket'), sa.column('candidate_id'))
+    for cand_id, resume_text in conn.execute(sa.select(candidates.c.id, candidates.c.resume_text)).all():
+        sig = _signature(_tokenize(resume_text or ""))
+        conn.execute(buckets.insert(), [
+            {"band": band, "bucket": bucket, "candidate_id": cand_id}
+            for band, bucket in enumerate(_band_buckets(sig))
+        ])
+        conn.execute(candidates.update().where(candidates.c.id == cand_id).values(minhash=sig.tobytes()))
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_candidate_lsh_buckets_candidate_id'), table_name='candidate_lsh_buckets')
+    op.drop_table('candidate_lsh_buckets')
+    with op.batch_alter_table('candidates') as batch_op:
+        batch_op.drop_column('minhash')
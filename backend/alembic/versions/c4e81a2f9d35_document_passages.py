@@ -0,0 +1,69 @@
+"""document passages
+
+Revision ID: c4e81a2f9d35
+Revises: 6d2b8f04a1c7
+Create Date: 2026-10-18 16:41:05.902731
+"""
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'c4e81a2f9d35'
+down_revision = '6d2b8f04a1c7'
+branch_labels = None
+depends_on = None
+
+# Cópia congelada de app.services.passages.chunk_text: a migração não
+# importa o código da aplicação
+MAX_PASSAGE_WORDS = 120
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+_SENTENCE_RE = re.compile(r"(?<=[.!?;:])\s+")
+
+
+def chunk_text(text: str, max_words: int = MAX_PASSAGE_WORDS) -> list[str]:
+    passages = []
+    for paragraph in _PARAGRAPH_RE.split(text or ""):
+        current: list[str] = []
+        for sentence in _SENTENCE_RE.split(paragraph.strip()):
+            words = sentence.split()
+            while len(words) > max_words:
+                if current:
+                    passages.append(" ".join(current))
+                    current = []
+                passages.append(" ".join(words[:max_words]))
+                words = words[max_words:]
+            if current and len(current) + len(words) > max_words:
+                passages.append(" ".join(current))
+                current = []
+            current.extend(words)
+        if current:
+            passages.append(" ".join(current))
+    return passages
+
+
+def upgrade() -> None:
+    op.create_table('document_passages',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('document_id', sa.String(length=36), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.ForeignKeyConstraint(['document_id'], ['documents.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_document_passages_document_id'), 'document_passages', ['document_id'], unique=False)
+
+    # Backfill dos trechos dos documentos já existentes
+    conn = op.get_bind()
+    documents = sa.table('documents', sa.column('id'), sa.column('content'))
+    passages = sa.table('document_passages', sa.column('document_id'), sa.column('position'), sa.column('content'))
+    for doc_id, content in conn.execute(sa.select(documents.c.id, documents.c.content)).all():
+        rows = [{"document_id": doc_id, "position": i, "content": text} for i, text in enumerate(chunk_text(content))]
+        if rows:
+            conn.execute(passages.insert(), rows)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_document_passages_document_id'), table_name='document_passages')
+    op.drop_table('document_passages')
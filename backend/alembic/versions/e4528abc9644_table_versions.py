@@ -0,0 +1,28 @@
+"""table versions
+
+Revision ID: e4528abc9644
+Revises: 0b6f3d9a2c71
+Create Date: 2026-10-18 15:24:19.770360
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+
+revision = 'e4528abc9644'
+down_revision = '0b6f3d9a2c71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('table_versions',
+    sa.Column('table_name', sa.String(length=64), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('table_name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('table_versions')
@@ -0,0 +1,47 @@
+"""hot query indexes
+
+Revision ID: e7a3c5910b4f
+Revises: c4e81a2f9d35
+Create Date: 2026-10-18 17:20:44.118302
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+
+revision = 'e7a3c5910b4f'
+down_revision = 'c4e81a2f9d35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False)
+    op.create_index('ix_jobs_created_at_id', 'jobs', ['created_at', 'id'], unique=False)
+    op.create_index('ix_candidates_created_at_id', 'candidates', ['created_at', 'id'], unique=False)
+    op.create_index('ix_applications_created_at_id', 'applications', ['created_at', 'id'], unique=False)
+    op.create_index('ix_applications_status_created_at_id', 'applications', ['status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_applications_job_id_match_score_id', 'applications', ['job_id', 'match_score', 'id'], unique=False)
+    op.create_index('ix_applications_candidate_id', 'applications', ['candidate_id'], unique=False)
+    op.create_index('ix_interviews_created_at_id', 'interviews', ['created_at', 'id'], unique=False)
+    op.create_index('ix_interviews_application_id_created_at_id', 'interviews', ['application_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_interview_notes_created_at_id', 'interview_notes', ['created_at', 'id'], unique=False)
+    op.create_index('ix_interview_notes_application_id_created_at_id', 'interview_notes', ['application_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_notifications_user_id_created_at_id', 'notifications', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_documents_created_at_id', 'documents', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_documents_created_at_id', table_name='documents')
+    op.drop_index('ix_notifications_user_id_created_at_id', table_name='notifications')
+    op.drop_index('ix_interview_notes_application_id_created_at_id', table_name='interview_notes')
+    op.drop_index('ix_interview_notes_created_at_id', table_name='interview_notes')
+    op.drop_index('ix_interviews_application_id_created_at_id', table_name='interviews')
+    op.drop_index('ix_interviews_created_at_id', table_name='interviews')
+    op.drop_index('ix_applications_candidate_id', table_name='applications')
+    op.drop_index('ix_applications_job_id_match_score_id', table_name='applications')
+    op.drop_index('ix_applications_status_created_at_id', table_name='applications')
+    op.drop_index('ix_applications_created_at_id', table_name='applications')
+    op.drop_index('ix_candidates_created_at_id', table_name='candidates')
+    op.drop_index('ix_jobs_created_at_id', table_name='jobs')
+    op.drop_index('ix_users_created_at_id', table_name='users')
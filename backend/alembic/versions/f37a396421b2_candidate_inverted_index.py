@@ -0,0 +1,53 @@
+"""candidate inverted index
+
+Revision ID: f37a396421b2
+Revises: f21185881a94
+Create Date: 2026-10-18 09:12:44.310522
+"""
+import re
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = 'f37a396421b2'
+down_revision = 'f21185881a94'
+branch_labels = None
+depends_on = None
+
+# Cópia congelada do tokenizador de app.services.ai_resume_match: a migração
+# não depende do código da aplicação (alembic heads/history rodam sem ele)
+_TOKEN_RE = re.compile(r"[a-zA-ZÀ-ÿ0-9\+\.\#]+")
+MAX_TOKEN_LENGTH = 128
+
+
+def _tokenize(text: str) -> set[str]:
+    return set(_TOKEN_RE.findall(text.lower()))
+
+
+def upgrade() -> None:
+    op.add_column('candidates', sa.Column('token_count', sa.Integer(), server_default='0', nullable=False))
+    op.create_table('candidate_tokens',
+    sa.Column('token', sa.String(length=128), nullable=False),
+    sa.Column('candidate_id', sa.String(length=36), nullable=False),
+    sa.ForeignKeyConstraint(['candidate_id'], ['candidates.id'], ),
+    sa.PrimaryKeyConstraint('token', 'candidate_id')
+    )
+    op.create_index(op.f('ix_candidate_tokens_candidate_id'), 'candidate_tokens', ['candidate_id'], unique=False)
+
+    # Backfill do índice para os candidatos já existentes
+    conn = op.get_bind()
+    candidates = sa.table('candidates', sa.column('id'), sa.column('resume_text'), sa.column('token_count'))
+    postings = sa.table('candidate_tokens', sa.column('token'), sa.column('candidate_id'))
+    for cand_id, resume_text in conn.execute(sa.select(candidates.c.id, candidates.c.resume_text)).all():
+        tokens = {t for t in _tokenize(resume_text or "") if len(t) <= MAX_TOKEN_LENGTH}
+        if tokens:
+            conn.execute(postings.insert(), [{"token": t, "candidate_id": cand_id} for t in tokens])
+        conn.execute(candidates.update().where(candidates.c.id == cand_id).values(token_count=len(tokens)))
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_candidate_tokens_candidate_id'), table_name='candidate_tokens')
+    op.drop_table('candidate_tokens')
+    with op.batch_alter_table('candidates') as batch_op:
+        batch_op.drop_column('token_count')
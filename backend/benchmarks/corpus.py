@@ -0,0 +1,119 @@
+"""
+Gerador determinístico de base sintética para os benchmarks.
+
+Currículos (português e inglês), vagas e documentos de política de RH.
+Cada item é derivado só de (seed, tipo, índice), então o gerador tem acesso
+aleatório: resume(123_456) não exige gerar os anteriores, e bases de 1M
+itens podem ser percorridas sem ficar inteiras em memória.
+"""
+import random
+from dataclasses import dataclass
+
+SCALES = {
+    "1k": 1_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+
+SKILLS = (
+    "python fastapi django flask postgresql mysql sqlite redis docker kubernetes aws gcp azure "
+    "linux git pytest java spring kotlin scala go rust c++ c# .net react vue angular typescript "
+    "javascript node.js html css tailwind graphql rest kafka rabbitmq spark airflow pandas numpy "
+    "terraform ansible jenkins scrum kanban excel powerbi sap salesforce figma"
+).split()
+
+ROLES = {
+    "pt": ["Desenvolvedor Backend", "Engenheira de Dados", "Analista de RH", "Desenvolvedora Frontend",
+           "Cientista de Dados", "Analista de Suporte", "Engenheiro DevOps", "Product Manager"],
+    "en": ["Backend Developer", "Data Engineer", "HR Analyst", "Frontend Developer",
+           "Data Scientist", "Support Analyst", "DevOps Engineer", "Product Manager"],
+}
+
+PHRASES = {
+    "pt": [
+        "experiência de {n} anos com {a} e {b}",
+        "atuei em projetos de {a} para clientes do varejo",
+        "liderei a migração de {a} para {b}",
+        "conhecimento avançado em {a}, {b} e boas práticas de testes",
+        "formação em ciência da computação e certificação em {a}",
+        "inglês intermediário e espanhol básico",
+        "participei de times ágeis com {a} em ambiente de nuvem",
+    ],
+    "en": [
+        "{n} years of experience with {a} and {b}",
+        "worked on {a} projects for retail customers",
+        "led the migration from {a} to {b}",
+        "advanced knowledge of {a}, {b} and testing best practices",
+        "computer science degree and {a} certification",
+        "fluent english and basic portuguese",
+        "member of agile teams using {a} in the cloud",
+    ],
+}
+
+POLICY_TOPICS = [
+    ("Férias", "férias podem ser divididas em até três períodos, um deles com no mínimo 14 dias"),
+    ("Home office", "o trabalho remoto é permitido até três dias por semana com acordo do gestor"),
+    ("Reembolso", "despesas de viagem são reembolsadas em até 30 dias mediante nota fiscal"),
+    ("Benefícios", "vale refeição, plano de saúde e auxílio creche são oferecidos após o período de experiência"),
+    ("Ponto", "o registro de ponto é obrigatório e horas extras precisam de aprovação prévia"),
+    ("Desligamento", "o aviso prévio segue a CLT e a entrevista de desligamento é feita pelo RH"),
+    ("Treinamentos", "cada colaborador tem orçamento anual para cursos e certificações"),
+    ("Code of conduct", "harassment and discrimination are not tolerated and must be reported to HR"),
+]
+
+QUESTIONS = [
+    "Quantos dias de férias posso dividir?",
+    "Posso trabalhar em home office?",
+    "Qual o prazo de reembolso de viagem?",
+    "Quando começa o plano de saúde?",
+    "Preciso de aprovação para hora extra?",
+    "How do I report harassment?",
+    "Qual o orçamento para cursos?",
+    "Como funciona o aviso prévio?",
+]
+
+
+@dataclass(frozen=True)
+class Corpus:
+    size: int
+    seed: int = 42
+
+    @property
+    def jobs(self) -> int:
+        return max(50, self.size // 100)
+
+    @property
+    def documents(self) -> int:
+        return max(50, self.size // 100)
+
+    def _rng(self, kind: int, i: int) -> random.Random:
+        return random.Random((self.seed * 1_000_003 + kind) * 10_000_019 + i)
+
+    def resume(self, i: int) -> str:
+        rng = self._rng(1, i)
+        lang = "pt" if rng.random() < 0.7 else "en"
+        lines = [rng.choice(ROLES[lang])]
+        for _ in range(rng.randint(4, 10)):
+            a, b = rng.sample(SKILLS, 2)
+            lines.append(rng.choice(PHRASES[lang]).format(n=rng.randint(1, 12), a=a, b=b))
+        lines.append(", ".join(rng.sample(SKILLS, rng.randint(3, 8))))
+        return "\n".join(lines)
+
+    def job(self, i: int) -> tuple[str, str]:
+        """(title, short_description)"""
+        rng = self._rng(2, i)
+        lang = "pt" if rng.random() < 0.7 else "en"
+        skills = ", ".join(rng.sample(SKILLS, rng.randint(4, 8)))
+        if lang == "pt":
+            return rng.choice(ROLES[lang]), f"Buscamos profissional com {skills}"
+        return rng.choice(ROLES[lang]), f"We are looking for someone with {skills}"
+
+    def document(self, i: int) -> tuple[str, str]:
+        """(title, content) de uma política de RH"""
+        rng = self._rng(3, i)
+        topic, rule = POLICY_TOPICS[i % len(POLICY_TOPICS)]
+        filler = [rng.choice(POLICY_TOPICS)[1] for _ in range(rng.randint(2, 6))]
+        return f"Política de {topic} v{i}", ". ".join([rule] + filler) + "."
+
+    def question(self, i: int) -> str:
+        return QUESTIONS[self._rng(4, i).randrange(len(QUESTIONS))]
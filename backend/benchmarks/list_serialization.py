@@ -0,0 +1,135 @@
+"""
+Custo de montar uma listagem de 10k linhas: caminho antigo (entidades ORM
+completas -> response_model Pydantic -> jsonable_encoder -> json) contra a
+projeção no SQL + orjson de app.core.projection, com e sem ?fields=.
+
+Mede também a listagem HTTP percorrendo as 10k linhas em páginas de
+MAX_LIMIT via cursor.
+
+Uso (a partir de backend/):
+    python benchmarks/list_serialization.py --rows 10000
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.core.pagination import MAX_LIMIT
+from app.core.projection import FieldsParams, select_fields
+from app.db.models import Base, Candidate, Job
+from app.schemas.candidates import CandidateOut
+from app.schemas.jobs import JobOut
+from app.services.ai_job_description import generate_full_job_description
+from corpus import Corpus
+
+import orjson
+
+
+def _populate(db, corpus: Corpus, rows: int) -> None:
+    jobs = []
+    for i in range(rows):
+        title, short = corpus.job(i)
+        jobs.append({
+            "id": f"job-{i:06d}", "title": title, "short_description": short,
+            "full_description": generate_full_job_description(title, short),
+        })
+    db.execute(insert(Job), jobs)
+    db.execute(insert(Candidate), [
+        {"id": f"cand-{i:06d}", "name": f"Candidato {i}", "email": f"c{i}@bench.dev", "resume_text": corpus.resume(i)}
+        for i in range(rows)
+    ])
+    db.commit()
+
+
+def _old_path(db, model, schema) -> bytes:
+    rows = db.query(model).all()
+    return json.dumps(jsonable_encoder(TypeAdapter(list[schema]).validate_python(rows))).encode()
+
+
+def _new_path(db, model, schema, fields=None) -> bytes:
+    rows = [row._asdict() for row in select_fields(db, model, schema, FieldsParams(fields)).all()]
+    return orjson.dumps(rows)
+
+
+def _time(fn, repeat: int) -> tuple[float, int]:
+    best, size = float("inf"), 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        size = len(fn())
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000, size
+
+
+def _walk(client, url, params) -> int:
+    size, cursor = 0, None
+    while True:
+        r = client.get(url, params={**params, "limit": MAX_LIMIT, **({"cursor": cursor} if cursor else {})})
+        r.raise_for_status()
+        size += len(r.content)
+        cursor = r.headers.get("X-Next-Cursor")
+        if not cursor:
+            return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.db.session import get_db
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        with Session() as db:
+            _populate(db, Corpus(args.rows, args.seed), args.rows)
+
+        def _get_db():
+            session = Session()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        app.dependency_overrides[get_db] = _get_db
+        client = TestClient(app)
+        print(f"{args.rows} linhas, melhor de {args.repeat}")
+        print(f"{'caso':<58}{'ms':>10}{'KiB':>10}")
+        try:
+            with Session() as db:
+                cases = [
+                    ("jobs: ORM + Pydantic + json (antes)", lambda: _old_path(db, Job, JobOut)),
+                    ("jobs: projeção + orjson", lambda: _new_path(db, Job, JobOut)),
+                    ("jobs: projeção fields=id,title + orjson", lambda: _new_path(db, Job, JobOut, "id,title")),
+                    ("candidates: ORM + Pydantic + json (antes)", lambda: _old_path(db, Candidate, CandidateOut)),
+                    ("candidates: projeção + orjson", lambda: _new_path(db, Candidate, CandidateOut)),
+                    ("HTTP GET /api/jobs/ (todas as páginas)", lambda: b" " * _walk(client, "/api/jobs/", {})),
+                    ("HTTP GET /api/jobs/?fields=id,title (todas as páginas)",
+                     lambda: b" " * _walk(client, "/api/jobs/", {"fields": "id,title"})),
+                    ("HTTP GET /api/candidates/ (todas as páginas)", lambda: b" " * _walk(client, "/api/candidates/", {})),
+                ]
+                for name, fn in cases:
+                    ms, size = _time(fn, args.repeat)
+                    print(f"{name:<58}{ms:>10.1f}{size / 1024:>10.0f}")
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Relatório de recall/latência do modo aproximado (MinHash/LSH) contra o exato.
+
+Gera uma base sintética determinística num SQLite temporário, indexa os
+candidatos e compara, para cada vaga, o top-k do índice invertido (exato)
+com o top-k do LSH com e sem rerank.
+
+Uso (a partir de backend/):
+    python benchmarks/lsh_recall.py --candidates 20000 --jobs 30 --k 10
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Base, Candidate
+from app.services.ai_resume_match import _tokenize
+from app.services.candidate_index import index_candidate, top_candidates
+from app.services.minhash import approx_top_candidates
+
+SKILLS = (
+    "python fastapi django flask postgresql mysql sqlite redis docker kubernetes aws gcp azure "
+    "linux git pytest java spring kotlin scala go rust c++ c# .net react vue angular typescript "
+    "javascript node.js html css tailwind graphql rest kafka rabbitmq spark airflow pandas numpy "
+    "terraform ansible jenkins ci cd scrum kanban inglês espanhol liderança comunicação"
+).split()
+FILLER = "experiência anos projetos equipe desenvolvimento sistemas empresa atuação com de e em para".split()
+# Vocabulário longo (ferramentas, empresas, domínios) para a base não ficar
+# artificialmente densa: currículos reais compartilham poucos termos raros
+VOCAB = SKILLS + [f"termo{i}" for i in range(3000)]
+
+
+def _profiles(rng: random.Random, n: int) -> list[list[str]]:
+    """Perfis de vaga; currículos e vagas são variações ruidosas de um perfil"""
+    return [rng.sample(SKILLS, 6) + rng.sample(VOCAB, 24) for _ in range(n)]
+
+
+def _resume(rng: random.Random, profiles: list[list[str]]) -> str:
+    profile = rng.choice(profiles)
+    kept = [t for t in profile if rng.random() < 0.6]
+    return ", ".join(kept + rng.sample(VOCAB, rng.randint(5, 20)) + rng.sample(FILLER, 4))
+
+
+def _job(rng: random.Random, profiles: list[list[str]]) -> set[str]:
+    profile = rng.choice(profiles)
+    return _tokenize(" ".join([t for t in profile if rng.random() < 0.8] + rng.sample(FILLER, 4)))
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run(candidates: int, jobs: int, k: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    profiles = _profiles(rng, max(10, candidates // 50))
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/lsh.db")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine, autoflush=False)()
+
+        for i in range(candidates):
+            cand = Candidate(name=f"Candidato {i}", email=f"c{i}@bench.dev", resume_text=_resume(rng, profiles))
+            db.add(cand)
+            index_candidate(db, cand)
+            if i % 1000 == 999:
+                db.commit()
+        db.commit()
+
+        modes = {"exact": [], "approx": [], "approx_rerank": []}
+        recall = {"approx": [], "approx_rerank": []}
+        for _ in range(jobs):
+            job = _job(rng, profiles)
+
+            t0 = time.perf_counter()
+            exact = top_candidates(db, job, k)
+            modes["exact"].append(time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            approx = approx_top_candidates(db, job, k, rerank=False)
+            modes["approx"].append(time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            reranked = approx_top_candidates(db, job, k, rerank=True)
+            modes["approx_rerank"].append(time.perf_counter() - t0)
+
+            truth = {r["candidate_id"] for r in exact}
+            if truth:
+                recall["approx"].append(len(truth & {r["candidate_id"] for r in approx}) / len(truth))
+                recall["approx_rerank"].append(len(truth & {r["candidate_id"] for r in reranked}) / len(truth))
+
+        db.close()
+        engine.dispose()
+
+    return {
+        "candidates": candidates,
+        "jobs": jobs,
+        "k": k,
+        "latency_ms": {
+            mode: {"p50": _percentile(v, 50) * 1000, "p99": _percentile(v, 99) * 1000}
+            for mode, v in modes.items()
+        },
+        "recall_at_k": {mode: statistics.mean(v) if v else None for mode, v in recall.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--candidates", type=int, default=5000)
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="Salva o relatório neste arquivo")
+    args = parser.parse_args()
+
+    report = run(args.candidates, args.jobs, args.k, args.seed)
+
+    print(f"{report['candidates']} candidatos, {report['jobs']} vagas, k={report['k']}")
+    print(f"{'modo':<15}{'p50 (ms)':>10}{'p99 (ms)':>10}{'recall@k':>10}")
+    for mode, lat in report["latency_ms"].items():
+        rec = report["recall_at_k"].get(mode)
+        rec_str = "1.000" if mode == "exact" else f"{rec:.3f}"
+        print(f"{mode:<15}{lat['p50']:>10.2f}{lat['p99']:>10.2f}{rec_str:>10}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Vazão do SQLite com leitores e escritores concorrentes: perfil "default"
+(journal DELETE, só check_same_thread) contra SQLITE_PROFILE=production
+(WAL, busy_timeout, synchronous=NORMAL, mmap, cache) de app.db.session.
+
+Vários processos (como workers uvicorn), cada um com o próprio engine e
+algumas threads; cada thread abre uma sessão por operação, como uma
+requisição. Leituras são a listagem de candidaturas (50 mais recentes);
+escritas são a mudança de status com histórico e contadores, mais um
+INSERT no log do chat. Conta operações por segundo e erros "database is
+locked".
+
+Uso (a partir de backend/):
+    python benchmarks/sqlite_concurrency.py --processes 4 --threads 4 --seconds 5 --write-ratio 0.2
+"""
+import argparse
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Application, ApplicationStatus, Base, Candidate, ChatMessage, Job, User
+from app.db.session import create_db_engine
+from app.services.metrics import record_status_change
+from app.services.status_history import record_transitions
+
+STATUSES = [s for s in ApplicationStatus]
+
+
+def _populate(Session, rows: int) -> list[tuple[str, str]]:
+    with Session() as db:
+        db.add(User(id="u1", name="RH", email="rh@bench.dev", password_hash="x"))
+        db.execute(insert(Job), [{"id": f"job-{i}", "title": f"Vaga {i}", "short_description": "Python"} for i in range(20)])
+        db.execute(insert(Candidate), [
+            {"id": f"cand-{i}", "name": f"C{i}", "email": f"c{i}@bench.dev", "resume_text": "Python FastAPI"}
+            for i in range(rows)
+        ])
+        apps = [(f"app-{i}", f"job-{i % 20}") for i in range(rows)]
+        db.execute(insert(Application), [
+            {"id": app_id, "job_id": job_id, "candidate_id": f"cand-{i}", "match_score": random.random() * 100}
+            for i, (app_id, job_id) in enumerate(apps)
+        ])
+        record_transitions(db, [(app_id, job_id, None, ApplicationStatus.APLICADO) for app_id, job_id in apps])
+        db.commit()
+    return apps
+
+
+def _read(db) -> None:
+    db.execute(select(Application.id, Application.status, Application.match_score)
+               .order_by(Application.created_at.desc(), Application.id.desc()).limit(50)).all()
+
+
+def _write(db, rng: random.Random, apps) -> None:
+    app_id, job_id = rng.choice(apps)
+    app = db.get(Application, app_id)
+    new = rng.choice(STATUSES)
+    record_status_change(db, app.status, new)
+    record_transitions(db, [(app_id, job_id, app.status, new)])
+    app.status = new
+    db.add(ChatMessage(user_id="u1", question="Quantos dias de férias?", answer="30 dias"))
+    db.commit()
+
+
+def _drive(path: str, profile: str, threads: int, deadline: float, write_ratio: float, apps, seed: int) -> dict:
+    """Um processo (como um worker uvicorn): engine próprio e `threads` threads até o deadline"""
+    engine = create_db_engine(f"sqlite:///{path}", profile)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    counts = {"reads": 0, "writes": 0, "locked": 0}
+    lock = threading.Lock()
+
+    def worker(worker_seed: int) -> None:
+        rng = random.Random(worker_seed)
+        local = {"reads": 0, "writes": 0, "locked": 0}
+        while time.time() < deadline:
+            is_write = rng.random() < write_ratio
+            db = Session()
+            try:
+                _write(db, rng, apps) if is_write else _read(db)
+                local["writes" if is_write else "reads"] += 1
+            except OperationalError as exc:
+                if "locked" not in str(exc):
+                    raise
+                db.rollback()
+                local["locked"] += 1
+            finally:
+                db.close()
+        with lock:
+            for key, value in local.items():
+                counts[key] += value
+
+    pool = [threading.Thread(target=worker, args=(seed * 1000 + i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    engine.dispose()
+    return counts
+
+
+def run(profile: str, processes: int, threads: int, seconds: float, write_ratio: float, rows: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = f"{tmp}/bench.db"
+        engine = create_db_engine(f"sqlite:///{path}", profile)
+        Base.metadata.create_all(bind=engine)
+        apps = _populate(sessionmaker(bind=engine), rows)
+        engine.dispose()
+
+        start = time.time()
+        deadline = start + seconds
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [
+                executor.submit(_drive, path, profile, threads, deadline, write_ratio, apps, seed)
+                for seed in range(processes)
+            ]
+            results = [f.result() for f in futures]
+        elapsed = time.time() - start
+
+    totals = {key: sum(r[key] for r in results) for key in ("reads", "writes", "locked")}
+    return {**totals, "ops_per_s": (totals["reads"] + totals["writes"]) / elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--processes", type=int, default=4, help="Processos (workers da API)")
+    parser.add_argument("--threads", type=int, default=4, help="Threads por processo")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--rows", type=int, default=5_000)
+    args = parser.parse_args()
+
+    print(f"{args.processes} processos x {args.threads} threads, {args.seconds:.0f}s, {args.write_ratio:.0%} escritas, {args.rows} candidaturas")
+    print(f"{'perfil':<14}{'ops/s':>10}{'leituras':>12}{'escritas':>12}{'locked':>10}")
+    for profile in ("default", "production"):
+        r = run(profile, args.processes, args.threads, args.seconds, args.write_ratio, args.rows)
+        print(f"{profile:<14}{r['ops_per_s']:>10.0f}{r['reads']:>12}{r['writes']:>12}{r['locked']:>10}")
+
+
+if __name__ == "__main__":
+    main()
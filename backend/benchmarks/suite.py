@@ -0,0 +1,288 @@
+"""
+Suíte de benchmarks dos serviços de matching e chat.
+
+Mede vazão (ops/s), latência p50/p99 e pico de memória (tracemalloc) de
+cada função de serviço e dos endpoints HTTP de matching/chat via
+TestClient, sobre a base sintética de corpus.py. O resultado vai para um
+JSON; com --compare o relatório mostra a variação contra uma execução
+anterior.
+
+Uso (a partir de backend/):
+    python benchmarks/suite.py --scale 1k --json results/antes.json
+    python benchmarks/suite.py --scale 1k --json results/depois.json --compare results/antes.json
+
+Os endpoints HTTP rodam num SQLite temporário com no máximo
+--http-candidates currículos indexados (indexar 1M currículos pela API
+levaria horas); as funções de serviço percorrem a base inteira.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Base, Candidate, Document, Job, User
+from app.services.ai_chatbot import answer_from_documents
+from app.services.ai_resume_match import compute_match_score, summarize_candidate, job_match_text
+from app.services.batch_scoring import score_pairs
+from app.services.candidate_index import index_candidate
+from app.services.document_index import DocumentIndex
+from app.services.token_store import store_job_tokens
+from corpus import SCALES, Corpus
+
+MEMORY_ITERATIONS = 20
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def bench(fn, make_args, iterations: int, items_per_call: int = 1) -> dict:
+    """
+    Roda fn(*make_args(i)) `iterations` vezes. Os argumentos são montados
+    fora da medição; o pico de memória vem de uma segunda passada curta
+    com tracemalloc ligado (ele distorce a latência).
+    """
+    latencies = []
+    for i in range(iterations):
+        args = make_args(i)
+        t0 = time.perf_counter()
+        fn(*args)
+        latencies.append(time.perf_counter() - t0)
+
+    calls = [make_args(i) for i in range(min(iterations, MEMORY_ITERATIONS))]
+    tracemalloc.start()
+    for args in calls:
+        fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "iterations": iterations,
+        "throughput_per_s": round(iterations * items_per_call / sum(latencies), 1),
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 4),
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 4),
+        "peak_memory_kib": round(peak / 1024, 1),
+    }
+
+
+def _spread(corpus_size: int, i: int) -> int:
+    """Índice i espalhado pela base (passo primo), para não medir só o começo"""
+    return (i * 7919) % corpus_size
+
+
+def service_benchmarks(corpus: Corpus, iterations: int) -> dict:
+    jobs = [job_match_text(*corpus.job(i), None) for i in range(corpus.jobs)]
+    documents = [corpus.document(i) for i in range(corpus.documents)]
+    index = DocumentIndex.from_documents(documents)
+    batch = 1000
+
+    def pairs_batch(i):
+        resumes = [corpus.resume(_spread(corpus.size, i * batch + j)) for j in range(batch)]
+        return (jobs, resumes, [j % len(jobs) for j in range(batch)], list(range(batch)))
+
+    return {
+        "compute_match_score": bench(
+            compute_match_score,
+            lambda i: (jobs[i % len(jobs)], corpus.resume(_spread(corpus.size, i))),
+            iterations,
+        ),
+        "summarize_candidate": bench(
+            summarize_candidate,
+            lambda i: (corpus.resume(_spread(corpus.size, i)),),
+            iterations,
+        ),
+        "answer_from_documents": bench(
+            answer_from_documents,
+            lambda i: (corpus.question(i), documents),
+            iterations,
+        ),
+        "document_index.search": bench(
+            index.search,
+            lambda i: (corpus.question(i),),
+            iterations,
+        ),
+        "batch_score_pairs": bench(
+            score_pairs,
+            pairs_batch,
+            max(3, iterations // 100),
+            items_per_call=batch,
+        ),
+    }
+
+
+def _populate(db, corpus: Corpus, candidates: int) -> tuple[list[str], list[str], str]:
+    user_id = "bench-user"
+    db.execute(insert(User), [{"id": user_id, "name": "Bench", "email": "bench@bench.dev", "password_hash": "x"}])
+
+    job_ids = []
+    for i in range(min(corpus.jobs, 200)):
+        title, short = corpus.job(i)
+        job = Job(title=title, short_description=short)
+        store_job_tokens(job)
+        db.add(job)
+        db.flush()
+        job_ids.append(job.id)
+
+    cand_ids = []
+    for i in range(candidates):
+        cand = Candidate(name=f"Candidato {i}", email=f"c{i}@bench.dev", resume_text=corpus.resume(_spread(corpus.size, i)))
+        db.add(cand)
+        index_candidate(db, cand)
+        cand_ids.append(cand.id)
+        if i % 1000 == 999:
+            db.commit()
+
+    db.execute(insert(Document), [
+        {"title": title, "content": content}
+        for title, content in (corpus.document(i) for i in range(corpus.documents))
+    ])
+    db.commit()
+    return job_ids, cand_ids, user_id
+
+
+def http_benchmarks(corpus: Corpus, iterations: int, candidates: int) -> dict:
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.db import session as db_session
+    from app.db.session import get_db
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        db = Session()
+        job_ids, cand_ids, user_id = _populate(db, corpus, min(candidates, corpus.size))
+        db.close()
+
+        def _get_db():
+            session = Session()
+            try:
+                yield session
+            finally:
+                session.close()
+
+        original_session = db_session.SessionLocal
+        db_session.SessionLocal = Session
+        app.dependency_overrides[get_db] = _get_db
+        client = TestClient(app)
+
+        def call(method, url, kwargs):
+            r = client.request(method, url, **kwargs)
+            r.raise_for_status()
+
+        try:
+            results = {
+                "GET /api/jobs/{id}/top-candidates": bench(
+                    call,
+                    lambda i: ("GET", f"/api/jobs/{job_ids[i % len(job_ids)]}/top-candidates", {"params": {"k": 10}}),
+                    iterations,
+                ),
+                "GET /api/jobs/{id}/top-candidates?mode=approx": bench(
+                    call,
+                    lambda i: ("GET", f"/api/jobs/{job_ids[i % len(job_ids)]}/top-candidates", {"params": {"k": 10, "mode": "approx"}}),
+                    iterations,
+                ),
+                "POST /api/applications/": bench(
+                    call,
+                    lambda i: ("POST", "/api/applications/", {"json": {
+                        "job_id": job_ids[i % len(job_ids)], "candidate_id": cand_ids[i % len(cand_ids)],
+                    }}),
+                    iterations,
+                ),
+                "POST /api/chat/": bench(
+                    call,
+                    lambda i: ("POST", "/api/chat/", {"json": {"user_id": user_id, "question": corpus.question(i)}}),
+                    iterations,
+                ),
+            }
+        finally:
+            app.dependency_overrides.clear()
+            db_session.SessionLocal = original_session
+            engine.dispose()
+
+    return results
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(scale: str, seed: int, iterations: int, http_candidates: int, skip_http: bool) -> dict:
+    corpus = Corpus(SCALES[scale], seed)
+    results = service_benchmarks(corpus, iterations)
+    if not skip_http:
+        results.update(http_benchmarks(corpus, iterations, http_candidates))
+    return {
+        "meta": {
+            "scale": scale,
+            "corpus_size": corpus.size,
+            "seed": seed,
+            "iterations": iterations,
+            "http_candidates": None if skip_http else min(http_candidates, corpus.size),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+
+
+def _delta(new: float, old: float) -> str:
+    return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+
+def print_report(report: dict, baseline: dict | None = None) -> None:
+    meta = report["meta"]
+    print(f"escala {meta['scale']} ({meta['corpus_size']} currículos), seed {meta['seed']}, commit {meta['git_commit']}")
+    header = f"{'benchmark':<50}{'ops/s':>12}{'p50 (ms)':>11}{'p99 (ms)':>11}{'pico KiB':>11}"
+    if baseline:
+        header += f"{'Δ p50':>10}{'Δ ops/s':>10}"
+    print(header)
+    for name, r in report["results"].items():
+        line = f"{name:<50}{r['throughput_per_s']:>12.1f}{r['p50_ms']:>11.3f}{r['p99_ms']:>11.3f}{r['peak_memory_kib']:>11.1f}"
+        old = (baseline or {}).get("results", {}).get(name)
+        if old:
+            line += f"{_delta(r['p50_ms'], old['p50_ms']):>10}{_delta(r['throughput_per_s'], old['throughput_per_s']):>10}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", choices=list(SCALES), default="1k")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--http-candidates", type=int, default=5000)
+    parser.add_argument("--skip-http", action="store_true", help="Só as funções de serviço")
+    parser.add_argument("--json", help="Salva o relatório neste arquivo")
+    parser.add_argument("--compare", help="JSON de uma execução anterior para comparar")
+    args = parser.parse_args()
+
+    report = run(args.scale, args.seed, args.iterations, args.http_candidates, args.skip_http)
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else None
+    print_report(report, baseline)
+
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
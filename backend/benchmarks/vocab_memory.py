@@ -0,0 +1,136 @@
+"""
+Memória por currículo: set[str] do _tokenize contra ids do vocabulário.
+
+Gera a mesma base sintética do lsh_recall.py num SQLite temporário e mede
+com tracemalloc o custo de manter todos os currículos residentes como
+set[str], como um array NumPy de ids por currículo (Vocabulary.encode) e
+como o CSR único do CandidatePool. O cache token -> id do Vocabulary é
+reportado à parte (custo fixo, não cresce com o número de currículos).
+O ranking do pool é conferido contra top_candidates (índice invertido).
+
+Uso (a partir de backend/):
+    python benchmarks/vocab_memory.py --candidates 20000
+"""
+import argparse
+import gc
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Base, Candidate, CandidateToken
+from app.services.ai_resume_match import _tokenize
+from app.services.candidate_index import top_candidates
+from app.services.vocabulary import CandidatePool, Vocabulary
+from lsh_recall import _job, _profiles, _resume
+
+
+def _measure(build):
+    """(objeto, bytes retidos) de build(), medido com tracemalloc"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return obj, retained
+
+
+def _seed(db, resumes: list[str], sets: list[set[str]], vocab: Vocabulary) -> None:
+    """Candidatos e postings em bloco (o mesmo estado que index_candidate deixa)"""
+    ids = [f"c{i:07d}" for i in range(len(resumes))]
+    db.execute(insert(Candidate), [
+        {"id": cid, "name": cid, "email": f"{cid}@bench.dev", "resume_text": text, "token_count": len(tokens)}
+        for cid, text, tokens in zip(ids, resumes, sets)
+    ])
+    db.execute(insert(CandidateToken), [
+        {"token": t, "candidate_id": cid, "tf": 1} for cid, tokens in zip(ids, sets) for t in tokens
+    ])
+    vocab.resolve(db, set().union(*sets))
+    db.commit()
+
+
+def run(candidates: int, jobs: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    profiles = _profiles(rng, max(10, candidates // 50))
+    resumes = [_resume(rng, profiles) for _ in range(candidates)]
+    job_sets = [_job(rng, profiles) for _ in range(jobs)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/vocab.db")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(bind=engine, autoflush=False)()
+
+        sets, sets_bytes = _measure(lambda: [_tokenize(text) for text in resumes])
+        token_count = sum(len(s) for s in sets)
+        vocab = Vocabulary()
+        _seed(db, resumes, sets, vocab)
+
+        vocab.clear()
+        _, vocab_bytes = _measure(lambda: vocab.lookup(db, set().union(*sets)))
+        _, arrays_bytes = _measure(lambda: [vocab.encode(db, s) for s in sets])
+
+        pool = CandidatePool(vocab)
+        pool.refresh(db)
+        latencies = []
+        for job in job_sets:
+            t0 = time.perf_counter()
+            ranked = pool.top_k(db, job, 10)
+            latencies.append(time.perf_counter() - t0)
+            assert ranked == top_candidates(db, job, 10)
+        latencies.sort()
+
+        db.close()
+        engine.dispose()
+
+    return {
+        "candidates": candidates,
+        "avg_tokens_per_resume": round(token_count / candidates, 1),
+        "vocabulary_size": len(vocab),
+        "bytes_per_resume": {
+            "set_str": round(sets_bytes / candidates, 1),
+            "numpy_ids": round(arrays_bytes / candidates, 1),
+            "pool_csr": round(pool.memory_bytes() / candidates, 1),
+        },
+        "vocabulary_cache_bytes": vocab_bytes,
+        "pool_top_k_ms": {
+            "p50": latencies[len(latencies) // 2] * 1000,
+            "max": latencies[-1] * 1000,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--candidates", type=int, default=20000)
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="Salva o relatório neste arquivo")
+    args = parser.parse_args()
+
+    report = run(args.candidates, args.jobs, args.seed)
+
+    print(f"{report['candidates']} currículos, {report['avg_tokens_per_resume']} tokens/currículo, "
+          f"vocabulário de {report['vocabulary_size']} tokens")
+    print(f"{'representação':<15}{'bytes/currículo':>18}")
+    for name, value in report["bytes_per_resume"].items():
+        print(f"{name:<15}{value:>18.1f}")
+    print(f"cache do vocabulário: {report['vocabulary_cache_bytes'] / 1024:.0f} KiB")
+    print(f"CandidatePool.top_k: p50 {report['pool_top_k_ms']['p50']:.2f} ms")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import Depends, HTTPException, status, Header
 from sqlalchemy.orm import Session
+from app.db.session import get_db
+from app.services.user_cache import UserSnapshot, user_cache
 
 # Secret key para JWT (em produção usar variável de ambiente)
 SECRET_KEY = "rh-copilot-secret-key-mvp-2026"
@@ -55,14 +57,16 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 def decode_access_token(token: str) -> Optional[dict]:
     """
     Decodifica e valida o token
-    Retorna dict com 'sub' (email) e 'role', ou None se inválido
+    Retorna dict com 'sub' (email), 'role' e 'exp', ou None se inválido
     """
     try:
-        parts = token.split(":")
-        if len(parts) != 4:
+        # exp é isoformat e também contém ":", então separa pelas pontas
+        parts = token.split(":", 2)
+        if len(parts) != 3 or ":" not in parts[2]:
             return None
         
-        email, role, exp_str, signature = parts
+        email, role = parts[0], parts[1]
+        exp_str, signature = parts[2].rsplit(":", 1)
         
         # Verifica assinatura
         payload = f"{email}:{role}:{exp_str}"
@@ -80,7 +84,7 @@ def decode_access_token(token: str) -> Optional[dict]:
         if datetime.utcnow() > exp:
             return None
         
-        return {"sub": email, "role": role}
+        return {"sub": email, "role": role, "exp": exp}
     
     except Exception:
         return None
@@ -88,12 +92,14 @@ def decode_access_token(token: str) -> Optional[dict]:
 
 def get_current_user(
     authorization: str = Header(None),
-    db: Session = Depends(lambda: None)
-):
+    db: Session = Depends(get_db)
+) -> UserSnapshot:
     """
-    Dependência para obter o usuário atual a partir do token JWT
+    Dependência para obter o usuário atual a partir do token JWT.
+    Token já visto: usuário do cache (services/user_cache.py), sem banco.
+    Senão, consulta na sessão da própria requisição (a mesma do get_db do
+    endpoint) e guarda o snapshot até o TTL ou a expiração do token.
     """
-    from app.db.session import SessionLocal
     from app.db.models import User
     
     # Verifica se o header Authorization está presente
@@ -113,6 +119,10 @@ def get_current_user(
         )
     
     token = authorization.replace("Bearer ", "")
+
+    cached = user_cache.get(token)
+    if cached is not None:
+        return cached
     
     # Decodifica o token
     payload = decode_access_token(token)
@@ -132,16 +142,29 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Cria sessão do banco
-    db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.email == email).first()
-        if user is None:
+    user = db.query(User).filter(User.email == email).first()
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Usuário não encontrado",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    snapshot = UserSnapshot.of(user)
+    user_cache.set(token, snapshot, (payload["exp"] - datetime.utcnow()).total_seconds())
+    return snapshot
+
+
+def require_roles(*roles):
+    """
+    Dependência que exige que o usuário atual tenha um dos papéis informados
+    Uso: Depends(require_roles(UserRole.ADMIN, UserRole.RH))
+    """
+    def _checker(current_user=Depends(get_current_user)):
+        if current_user.role not in roles:
             raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Usuário não encontrado",
-                headers={"WWW-Authenticate": "Bearer"},
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Acesso restrito",
             )
-        return user
-    finally:
-        db.close()
+        return current_user
+
+    return _checker
@@ -0,0 +1,63 @@
+"""
+GET condicional (ETag / Last-Modified -> 304) para endpoints de leitura.
+
+O ETag é derivado das versões das tabelas que o endpoint lê
+(db/table_versions.py) e da URL com a query string (cada página, filtro
+e projeção tem o seu). A dependência roda antes do endpoint: se o cliente
+já tem a versão atual, responde 304 sem executar a consulta principal.
+"""
+import hashlib
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.orm import Session
+
+from app.db.session import get_db
+from app.db.table_versions import read_versions
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Comparação fraca (RFC 9110): ignora o prefixo W/
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def _not_modified_since(header: str | None, modified) -> bool:
+    if not header or modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return modified.replace(microsecond=0, tzinfo=timezone.utc) <= since
+
+
+class Conditional:
+    """Dependência: Conditional("jobs", "applications") para os dados dessas tabelas"""
+
+    def __init__(self, *tables: str):
+        self.tables = tables
+
+    def __call__(self, request: Request, response: Response, db: Session = Depends(get_db)) -> None:
+        versions, modified = read_versions(db, self.tables)
+        query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+        key = f"{request.url.path}?{query}|" + ",".join(f"{t}:{versions[t]}" for t in self.tables)
+        etag = f'W/"{hashlib.sha1(key.encode()).hexdigest()[:20]}"'
+
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if modified is not None:
+            headers["Last-Modified"] = format_datetime(modified.replace(tzinfo=timezone.utc), usegmt=True)
+
+        if_none_match = request.headers.get("if-none-match")
+        if _etag_matches(if_none_match, etag) or (
+            if_none_match is None and _not_modified_since(request.headers.get("if-modified-since"), modified)
+        ):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
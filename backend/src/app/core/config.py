@@ -8,6 +8,42 @@ class Settings(BaseSettings):
 	database_url: str = "sqlite:///./dev.db"
 	database_echo: bool = False
 	database_pool_pre_ping: bool = True
+	# Pool de conexões (Postgres e SQLite em arquivo)
+	database_pool_size: int = 5
+	database_max_overflow: int = 10
+	database_pool_recycle: int = 1800  # segundos até reabrir a conexão; -1 desliga
+	database_pool_timeout: int = 30  # segundos esperando uma conexão livre
+	# SQLite: "default" (só check_same_thread) | "production" (WAL + pragmas, ver db/session.py)
+	sqlite_profile: str = "default"
+	sqlite_busy_timeout: int = 5000  # ms
+	sqlite_mmap_size: int = 268435456  # bytes (256 MiB)
+	sqlite_cache_size: int = -65536  # negativo = KiB (64 MiB)
+	# Scorer do match_score: "jaccard" | "bm25" (ver services/scoring.py)
+	match_scorer: str = "jaccard"
+	# Intake de candidaturas: "inline" (pontua na requisição) | "async" (fila + workers)
+	application_intake_mode: str = "inline"
+	scoring_workers: int = 2
+	scoring_poll_interval: float = 1.0
+	scoring_max_attempts: int = 3
+	scoring_task_timeout: int = 300  # segundos até uma tarefa "running" voltar para a fila
+	# Cache de respostas do chat (LRU + TTL); 0 desliga
+	chat_cache_size: int = 1024
+	chat_cache_ttl: int = 3600  # segundos
+	# Log do chat: "sync" (INSERT + commit na requisição) | "buffered" (write-behind em lote)
+	chat_log_mode: str = "sync"
+	chat_log_buffer_size: int = 10000  # limite de mensagens aguardando gravação
+	chat_log_flush_size: int = 200
+	chat_log_flush_interval: float = 2.0  # segundos
+	# Buffer cheio: "flush" (grava na requisição, sem perda) | "drop" (descarta e conta)
+	chat_log_overflow: str = "flush"
+	# Métricas do RH: "query" (uma agregação por requisição) | "counters" (tabela metric_counters)
+	metrics_mode: str = "query"
+	# Rollups diários do dashboard: intervalo da thread (0 desliga) e dias por bloco no recálculo
+	rollup_interval: float = 60.0  # segundos
+	rollup_chunk_days: int = 31
+	# Cache token -> usuário em get_current_user (LRU + TTL, por processo); 0 desliga
+	auth_cache_size: int = 1024
+	auth_cache_ttl: int = 60  # segundos; também o atraso máximo entre workers após mudar um usuário
 
 	class Config:
 		env_file = ".env"
@@ -8,4 +8,5 @@ def setup_cors(app):
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor", "ETag", "Last-Modified"],  # cursor (core/pagination.py) e GET condicional (core/conditional.py)
     )
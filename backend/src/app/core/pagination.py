@@ -0,0 +1,90 @@
+"""
+Paginação por cursor (keyset) para os endpoints de listagem.
+
+A ordem é sempre decrescente por uma chave composta que termina no id
+(created_at, id), (match_score, id) ou (relevância, id), e a próxima página começa
+estritamente depois da última linha entregue: WHERE (a, id) < (a0, id0)
+ORDER BY a DESC, id DESC LIMIT n. Sem OFFSET, a página 1000 custa o mesmo
+que a primeira (com índice na chave).
+
+O corpo continua sendo a lista (compatível com os frontends); o cursor
+da próxima página vai no cabeçalho X-Next-Cursor, ausente na última. Sem
+?limit= a resposta traz DEFAULT_LIMIT itens: quem precisa da lista
+inteira segue o cursor (como frontend/api.py faz para as páginas do
+Streamlit).
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import and_, or_
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageParams:
+    """Dependência com os parâmetros ?limit=&cursor= de uma listagem"""
+
+    def __init__(
+        self,
+        limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="Itens por página"),
+        cursor: Optional[str] = Query(None, description=f"Valor de {NEXT_CURSOR_HEADER} da página anterior"),
+    ):
+        self.limit = limit
+        self.cursor = cursor
+
+
+def encode_cursor(values: list) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns) -> list:
+    """Valores do cursor convertidos para o tipo de cada coluna da chave"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        return [
+            datetime.fromisoformat(v) if col.type.python_type is datetime else col.type.python_type(v)
+            for v, col in zip(values, columns)
+        ]
+    except (ValueError, TypeError, NotImplementedError):
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+
+
+def _after(columns, values):
+    """(c1, c2, ...) < (v1, v2, ...) expandido em OR/AND (portável e usa o índice)"""
+    clauses = []
+    for i, (col, value) in enumerate(zip(columns, values)):
+        prefix = [c == v for c, v in zip(columns[:i], values[:i])]
+        clauses.append(and_(*prefix, col < value))
+    return or_(*clauses)
+
+
+def paginate(query, response: Response, page: PageParams, *columns) -> list:
+    """
+    Aplica a página à query ORM ordenando por `columns` em ordem
+    decrescente; a última coluna deve ser única (o id). As chaves podem ser
+    expressões (ex.: relevância da busca textual): os valores do cursor são
+    lidos das colunas selecionadas junto com as da query.
+
+    Devolve as entidades (query de uma entidade) ou dicts (query de colunas).
+    """
+    selected = query.column_descriptions
+    if page.cursor:
+        query = query.filter(_after(columns, decode_cursor(page.cursor, columns)))
+    rows = query.add_columns(*columns).order_by(*(col.desc() for col in columns)).limit(page.limit + 1).all()
+
+    if len(rows) > page.limit:
+        rows = rows[:page.limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(list(rows[-1][len(selected):]))
+    if len(selected) == 1 and selected[0]["expr"] is selected[0]["entity"]:
+        return [row[0] for row in rows]
+    # Query de colunas (projeção): dicts nome -> valor, sem as colunas da chave
+    names = [desc["name"] for desc in selected]
+    return [dict(zip(names, row)) for row in rows]
@@ -0,0 +1,50 @@
+"""
+Projeção de campos (?fields=) e serialização rápida das listagens.
+
+As listagens selecionam no SQL só as colunas do schema de saída (ou só as
+pedidas em ?fields=id,title), sem carregar entidades ORM nem colunas que o
+cliente não vê (resume_text, tokens, minhash...). As linhas já saem como
+dicts com os tipos certos, então a resposta vai direto para o orjson, sem
+validar cada linha com Pydantic. O response_model do endpoint continua
+documentando o formato no OpenAPI.
+"""
+from typing import Optional
+
+import orjson
+from fastapi import HTTPException, Query, Response
+from pydantic import BaseModel
+
+
+class FieldsParams:
+    """Dependência com o parâmetro ?fields= de uma listagem"""
+
+    def __init__(
+        self,
+        fields: Optional[str] = Query(None, description="Campos separados por vírgula (padrão: todos)"),
+    ):
+        self.fields = fields
+
+    def resolve(self, schema: type[BaseModel]) -> list[str]:
+        """Campos pedidos, na ordem do schema; 400 se algum não existir"""
+        available = list(schema.model_fields)
+        if not self.fields:
+            return available
+        requested = {f.strip() for f in self.fields.split(",") if f.strip()}
+        unknown = sorted(requested - set(available))
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Campo inválido: {', '.join(unknown)}")
+        return [f for f in available if f in requested]
+
+
+def select_fields(db, model, schema: type[BaseModel], params: FieldsParams):
+    """Query ORM só com as colunas de `model` correspondentes aos campos pedidos"""
+    return db.query(*(getattr(model, name) for name in params.resolve(schema)))
+
+
+def json_list(rows: list[dict], response: Response) -> Response:
+    """
+    Página serializada com orjson. Repassa os cabeçalhos já definidos na
+    resposta da requisição (cursor de paginate(), ETag de Conditional).
+    """
+    headers = {k: v for k, v in response.headers.items() if k not in ("content-length", "content-type")}
+    return Response(orjson.dumps(rows), media_type="application/json", headers=headers)
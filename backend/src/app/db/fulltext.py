@@ -0,0 +1,146 @@
+"""
+Estruturas de busca textual de candidatos e vagas.
+
+SQLite: tabelas virtuais FTS5 de conteúdo externo (candidates_fts,
+jobs_fts) apontando para o rowid da tabela original e mantidas por
+triggers de INSERT/UPDATE/DELETE. O trigger de UPDATE só dispara quando
+muda uma coluna indexada (reindexar tokens/minhash não toca no FTS).
+
+Postgres: índice GIN sobre a expressão tsvector ponderada (o próprio
+banco o mantém, sem trigger) e índices GIN pg_trgm nas colunas curtas
+(nome, email, título) para buscas por trecho de palavra.
+
+Nada disso é declarável no metadata do SQLAlchemy, então ensure_fulltext
+roda no evento after_create do metadata (create_all da aplicação, dos
+testes e dos benchmarks) e na migração correspondente. É idempotente.
+"""
+from dataclasses import dataclass
+
+from sqlalchemy import event
+
+from app.db.session import Base
+
+TS_CONFIG = "simple"  # sem stemming: currículos misturam português e inglês
+
+
+@dataclass(frozen=True)
+class FullTextSpec:
+    table: str
+    columns: tuple[str, ...]
+    weights: tuple[float, ...]  # pesos BM25 do FTS5, na ordem de columns
+    pg_weights: tuple[str, ...]  # classes setweight do Postgres (A..D)
+    trigram: tuple[str, ...]  # colunas com índice pg_trgm
+
+    @property
+    def fts_table(self) -> str:
+        return f"{self.table}_fts"
+
+
+CANDIDATES = FullTextSpec(
+    table="candidates",
+    columns=("name", "email", "resume_text"),
+    weights=(10.0, 5.0, 1.0),
+    pg_weights=("A", "B", "D"),
+    trigram=("name", "email"),
+)
+JOBS = FullTextSpec(
+    table="jobs",
+    columns=("title", "short_description", "full_description"),
+    weights=(10.0, 4.0, 1.0),
+    pg_weights=("A", "B", "D"),
+    trigram=("title",),
+)
+SPECS = (CANDIDATES, JOBS)
+
+
+def tsvector_sql(spec: FullTextSpec, prefix: str = "") -> str:
+    """Expressão tsvector da tabela; a mesma string no índice e na consulta"""
+    return " || ".join(
+        f"setweight(to_tsvector('{TS_CONFIG}', coalesce({prefix}{col}, '')), '{weight}')"
+        for col, weight in zip(spec.columns, spec.pg_weights)
+    )
+
+
+def _sqlite_statements(spec: FullTextSpec) -> list[str]:
+    fts, cols = spec.fts_table, ", ".join(spec.columns)
+    new = ", ".join(f"new.{c}" for c in spec.columns)
+    old = ", ".join(f"old.{c}" for c in spec.columns)
+    delete = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.rowid, {old});"
+    insert = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {new});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, content='{spec.table}', "
+        f"content_rowid='rowid', tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {spec.table} BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {spec.table} BEGIN {delete} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {spec.table} BEGIN {delete} {insert} END",
+    ]
+
+
+def _postgres_statements(spec: FullTextSpec) -> list[str]:
+    statements = [
+        f"CREATE INDEX IF NOT EXISTS ix_{spec.table}_fts ON {spec.table} USING GIN (({tsvector_sql(spec)}))",
+    ]
+    statements += [
+        f"CREATE INDEX IF NOT EXISTS ix_{spec.table}_{col}_trgm ON {spec.table} USING GIN ({col} gin_trgm_ops)"
+        for col in spec.trigram
+    ]
+    return statements
+
+
+def rebuild_fulltext(connection) -> None:
+    """
+    Reconstrói as tabelas FTS5 a partir das tabelas originais. Necessário
+    depois de um VACUUM no SQLite, que pode renumerar os rowids.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    for spec in SPECS:
+        connection.exec_driver_sql(f"INSERT INTO {spec.fts_table}({spec.fts_table}) VALUES ('rebuild')")
+
+
+def ensure_fulltext(connection) -> None:
+    """Cria as estruturas de busca textual que faltarem no banco da conexão"""
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        existing = {
+            row[0] for row in connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        for spec in SPECS:
+            for statement in _sqlite_statements(spec):
+                connection.exec_driver_sql(statement)
+            if spec.fts_table not in existing:
+                # Tabela FTS nova sobre uma tabela que pode já ter linhas
+                connection.exec_driver_sql(f"INSERT INTO {spec.fts_table}({spec.fts_table}) VALUES ('rebuild')")
+    elif dialect == "postgresql":
+        connection.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for spec in SPECS:
+            for statement in _postgres_statements(spec):
+                connection.exec_driver_sql(statement)
+
+
+def drop_fulltext(connection) -> None:
+    dialect = connection.dialect.name
+    for spec in SPECS:
+        if dialect == "sqlite":
+            for suffix in ("ai", "ad", "au"):
+                connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {spec.fts_table}_{suffix}")
+            connection.exec_driver_sql(f"DROP TABLE IF EXISTS {spec.fts_table}")
+        elif dialect == "postgresql":
+            connection.exec_driver_sql(f"DROP INDEX IF EXISTS ix_{spec.table}_fts")
+            for col in spec.trigram:
+                connection.exec_driver_sql(f"DROP INDEX IF EXISTS ix_{spec.table}_{col}_trgm")
+
+
+def is_fulltext_object(name: str | None) -> bool:
+    """Objetos criados aqui, fora do metadata (o autogenerate do Alembic os ignora)"""
+    return bool(name) and ("_fts" in name or name.endswith("_trgm"))
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _after_create(target, connection, **kw):
+    ensure_fulltext(connection)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _before_drop(target, connection, **kw):
+    drop_fulltext(connection)
@@ -1,8 +1,9 @@
 import uuid
-from datetime import datetime
-from sqlalchemy import String, Text, DateTime, Float, ForeignKey, Boolean, Enum as SQLEnum
+from datetime import date, datetime
+from sqlalchemy import String, Text, Date, DateTime, Float, Integer, LargeBinary, ForeignKey, Boolean, Index, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.session import Base
+from app.db import fulltext  # noqa: F401  # registra as estruturas FTS no create_all
 from enum import Enum as PyEnum
 
 
@@ -17,6 +18,19 @@ class UserRole(str, PyEnum):
     ADMIN = "admin"
 
 
+class ScoreStatus(str, PyEnum):
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class TaskStatus(str, PyEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
 class ApplicationStatus(str, PyEnum):
     APLICADO = "aplicado"
     EM_ANALISE = "em_analise"
@@ -42,6 +56,7 @@ class NotificationType(str, PyEnum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (Index("ix_users_created_at_id", "created_at", "id"),)
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid)
     name: Mapped[str] = mapped_column(String(120), nullable=False)
@@ -58,11 +73,14 @@ class User(Base):
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (Index("ix_jobs_created_at_id", "created_at", "id"),)
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid)
     title: Mapped[str] = mapped_column(String(160), nullable=False)
     short_description: Mapped[str] = mapped_column(Text, nullable=False)
     full_description: Mapped[str] = mapped_column(Text, nullable=True)
+    tokens: Mapped[str] = mapped_column(Text, nullable=True)  # tokens normalizados, separados por espaço
+    tokens_version: Mapped[int] = mapped_column(Integer, nullable=True)  # TOKENIZER_VERSION usada em tokens
 
     created_by: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -73,17 +91,66 @@ class Job(Base):
 
 class Candidate(Base):
     __tablename__ = "candidates"
+    __table_args__ = (Index("ix_candidates_created_at_id", "created_at", "id"),)
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid)
     name: Mapped[str] = mapped_column(String(120), nullable=False)
     email: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
     resume_text: Mapped[str] = mapped_column(Text, nullable=False)
     cv_url: Mapped[str] = mapped_column(String(500), nullable=True)  # URL ou caminho do CV
+    token_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)  # tokens distintos no índice invertido
+    doc_length: Mapped[int] = mapped_column(Integer, nullable=True)  # total de tokens (BM25); NULL = ainda não indexado
+    tokens: Mapped[str] = mapped_column(Text, nullable=True)  # tokens normalizados, separados por espaço
+    tokens_version: Mapped[int] = mapped_column(Integer, nullable=True)  # TOKENIZER_VERSION usada em tokens
+    minhash: Mapped[bytes] = mapped_column(LargeBinary, nullable=True)  # assinatura MinHash (uint32[NUM_PERM])
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
     applications: Mapped[list["Application"]] = relationship(back_populates="candidate")
 
 
+class CandidateToken(Base):
+    """Posting do índice invertido: token -> candidato (ver services/candidate_index.py)"""
+    __tablename__ = "candidate_tokens"
+
+    token: Mapped[str] = mapped_column(String(128), primary_key=True)
+    candidate_id: Mapped[str] = mapped_column(String(36), ForeignKey("candidates.id"), primary_key=True, index=True)
+    tf: Mapped[int] = mapped_column(Integer, default=1, nullable=False)  # frequência do token no currículo
+
+
+class TermStat(Base):
+    """Frequência de documento (df) de cada token na base de currículos"""
+    __tablename__ = "term_stats"
+
+    token: Mapped[str] = mapped_column(String(128), primary_key=True)
+    df: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class CorpusStat(Base):
+    """Linha única com o tamanho da base de currículos (BM25)"""
+    __tablename__ = "corpus_stats"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, default=1)
+    doc_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_length: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class VocabularyEntry(Base):
+    """Id inteiro estável de cada token (ver services/vocabulary.py)"""
+    __tablename__ = "vocabulary"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    token: Mapped[str] = mapped_column(String(128), unique=True, nullable=False)
+
+
+class CandidateLSHBucket(Base):
+    """Bucket LSH de uma banda da assinatura MinHash (ver services/minhash.py)"""
+    __tablename__ = "candidate_lsh_buckets"
+
+    band: Mapped[int] = mapped_column(Integer, primary_key=True)
+    bucket: Mapped[str] = mapped_column(String(16), primary_key=True)
+    candidate_id: Mapped[str] = mapped_column(String(36), ForeignKey("candidates.id"), primary_key=True, index=True)
+
+
 class Tag(Base):
     __tablename__ = "tags"
 
@@ -94,6 +161,15 @@ class Tag(Base):
 
 class Application(Base):
     __tablename__ = "applications"
+    # Índices no formato das listagens paginadas (filtro, chave do cursor)
+    __table_args__ = (
+        Index("ix_applications_created_at_id", "created_at", "id"),
+        Index("ix_applications_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_applications_job_id_match_score_id", "job_id", "match_score", "id"),
+        Index("ix_applications_candidate_id", "candidate_id"),
+        Index("ix_applications_status_match_score", "status", "match_score"),  # métricas (cobertura)
+        Index("ix_applications_updated_at_created_at", "updated_at", "created_at"),  # rollups incrementais (cobertura)
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid)
 
@@ -102,6 +178,7 @@ class Application(Base):
 
     status: Mapped[str] = mapped_column(SQLEnum(ApplicationStatus), default=ApplicationStatus.APLICADO, nullable=False)
     match_score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    score_status: Mapped[str] = mapped_column(String(20), default=ScoreStatus.DONE.value, nullable=False)  # pending até o worker pontuar
     summary: Mapped[str] = mapped_column(Text, nullable=True)
     tags: Mapped[str] = mapped_column(Text, nullable=True)  # JSON array como string: ["tag1", "tag2"]
     internal_notes: Mapped[str] = mapped_column(Text, nullable=True)
@@ -115,8 +192,30 @@ class Application(Base):
     notes: Mapped[list["InterviewNote"]] = relationship(back_populates="application", cascade="all, delete-orphan")
 
 
+class ScoringTask(Base):
+    """Fila (no banco) de candidaturas aguardando score/resumo pelos workers"""
+    __tablename__ = "scoring_tasks"
+    __table_args__ = (Index("ix_scoring_tasks_status_enqueued_at", "status", "enqueued_at"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    application_id: Mapped[str] = mapped_column(String(36), ForeignKey("applications.id"), nullable=False, index=True)
+    status: Mapped[str] = mapped_column(String(20), default=TaskStatus.PENDING.value, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    claimed_by: Mapped[str] = mapped_column(String(36), nullable=True)
+    error: Mapped[str] = mapped_column(Text, nullable=True)
+
+    enqueued_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+
+
 class Interview(Base):
     __tablename__ = "interviews"
+    # Índices no formato das listagens paginadas (filtro, chave do cursor)
+    __table_args__ = (
+        Index("ix_interviews_created_at_id", "created_at", "id"),
+        Index("ix_interviews_application_id_created_at_id", "application_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid)
     application_id: Mapped[str] = mapped_column(String(36), ForeignKey("applications.id"), nullable=False)
@@ -135,6 +234,11 @@ class Interview(Base):
 
 class InterviewNote(Base):
     __tablename__ = "interview_notes"
+    # Índices no formato das listagens paginadas (filtro, chave do cursor)
+    __table_args__ = (
+        Index("ix_interview_notes_created_at_id", "created_at", "id"),
+        Index("ix_interview_notes_application_id_created_at_id", "application_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid)
     application_id: Mapped[str] = mapped_column(String(36), ForeignKey("applications.id"), nullable=False)
@@ -151,6 +255,7 @@ class InterviewNote(Base):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (Index("ix_notifications_user_id_created_at_id", "user_id", "created_at", "id"),)
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
@@ -169,6 +274,7 @@ class Notification(Base):
 
 class Document(Base):
     __tablename__ = "documents"
+    __table_args__ = (Index("ix_documents_created_at_id", "created_at", "id"),)
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -176,11 +282,121 @@ class Document(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
 
 
+class DocumentPassage(Base):
+    """Trecho de Document.content usado na busca do chat (ver services/passages.py)"""
+    __tablename__ = "document_passages"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    document_id: Mapped[str] = mapped_column(String(36), ForeignKey("documents.id"), index=True, nullable=False)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)  # ordem do trecho no documento
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+
+
 class ChatMessage(Base):
     __tablename__ = "chat_messages"
+    __table_args__ = (Index("ix_chat_messages_created_at", "created_at"),)  # mensagens do dia no dashboard
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid)
     user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False)
     question: Mapped[str] = mapped_column(Text, nullable=False)
     answer: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class TableVersion(Base):
+    """Contador de escritas por tabela, para ETag das listagens (ver db/table_versions.py)"""
+    __tablename__ = "table_versions"
+
+    table_name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class MetricCounter(Base):
+    """Contadores materializados das métricas do RH (ver services/metrics.py)"""
+    __tablename__ = "metric_counters"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    value: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+
+
+class JobApplicationCount(Base):
+    """Candidaturas por vaga, para saber quando uma vaga fica ativa (ver services/metrics.py)"""
+    __tablename__ = "job_application_counts"
+
+    job_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    applications: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class ApplicationStatusChange(Base):
+    """Transição de status de uma candidatura; só recebe INSERT (ver services/status_history.py)"""
+    __tablename__ = "application_status_history"
+    __table_args__ = (Index("ix_application_status_history_changed_at", "changed_at"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    application_id: Mapped[str] = mapped_column(String(36), ForeignKey("applications.id"), nullable=False, index=True)
+    job_id: Mapped[str] = mapped_column(String(36), ForeignKey("jobs.id"), nullable=False)
+    from_status: Mapped[str] = mapped_column(String(20), nullable=True)  # NULL = candidatura criada
+    to_status: Mapped[str] = mapped_column(String(20), nullable=False)
+    changed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class JobStageStat(Base):
+    """Funil por vaga: candidaturas que chegaram à etapa e rejeitadas saindo dela"""
+    __tablename__ = "job_stage_stats"
+
+    job_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    stage: Mapped[str] = mapped_column(String(20), primary_key=True)
+    reached: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rejected: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class JobStageDuration(Base):
+    """Histograma do tempo na etapa por vaga (bucket geométrico, ver services/status_history.py)"""
+    __tablename__ = "job_stage_durations"
+
+    job_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    stage: Mapped[str] = mapped_column(String(20), primary_key=True)
+    bucket: Mapped[int] = mapped_column(Integer, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class DailyApplicationStats(Base):
+    """Rollup diário: candidaturas criadas no dia e soma dos scores (ver services/rollups.py)"""
+    __tablename__ = "daily_application_stats"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    applications: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    score_sum: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+
+
+class DailyJobApplications(Base):
+    """Rollup diário por vaga: candidaturas criadas no dia e soma dos scores"""
+    __tablename__ = "daily_job_applications"
+    __table_args__ = (Index("ix_daily_job_applications_day", "day"),)
+
+    job_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    applications: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    score_sum: Mapped[float] = mapped_column(Float, default=0, nullable=False)
+
+
+class DailyStatusTransitions(Base):
+    """Rollup diário: transições para cada status (de application_status_history)"""
+    __tablename__ = "daily_status_transitions"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+    transitions: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+
+class RollupState(Base):
+    """Marca d'água de cada rollup: até onde as tabelas de origem já foram lidas"""
+    __tablename__ = "rollup_state"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    watermark: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+
+
+# Eventos de sessão que incrementam TableVersion (precisa de TableVersion definido acima)
+from app.db import table_versions  # noqa: E402,F401
@@ -1,19 +1,65 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 from app.core.config import settings
 
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record=None) -> None:
+	"""
+	Perfil SQLITE_PROFILE=production, aplicado em cada conexão nova:
+	WAL (leitores não bloqueiam o escritor e vice-versa), busy_timeout
+	(escritores concorrentes esperam a vez em vez de "database is locked"),
+	synchronous=NORMAL (seguro com WAL; só o último commit pode se perder
+	numa queda de energia), mmap e cache de páginas maiores.
+	"""
+	cursor = dbapi_connection.cursor()
+	try:
+		cursor.execute("PRAGMA journal_mode=WAL")
+		cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout)}")
+		cursor.execute("PRAGMA synchronous=NORMAL")
+		cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+		cursor.execute(f"PRAGMA cache_size={int(settings.sqlite_cache_size)}")
+	finally:
+		cursor.close()
+
+
+def create_db_engine(db_url: str, sqlite_profile: str | None = None):
+	"""Engine do app: pool configurável e, no SQLite, os pragmas do perfil"""
+	url = make_url(db_url)
+	is_sqlite = url.get_backend_name() == "sqlite"
+	# SQLite em memória usa SingletonThreadPool/StaticPool: sem pool nem WAL para ajustar
+	in_memory = is_sqlite and url.database in (None, "", ":memory:")
+	sqlite_profile = sqlite_profile or settings.sqlite_profile
+	production = is_sqlite and not in_memory and sqlite_profile == "production"
+
+	kwargs = {}
+	if is_sqlite:
+		kwargs["connect_args"] = {"check_same_thread": False}
+		if production:
+			# Espera do próprio driver (segundos), alinhada ao busy_timeout
+			kwargs["connect_args"]["timeout"] = settings.sqlite_busy_timeout / 1000
+	if not in_memory:
+		kwargs.update(
+			pool_size=settings.database_pool_size,
+			max_overflow=settings.database_max_overflow,
+			pool_recycle=settings.database_pool_recycle,
+			pool_timeout=settings.database_pool_timeout,
+		)
+
+	engine = create_engine(
+		db_url,
+		future=True,
+		echo=settings.database_echo,
+		pool_pre_ping=settings.database_pool_pre_ping,
+		**kwargs,
+	)
+	if production:
+		event.listen(engine, "connect", apply_sqlite_pragmas)
+	return engine
+
+
 db_url = settings.database_url
-connect_args = {}
-if db_url.startswith("sqlite"):
-	connect_args = {"check_same_thread": False}
-
-engine = create_engine(
-	db_url,
-	future=True,
-	echo=settings.database_echo,
-	pool_pre_ping=settings.database_pool_pre_ping,
-	connect_args=connect_args,
-)
+engine = create_db_engine(db_url)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -0,0 +1,78 @@
+"""
+Versão por tabela para ETag/304 das listagens e métricas.
+
+Toda transação que escreve numa tabela de TRACKED_TABLES incrementa uma
+vez a linha dela em table_versions, na mesma transação (commit junto com
+os dados, rollback junto também). Os eventos de sessão cobrem flush de
+entidades e INSERT/UPDATE/DELETE executados pela Session (bulk com
+insert(Model), query.update()); escrita por fora da Session não é vista.
+
+Ler as versões é uma consulta por chave primária, bem mais barata que a
+listagem, então o 304 sai sem rodar a consulta principal.
+"""
+from datetime import datetime
+from itertools import chain
+
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import Session
+
+from app.db.models import TableVersion
+from app.services.corpus_stats import _dialect_insert
+
+TRACKED_TABLES = frozenset({"jobs", "candidates", "applications"})
+_BUMPED = "table_versions_bumped"
+
+
+def _bump(session: Session, tables) -> None:
+    bumped = session.info.setdefault(_BUMPED, set())
+    pending = (set(tables) & TRACKED_TABLES) - bumped
+    if not pending:
+        return
+    bumped |= pending
+
+    conn = session.connection()
+    now = datetime.utcnow()
+    dialect_insert = _dialect_insert(session)
+    # Ordem fixa: duas transações nunca travam as mesmas linhas em ordem inversa
+    for table in sorted(pending):
+        if dialect_insert is not None:
+            stmt = dialect_insert(TableVersion).values(table_name=table, version=1, updated_at=now)
+            conn.execute(stmt.on_conflict_do_update(
+                index_elements=[TableVersion.table_name],
+                set_={"version": TableVersion.version + 1, "updated_at": now},
+            ))
+        else:
+            result = conn.execute(
+                update(TableVersion)
+                .where(TableVersion.table_name == table)
+                .values(version=TableVersion.version + 1, updated_at=now)
+            )
+            if not result.rowcount:
+                conn.execute(TableVersion.__table__.insert().values(table_name=table, version=1, updated_at=now))
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session, flush_context):
+    changed = chain(session.new, session.deleted, (obj for obj in session.dirty if session.is_modified(obj)))
+    _bump(session, {obj.__table__.name for obj in changed})
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_execute(state):
+    table = getattr(state.statement, "table", None)
+    if state.statement.is_dml and table is not None:
+        _bump(state.session, {table.name})
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _reset(session):
+    session.info.pop(_BUMPED, None)
+
+
+def read_versions(db: Session, tables) -> tuple[dict[str, int], datetime | None]:
+    """Versão de cada tabela (0 se nunca escrita) e a data da escrita mais recente"""
+    rows = db.execute(select(TableVersion).where(TableVersion.table_name.in_(tables))).scalars().all()
+    versions = {table: 0 for table in tables}
+    versions.update({row.table_name: row.version for row in rows})
+    return versions, max((row.updated_at for row in rows), default=None)
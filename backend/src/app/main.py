@@ -4,16 +4,40 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from app.core.config import settings
 from app.routers import users, jobs, candidates, applications, documents, chat, seed, interviews, interview_notes, tags, notifications, cv_uploads, auth, metrics, employees
-from app.db.session import engine
+from app.db.session import engine, SessionLocal
 from app.db.models import Base
 from app.core.cors import setup_cors
-
-
-app = FastAPI(title="RH Copilot - Sistema Inteligente de Gestão de Talentos")
+from app.services.scoring_queue import ScoringWorkerPool
+from app.services.chat_log import chat_log_buffer
+from app.services.metrics import ensure_metric_counters
+from app.services.rollups import RollupWorker
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Workers de score só sobem no intake assíncrono; a fila fica no banco,
+    # então o que ficou pendente antes de um restart é retomado aqui
+    scoring_pool = None
+    if settings.application_intake_mode == "async":
+        scoring_pool = ScoringWorkerPool()
+        scoring_pool.start()
+    # Rollups diários do dashboard (backfill na primeira vez, depois incremental)
+    rollup_worker = RollupWorker()
+    rollup_worker.start()
+    yield
+    rollup_worker.stop()
+    if scoring_pool:
+        scoring_pool.stop()
+    # Grava as mensagens do chat ainda no buffer (CHAT_LOG_MODE=buffered)
+    chat_log_buffer.stop()
+
+
+app = FastAPI(title="RH Copilot - Sistema Inteligente de Gestão de Talentos", lifespan=lifespan)
 
 # Setup CORS para demo público
 setup_cors(app)
@@ -28,6 +52,10 @@ def health():
 # Cria tabelas automaticamente (MVP)
 Base.metadata.create_all(bind=engine)
 
+# METRICS_MODE=counters numa base que ainda não tem os contadores
+with SessionLocal() as _db:
+    ensure_metric_counters(_db)
+
 # Registra todos os routers ANTES de montar StaticFiles
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
 app.include_router(metrics.router, prefix="/api/metrics", tags=["metrics"])
@@ -1,21 +1,42 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import uuid
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, insert
 from sqlalchemy.orm import Session
 from app.db.session import get_db
-from app.db.models import Application, Job, Candidate, ApplicationStatus
-from app.schemas.applications import ApplicationCreate, ApplicationOut, ApplicationUpdateStatus
-from app.services.ai_resume_match import compute_match_score, summarize_candidate
-from typing import Optional
+from app.core.pagination import PageParams, paginate
+from app.core.conditional import Conditional
+from app.core.projection import FieldsParams, json_list, select_fields
+from app.db.models import Application, ApplicationStatusChange, Job, Candidate, ApplicationStatus, ScoreStatus, ScoringTask, UserRole
+from app.schemas.applications import (
+    ApplicationCreate, ApplicationOut, ApplicationUpdateStatus, ApplicationStatusChangeOut, RescoreOut,
+    ApplicationBulkCreate, ApplicationBulkOut,
+)
+from app.services.ai_resume_match import summarize_candidate
+from app.services.token_store import job_tokens, refresh_stale_tokens
+from app.services.scoring import get_scorer, score_one, rescore_applications
+from app.services.scoring_queue import enqueue
+from app.services.export import MEDIA_TYPES, applications_query, stream_rows
+from app.services.metrics import record_applications_created, record_status_change
+from app.services.status_history import record_transitions
+from app.core.config import settings
+from app.core.auth import require_roles
+from typing import Literal, Optional
 
 router = APIRouter()
 
-@router.get("/", response_model=list[ApplicationOut])
+@router.get("/", response_model=list[ApplicationOut], dependencies=[Depends(Conditional("applications"))])
 def list_applications(
+    response: Response,
     status: Optional[str] = Query(None, description="Filtrar por status: aplicado, em_analise, entrevista, oferecido, rejeitado"),
     min_score: Optional[float] = Query(None, description="Score mínimo de match"),
+    page: PageParams = Depends(),
+    fields: FieldsParams = Depends(),
     db: Session = Depends(get_db)
 ):
     """Lista candidaturas com filtros opcionais"""
-    query = db.query(Application)
+    query = select_fields(db, Application, ApplicationOut, fields)
     
     if status:
         query = query.filter(Application.status == status)
@@ -23,7 +44,7 @@ def list_applications(
     if min_score is not None:
         query = query.filter(Application.match_score >= min_score)
     
-    return query.order_by(Application.created_at.desc()).all()
+    return json_list(paginate(query, response, page, Application.created_at, Application.id), response)
 
 @router.post("/", response_model=ApplicationOut)
 def create_application(payload: ApplicationCreate, db: Session = Depends(get_db)):
@@ -32,10 +53,27 @@ def create_application(payload: ApplicationCreate, db: Session = Depends(get_db)
     if not job or not cand:
         raise HTTPException(status_code=404, detail="Vaga ou candidato não encontrado")
 
-    base_text = f"{job.title}\n{job.short_description}\n{job.full_description or ''}"
-    score = compute_match_score(base_text, cand.resume_text)
+    # Intake assíncrono: grava já com score pendente e deixa para os workers
+    if settings.application_intake_mode == "async":
+        record_applications_created(db, [(job.id, ApplicationStatus.APLICADO, 0.0)])
+        app = Application(
+            job_id=job.id,
+            candidate_id=cand.id,
+            score_status=ScoreStatus.PENDING.value,
+            status=ApplicationStatus.APLICADO
+        )
+        db.add(app)
+        db.flush()
+        record_transitions(db, [(app.id, job.id, None, app.status)])
+        enqueue(db, app.id)
+        db.commit()
+        db.refresh(app)
+        return app
+
+    score = score_one(get_scorer(), db, job.id, job_tokens(job), cand)
     summary = summarize_candidate(cand.resume_text)
 
+    record_applications_created(db, [(job.id, ApplicationStatus.APLICADO, score)])
     app = Application(
         job_id=job.id,
         candidate_id=cand.id,
@@ -44,11 +82,102 @@ def create_application(payload: ApplicationCreate, db: Session = Depends(get_db)
         status=ApplicationStatus.APLICADO
     )
     db.add(app)
+    db.flush()
+    record_transitions(db, [(app.id, job.id, None, app.status)])
     db.commit()
     db.refresh(app)
     return app
 
 
+@router.post("/bulk", response_model=ApplicationBulkOut)
+def create_applications_bulk(payload: ApplicationBulkCreate, db: Session = Depends(get_db)):
+    """
+    Cria várias candidaturas (job_id, candidate_id) de uma vez: uma consulta
+    por tabela, score em lote, um INSERT executemany e um único commit.
+    Erros (vaga/candidato inexistente, duplicada) são reportados por item.
+    """
+    job_ids = {item.job_id for item in payload.items}
+    cand_ids = {item.candidate_id for item in payload.items}
+
+    jobs = {j.id: j for j in db.scalars(select(Job).where(Job.id.in_(job_ids)))}
+    cands = {c.id: c for c in db.scalars(select(Candidate).where(Candidate.id.in_(cand_ids)))}
+    existing = set(db.execute(
+        select(Application.job_id, Application.candidate_id)
+        .where(Application.job_id.in_(job_ids), Application.candidate_id.in_(cand_ids))
+    ).all())
+
+    results = []
+    valid = []
+    for index, item in enumerate(payload.items):
+        result = {"index": index, "job_id": item.job_id, "candidate_id": item.candidate_id}
+        pair = (item.job_id, item.candidate_id)
+        if item.job_id not in jobs:
+            result["error"] = "Vaga não encontrada"
+        elif item.candidate_id not in cands:
+            result["error"] = "Candidato não encontrado"
+        elif pair in existing:
+            result["error"] = "Candidatura duplicada"
+        else:
+            existing.add(pair)
+            valid.append(result)
+        results.append(result)
+
+    if valid:
+        pairs = [(r["job_id"], r["candidate_id"]) for r in valid]
+        is_async = settings.application_intake_mode == "async"
+        if is_async:
+            scores = [0.0] * len(pairs)
+        else:
+            used_jobs = {job_id for job_id, _ in pairs}
+            used_cands = [cands[cid] for cid in {cid for _, cid in pairs}]
+            scores = get_scorer().score_pairs(db, {jid: job_tokens(jobs[jid]) for jid in used_jobs}, used_cands, pairs)
+            summaries = {c.id: summarize_candidate(c.resume_text) for c in used_cands}
+
+        now = datetime.utcnow()
+        rows = []
+        for result, score in zip(valid, scores):
+            result["application_id"] = str(uuid.uuid4())
+            result["match_score"] = None if is_async else score
+            rows.append({
+                "id": result["application_id"],
+                "job_id": result["job_id"],
+                "candidate_id": result["candidate_id"],
+                "status": ApplicationStatus.APLICADO,
+                "match_score": score,
+                "score_status": ScoreStatus.PENDING.value if is_async else ScoreStatus.DONE.value,
+                "summary": None if is_async else summaries[result["candidate_id"]],
+                "created_at": now,
+                "updated_at": now,
+            })
+        record_applications_created(db, [(row["job_id"], row["status"], row["match_score"]) for row in rows])
+        db.execute(insert(Application), rows)
+        record_transitions(db, [(row["id"], row["job_id"], None, row["status"]) for row in rows], at=now)
+        if is_async:
+            db.execute(insert(ScoringTask), [{"application_id": row["id"], "enqueued_at": now} for row in rows])
+        db.commit()
+
+    return ApplicationBulkOut(
+        created=len(valid),
+        failed=len(results) - len(valid),
+        items=results,
+    )
+
+
+@router.post("/rescore", response_model=RescoreOut)
+def rescore(
+    job_id: Optional[str] = Query(None, description="Recalcular só esta vaga (padrão: todas)"),
+    db: Session = Depends(get_db),
+    current_user=Depends(require_roles(UserRole.ADMIN, UserRole.RH)),
+):
+    """Recalcula em lote o match_score das candidaturas (ex: após mudar o tokenizador)"""
+    if job_id and not db.query(Job.id).filter(Job.id == job_id).first():
+        raise HTTPException(status_code=404, detail="Vaga não encontrada")
+
+    # Tokens gravados com versão antiga do tokenizador são recalculados primeiro
+    refresh_stale_tokens(db)
+    return RescoreOut(job_id=job_id, rescored=rescore_applications(db, job_id))
+
+
 @router.patch("/{application_id}/status", response_model=ApplicationOut)
 def update_application_status(
     application_id: str,
@@ -66,16 +195,32 @@ def update_application_status(
     if status_update.status not in valid_statuses:
         raise HTTPException(status_code=400, detail=f"Status inválido. Use: {valid_statuses}")
     
+    record_status_change(db, app.status, status_update.status)
+    record_transitions(db, [(app.id, app.job_id, app.status, status_update.status)])
     app.status = ApplicationStatus(status_update.status)
     db.commit()
     db.refresh(app)
     return app
 
 
+@router.get("/{application_id}/history", response_model=list[ApplicationStatusChangeOut])
+def get_application_history(application_id: str, db: Session = Depends(get_db)):
+    """Transições de status da candidatura, da criação até o status atual"""
+    if not db.get(Application, application_id):
+        raise HTTPException(status_code=404, detail="Candidatura não encontrada")
+    return db.scalars(
+        select(ApplicationStatusChange)
+        .where(ApplicationStatusChange.application_id == application_id)
+        .order_by(ApplicationStatusChange.id)
+    ).all()
+
+
 @router.get("/by-job/{job_id}", response_model=list[ApplicationOut])
 def list_applications_by_job(
     job_id: str,
+    response: Response,
     status: Optional[str] = Query(None, description="Filtrar por status"),
+    page: PageParams = Depends(),
     db: Session = Depends(get_db)
 ):
     """Lista candidaturas de uma vaga específica com filtros opcionais"""
@@ -84,5 +229,24 @@ def list_applications_by_job(
     if status:
         query = query.filter(Application.status == status)
     
-    return query.order_by(Application.match_score.desc()).all()
+    return paginate(query, response, page, Application.match_score, Application.id)
 
+
+
+@router.get("/export")
+def export_applications(
+    job_id: Optional[str] = Query(None, description="Só as candidaturas desta vaga"),
+    format: Literal["csv", "ndjson"] = Query("csv", description="csv ou ndjson"),
+    db: Session = Depends(get_db),
+    current_user=Depends(require_roles(UserRole.ADMIN, UserRole.RH)),
+):
+    """Exporta candidaturas com título da vaga e nome do candidato em streaming (memória constante)"""
+    if job_id and not db.get(Job, job_id):
+        raise HTTPException(status_code=404, detail="Vaga não encontrada")
+
+    filename = f"candidaturas-{job_id}.{format}" if job_id else f"candidaturas.{format}"
+    return StreamingResponse(
+        stream_rows(applications_query(job_id), format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -1,10 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.db.models import User, UserRole
 from app.schemas.auth import UserRegister, UserLogin, Token, UserOut
-from app.core.auth import hash_password, verify_password, create_access_token, decode_access_token
-from typing import Optional
+from app.core.auth import hash_password, verify_password, create_access_token, get_current_user
+from app.services.user_cache import UserSnapshot
 
 router = APIRouter()
 
@@ -84,29 +84,6 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserOut)
-def get_current_user_info(authorization: Optional[str] = Header(None), db: Session = Depends(get_db)):
-    """Retorna informações do usuário logado"""
-    
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token não fornecido"
-        )
-    
-    token = authorization.replace("Bearer ", "")
-    token_data = decode_access_token(token)
-    
-    if not token_data:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token inválido ou expirado"
-        )
-    
-    user = db.query(User).filter(User.email == token_data["sub"]).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Usuário não encontrado"
-        )
-    
-    return UserOut.model_validate(user)
+def get_current_user_info(current_user: UserSnapshot = Depends(get_current_user)):
+    """Retorna informações do usuário logado (via cache de usuários autenticados)"""
+    return UserOut.model_validate(current_user, from_attributes=True)
@@ -1,26 +1,49 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.db.session import get_db
-from app.db.models import Candidate
+from app.core.pagination import PageParams, paginate
+from app.core.projection import FieldsParams, json_list, select_fields
+from app.db.models import Candidate, Application, UserRole
 from app.schemas.candidates import CandidateCreate, CandidateOut
-from typing import Optional
+from app.services.candidate_index import index_candidate, unindex_candidate
+from app.services.export import MEDIA_TYPES, candidates_query, stream_rows
+from app.services.metrics import record_candidates_changed
+from app.services.search import search_candidates
+from app.core.auth import require_roles
+from typing import Literal, Optional
 
 router = APIRouter()
 
 @router.get("/", response_model=list[CandidateOut])
 def list_candidates(
-    search: Optional[str] = Query(None, description="Buscar por nome ou email"),
+    response: Response,
+    search: Optional[str] = Query(None, description="Busca textual em nome, email e currículo (ordenada por relevância)"),
+    page: PageParams = Depends(),
+    fields: FieldsParams = Depends(),
     db: Session = Depends(get_db)
 ):
     """Lista candidatos com busca opcional"""
-    query = db.query(Candidate)
+    query = select_fields(db, Candidate, CandidateOut, fields)
     
+    keys = (Candidate.created_at, Candidate.id)
     if search:
-        query = query.filter(
-            (Candidate.name.ilike(f"%{search}%")) | (Candidate.email.ilike(f"%{search}%"))
-        )
+        query, keys = search_candidates(query, search)
     
-    return query.order_by(Candidate.created_at.desc()).all()
+    return json_list(paginate(query, response, page, *keys), response)
+
+@router.get("/export")
+def export_candidates(
+    format: Literal["csv", "ndjson"] = Query("csv", description="csv ou ndjson"),
+    include_resume: bool = Query(False, description="Inclui o texto do currículo"),
+    current_user=Depends(require_roles(UserRole.ADMIN, UserRole.RH)),
+):
+    """Exporta a base de candidatos em streaming (memória constante)"""
+    return StreamingResponse(
+        stream_rows(candidates_query(include_resume), format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="candidatos.{format}"'},
+    )
 
 @router.get("/{candidate_id}", response_model=CandidateOut)
 def get_candidate(candidate_id: str, db: Session = Depends(get_db)):
@@ -33,6 +56,24 @@ def get_candidate(candidate_id: str, db: Session = Depends(get_db)):
 def create_candidate(payload: CandidateCreate, db: Session = Depends(get_db)):
     cand = Candidate(name=payload.name, email=payload.email, resume_text=payload.resume_text)
     db.add(cand)
+    db.flush()
+    index_candidate(db, cand)
+    record_candidates_changed(db, 1)
     db.commit()
     db.refresh(cand)
     return cand
+
+
+@router.delete("/{candidate_id}")
+def delete_candidate(candidate_id: str, db: Session = Depends(get_db)):
+    cand = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+    if not cand:
+        raise HTTPException(status_code=404, detail="Candidato não encontrado")
+    if db.query(Application.id).filter(Application.candidate_id == candidate_id).first():
+        raise HTTPException(status_code=409, detail="Candidato possui candidaturas")
+
+    unindex_candidate(db, cand)
+    db.delete(cand)
+    record_candidates_changed(db, -1)
+    db.commit()
+    return {"message": "Candidato removido com sucesso"}
@@ -1,20 +1,73 @@
+import json
+
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from app.db import session as db_session
 from app.db.session import get_db
-from app.db.models import Document, ChatMessage
 from app.schemas.chat import ChatRequest, ChatResponse
-from app.services.ai_chatbot import answer_from_documents
+from app.services.ai_chatbot import answer_from_passages, stream_answer_from_passages, split_tokens
+from app.services.answer_cache import answer_cache
+from app.services.chat_log import log_chat_message
+from app.services.document_index import document_index
 
 router = APIRouter()
 
 @router.post("/", response_model=ChatResponse)
 def chat(req: ChatRequest, db: Session = Depends(get_db)):
-    docs = db.query(Document).all()
-    pairs = [(d.title, d.content) for d in docs]
-    answer = answer_from_documents(req.question, pairs)
+    document_index.sync(db)
+    answer = answer_cache.get(req.question, document_index.version)
+    if answer is None:
+        answer = answer_from_passages(document_index.search(req.question))
+        answer_cache.set(req.question, document_index.version, answer)
 
-    msg = ChatMessage(user_id=req.user_id, question=req.question, answer=answer)
-    db.add(msg)
-    db.commit()
+    log_chat_message(db, req.user_id, req.question, answer)
 
     return {"answer": answer}
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _chat_events(req: ChatRequest):
+    # Sessão própria: a do Depends(get_db) não vive até o fim do streaming
+    db = db_session.SessionLocal()
+    try:
+        document_index.sync(db)
+        version = document_index.version
+        cached = answer_cache.get(req.question, version)
+        if cached is not None:
+            yield _sse("retrieval", {"cached": True, "passages": []})
+            pieces = split_tokens(cached)
+        else:
+            passages = document_index.search(req.question)
+            yield _sse("retrieval", {
+                "cached": False,
+                "passages": [{"title": title, "text": text, "score": round(score, 4)} for title, text, score in passages],
+            })
+            pieces = stream_answer_from_passages(passages)
+
+        answer = []
+        for piece in pieces:
+            answer.append(piece)
+            yield _sse("token", {"text": piece})
+        answer = "".join(answer)
+        if cached is None:
+            answer_cache.set(req.question, version, answer)
+
+        # Só grava depois que a resposta inteira foi enviada
+        message_id = log_chat_message(db, req.user_id, req.question, answer)
+        yield _sse("done", {"answer": answer, "message_id": message_id})
+    finally:
+        db.close()
+
+
+@router.post("/stream")
+def chat_stream(req: ChatRequest):
+    """Mesma resposta do POST /chat/, enviada aos pedaços via Server-Sent Events"""
+    return StreamingResponse(
+        _chat_events(req),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
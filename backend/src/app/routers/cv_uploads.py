@@ -5,6 +5,7 @@ from pathlib import Path
 import uuid
 from app.db.session import get_db
 from app.db.models import Candidate
+from app.services.candidate_index import index_candidate
 
 router = APIRouter()
 
@@ -40,6 +41,12 @@ async def upload_cv(candidate_id: str, file: UploadFile = File(...), db: Session
     
     # Update candidate cv_url
     candidate.cv_url = unique_filename
+
+    # CV em texto puro vira o resume_text e reindexa o candidato
+    if file_ext == ".txt":
+        candidate.resume_text = contents.decode("utf-8", errors="ignore")
+        index_candidate(db, candidate)
+
     db.commit()
     db.refresh(candidate)
     
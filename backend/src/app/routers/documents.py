@@ -1,20 +1,25 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
 from app.db.session import get_db
+from app.core.pagination import PageParams, paginate
 from app.db.models import Document
 from app.schemas.documents import DocumentCreate, DocumentOut
+from app.services.document_index import document_index
+from app.services.passages import store_passages
 
 router = APIRouter()
 
 @router.get("/", response_model=list[DocumentOut])
-def list_documents(db: Session = Depends(get_db)):
-    return db.query(Document).order_by(Document.created_at.desc()).all()
+def list_documents(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return paginate(db.query(Document), response, page, Document.created_at, Document.id)
 
 
 @router.post("/", response_model=DocumentOut)
 def create_document(payload: DocumentCreate, db: Session = Depends(get_db)):
     doc = Document(title=payload.title, content=payload.content)
     db.add(doc)
+    passages = store_passages(db, doc)
     db.commit()
     db.refresh(doc)
+    document_index.add(doc, passages)
     return doc
@@ -1,15 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.db.session import get_db
-from app.db.models import User
 from app.core.auth import get_current_user
+from app.services.user_cache import UserSnapshot
 
 router = APIRouter()
 
 
 @router.get("/me/dashboard")
 def get_employee_dashboard(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Dashboard do funcionário com informações básicas"""
@@ -29,7 +29,7 @@ def get_employee_dashboard(
 
 @router.get("/me/profile")
 def get_employee_profile(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Perfil completo do funcionário"""
@@ -48,7 +48,7 @@ def get_employee_profile(
 
 @router.get("/me/timesheet")
 def get_employee_timesheet(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Registros de ponto do funcionário"""
@@ -61,7 +61,7 @@ def get_employee_timesheet(
 
 @router.get("/me/goals")
 def get_employee_goals(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Metas e objetivos do funcionário"""
@@ -73,7 +73,7 @@ def get_employee_goals(
 
 @router.get("/me/documents")
 def get_employee_documents(
-    current_user: User = Depends(get_current_user),
+    current_user: UserSnapshot = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Documentos do funcionário"""
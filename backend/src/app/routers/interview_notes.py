@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 from app.db.session import get_db
+from app.core.pagination import PageParams, paginate
 from app.db.models import InterviewNote
 from app.schemas.interview_notes import InterviewNoteCreate, InterviewNoteOut
 
@@ -22,8 +23,9 @@ def create_note(payload: InterviewNoteCreate, db: Session = Depends(get_db)):
 
 
 @router.get("/", response_model=list[InterviewNoteOut])
-def list_notes(application_id: str = Query(None), db: Session = Depends(get_db)):
+def list_notes(response: Response, application_id: str = Query(None), page: PageParams = Depends(), db: Session = Depends(get_db)):
+    query = db.query(InterviewNote)
     if application_id:
-        return db.query(InterviewNote).filter(InterviewNote.application_id == application_id).order_by(InterviewNote.created_at.desc()).all()
-    return db.query(InterviewNote).order_by(InterviewNote.created_at.desc()).all()
+        query = query.filter(InterviewNote.application_id == application_id)
+    return paginate(query, response, page, InterviewNote.created_at, InterviewNote.id)
 
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 from app.db.session import get_db
+from app.core.pagination import PageParams, paginate
 from app.db.models import Interview, Application
 from app.schemas.interviews import InterviewCreate, InterviewUpdate, InterviewOut
 
@@ -23,10 +24,11 @@ def create_interview(payload: InterviewCreate, db: Session = Depends(get_db)):
 
 
 @router.get("/", response_model=list[InterviewOut])
-def list_interviews(application_id: str = Query(None), db: Session = Depends(get_db)):
+def list_interviews(response: Response, application_id: str = Query(None), page: PageParams = Depends(), db: Session = Depends(get_db)):
+    query = db.query(Interview)
     if application_id:
-        return db.query(Interview).filter(Interview.application_id == application_id).all()
-    return db.query(Interview).all()
+        query = query.filter(Interview.application_id == application_id)
+    return paginate(query, response, page, Interview.created_at, Interview.id)
 
 
 @router.patch("/{interview_id}", response_model=InterviewOut)
@@ -1,25 +1,39 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from app.db.session import get_db
+from app.core.pagination import PageParams, paginate
+from app.core.conditional import Conditional
+from app.core.projection import FieldsParams, json_list, select_fields
 from app.db.models import Job
-from app.schemas.jobs import JobCreate, JobOut
+from app.schemas.jobs import JobCreate, JobFunnelOut, JobOut, TopCandidateOut
 from app.services.ai_job_description import generate_full_job_description
-from typing import Optional
+from app.services.metrics import record_job_created
+from app.services.minhash import approx_top_candidates
+from app.services.scoring import get_scorer
+from app.services.search import search_jobs
+from app.services.status_history import job_funnel
+from app.services.token_store import job_tokens, store_job_tokens
+from app.services.vocabulary import candidate_pool
+from typing import Literal, Optional
 
 router = APIRouter()
 
-@router.get("/", response_model=list[JobOut])
+@router.get("/", response_model=list[JobOut], dependencies=[Depends(Conditional("jobs"))])
 def list_jobs(
-    search: Optional[str] = Query(None, description="Buscar por título"),
+    response: Response,
+    search: Optional[str] = Query(None, description="Busca textual em título e descrições (ordenada por relevância)"),
+    page: PageParams = Depends(),
+    fields: FieldsParams = Depends(),
     db: Session = Depends(get_db)
 ):
-    """Lista vagas com busca opcional por título"""
-    query = db.query(Job)
+    """Lista vagas com busca textual opcional"""
+    query = select_fields(db, Job, JobOut, fields)
     
+    keys = (Job.created_at, Job.id)
     if search:
-        query = query.filter(Job.title.ilike(f"%{search}%"))
+        query, keys = search_jobs(query, search)
     
-    return query.order_by(Job.created_at.desc()).all()
+    return json_list(paginate(query, response, page, *keys), response)
 
 
 @router.get("/{job_id}", response_model=JobOut)
@@ -27,6 +41,34 @@ def get_job(job_id: str, db: Session = Depends(get_db)):
     return db.query(Job).filter(Job.id == job_id).first()
 
 
+@router.get("/{job_id}/top-candidates", response_model=list[TopCandidateOut])
+def get_top_candidates(
+    job_id: str,
+    k: int = Query(10, ge=1, le=100, description="Quantidade de candidatos"),
+    mode: Literal["exact", "approx", "pool"] = Query("exact", description="exact: scorer configurado sobre o índice invertido | approx: MinHash/LSH | pool: Jaccard sobre a base residente em memória"),
+    rerank: bool = Query(True, description="No modo approx, reordena a lista curta pelo Jaccard exato"),
+    db: Session = Depends(get_db)
+):
+    """Ranqueia a base de candidatos para a vaga (índice invertido, MinHash/LSH ou base residente)"""
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Vaga não encontrada")
+
+    if mode == "approx":
+        return approx_top_candidates(db, job_tokens(job), k, rerank=rerank)
+    if mode == "pool":
+        return candidate_pool.top_k(db, job_tokens(job), k)
+    return get_scorer().top_k(db, job_tokens(job), k)
+
+
+@router.get("/{job_id}/funnel", response_model=JobFunnelOut)
+def get_job_funnel(job_id: str, db: Session = Depends(get_db)):
+    """Funil da vaga: conversão entre etapas e mediana do tempo em cada uma (agregados pré-calculados)"""
+    if not db.get(Job, job_id):
+        raise HTTPException(status_code=404, detail="Vaga não encontrada")
+    return job_funnel(db, job_id)
+
+
 @router.post("/", response_model=JobOut)
 def create_job(payload: JobCreate, db: Session = Depends(get_db)):
     full = generate_full_job_description(payload.title, payload.short_description)
@@ -36,7 +78,9 @@ def create_job(payload: JobCreate, db: Session = Depends(get_db)):
         full_description=full,
         created_by=payload.created_by,
     )
+    store_job_tokens(job)
     db.add(job)
+    record_job_created(db)
     db.commit()
     db.refresh(job)
     return job
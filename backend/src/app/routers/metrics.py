@@ -1,10 +1,18 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from app.db.session import get_db
-from app.db.models import Job, Candidate, Application, ApplicationStatus
+from app.db.models import ChatMessage, User, UserRole
+from app.core.conditional import Conditional
+from app.services.metrics import read_metrics
+from app.services.rollups import read_series
+from app.services.scoring_queue import queue_stats
+from app.services.answer_cache import answer_cache
+from app.services.chat_log import chat_log_buffer
+from app.services.user_cache import user_cache
 from pydantic import BaseModel
-from typing import Dict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional
 
 router = APIRouter()
 
@@ -18,37 +26,118 @@ class MetricsOut(BaseModel):
     avg_match_score: float
 
 
-@router.get("/", response_model=MetricsOut)
+class DailyApplicationsOut(BaseModel):
+    day: date
+    applications: int
+    avg_match_score: float
+
+
+class DailyTransitionsOut(BaseModel):
+    day: date
+    status: str
+    transitions: int
+
+
+class DashboardOut(BaseModel):
+    total_employees: int
+    total_teams: int
+    pending_os: int
+    messages_today: int
+    applications_per_day: List[DailyApplicationsOut]
+    status_transitions_per_day: List[DailyTransitionsOut]
+    job_applications_per_day: List[DailyApplicationsOut]
+    rollups_updated_at: Optional[datetime] = None
+
+
+class ScoringQueueOut(BaseModel):
+    depth: int
+    running: int
+    failed: int
+    oldest_enqueued_at: Optional[datetime] = None
+    lag_seconds: float
+
+
+class ChatCacheOut(BaseModel):
+    size: int
+    maxsize: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    hit_rate: float
+
+
+class AuthCacheOut(BaseModel):
+    size: int
+    maxsize: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    hit_rate: float
+
+
+class ChatLogOut(BaseModel):
+    mode: str
+    buffered: int
+    capacity: int
+    flushed: int
+    dropped: int
+    flush_errors: int
+
+
+@router.get("/", response_model=MetricsOut, dependencies=[Depends(Conditional("jobs", "candidates", "applications"))])
 def get_metrics(db: Session = Depends(get_db)):
-    """Retorna métricas gerais do RH"""
-    
-    # Total de vagas
-    total_jobs = db.query(Job).count()
-    
-    # Vagas com candidaturas recentes (últimos 30 dias)
-    active_jobs = db.query(Job).join(Application).distinct().count()
-    
-    # Total de candidatos
-    total_candidates = db.query(Candidate).count()
-    
-    # Total de candidaturas
-    total_applications = db.query(Application).count()
-    
-    # Candidaturas por status
-    applications_by_status = {}
-    for status in ApplicationStatus:
-        count = db.query(Application).filter(Application.status == status).count()
-        applications_by_status[status.value] = count
-    
-    # Score médio de match
-    avg_score_result = db.query(func.avg(Application.match_score)).scalar()
-    avg_match_score = float(avg_score_result) if avg_score_result else 0.0
-    
-    return MetricsOut(
-        total_jobs=total_jobs,
-        active_jobs=active_jobs,
-        total_candidates=total_candidates,
-        total_applications=total_applications,
-        applications_by_status=applications_by_status,
-        avg_match_score=round(avg_match_score, 2)
+    """Retorna métricas gerais do RH (uma agregação ou os contadores materializados, ver METRICS_MODE)"""
+    return read_metrics(db)
+
+
+@router.get("/dashboard", response_model=DashboardOut)
+def get_dashboard(
+    days: int = Query(365, ge=1, le=3660, description="Janela das séries, em dias"),
+    job_id: Optional[str] = Query(None, description="Inclui a série diária desta vaga"),
+    db: Session = Depends(get_db),
+):
+    """
+    Dashboard: contadores do painel e séries diárias lidas dos rollups
+    (services/rollups.py), atualizados em background a cada ROLLUP_INTERVAL.
+    Ainda não há equipes nem ordens de serviço no modelo: total_teams e
+    pending_os ficam em 0.
+    """
+    today = datetime.utcnow().date()
+    employees = db.scalar(select(func.count()).select_from(User).where(User.role == UserRole.FUNCIONARIO))
+    messages = db.scalar(
+        select(func.count()).select_from(ChatMessage).where(ChatMessage.created_at >= datetime.combine(today, time.min))
     )
+    return {
+        "total_employees": employees,
+        "total_teams": 0,
+        "pending_os": 0,
+        "messages_today": messages,
+        **read_series(db, today - timedelta(days=days - 1), job_id),
+    }
+
+
+@router.get("/scoring-queue", response_model=ScoringQueueOut)
+def get_scoring_queue_metrics(db: Session = Depends(get_db)):
+    """Profundidade e atraso da fila de score assíncrono"""
+    return queue_stats(db)
+
+
+@router.get("/chat-cache", response_model=ChatCacheOut)
+def get_chat_cache_metrics():
+    """Acertos/falhas do cache de respostas do chat (por processo)"""
+    return answer_cache.stats()
+
+
+@router.get("/auth-cache", response_model=AuthCacheOut)
+def get_auth_cache_metrics():
+    """Acertos/falhas do cache de usuários autenticados (por processo)"""
+    return user_cache.stats()
+
+
+@router.get("/chat-log", response_model=ChatLogOut)
+def get_chat_log_metrics():
+    """Mensagens do chat aguardando gravação, gravadas e descartadas (por processo)"""
+    return chat_log_buffer.stats()
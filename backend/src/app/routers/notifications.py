@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.orm import Session
 from app.db.session import get_db
+from app.core.pagination import PageParams, paginate
 from app.db.models import Notification
 from app.schemas.notifications import NotificationCreate, NotificationOut
 
@@ -8,8 +9,9 @@ router = APIRouter()
 
 
 @router.get("/user/{user_id}", response_model=list[NotificationOut])
-def list_notifications(user_id: str, db: Session = Depends(get_db)):
-    return db.query(Notification).filter(Notification.user_id == user_id).order_by(Notification.created_at.desc()).all()
+def list_notifications(user_id: str, response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    query = db.query(Notification).filter(Notification.user_id == user_id)
+    return paginate(query, response, page, Notification.created_at, Notification.id)
 
 
 @router.post("/", response_model=NotificationOut)
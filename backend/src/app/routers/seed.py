@@ -3,7 +3,13 @@ from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.db.models import User, Job, Candidate, Application, Document, UserRole, ApplicationStatus
 from app.services.ai_job_description import generate_full_job_description
-from app.services.ai_resume_match import compute_match_score, summarize_candidate
+from app.services.ai_resume_match import summarize_candidate
+from app.services.candidate_index import index_candidate
+from app.services.metrics import record_applications_created, record_candidates_changed, record_job_created
+from app.services.status_history import record_transitions
+from app.services.passages import store_passages
+from app.services.token_store import store_job_tokens, job_tokens
+from app.services.scoring import get_scorer, score_one
 from app.core.auth import hash_password
 
 router = APIRouter()
@@ -31,7 +37,9 @@ def seed(db: Session = Depends(get_db)):
     short = "Vaga para Backend Python com FastAPI e PostgreSQL"
     full = generate_full_job_description("Dev Backend Python", short)
     job = Job(title="Dev Backend Python", short_description=short, full_description=full, created_by=rh.id)
+    store_job_tokens(job)
     db.add(job)
+    record_job_created(db)
     db.commit()
     db.refresh(job)
 
@@ -47,13 +55,19 @@ def seed(db: Session = Depends(get_db)):
         resume_text="Java, Spring Boot, MySQL, microsserviços, mensageria, cloud."
     )
     db.add_all([c1, c2])
+    db.flush()
+    for c in [c1, c2]:
+        index_candidate(db, c)
+    record_candidates_changed(db, 2)
     db.commit()
     db.refresh(c1); db.refresh(c2)
 
     # applications com status
-    base_text = f"{job.title}\n{job.short_description}\n{job.full_description or ''}"
+    scorer = get_scorer()
+    jt = job_tokens(job)
+    apps = []
     for c in [c1, c2]:
-        score = compute_match_score(base_text, c.resume_text)
+        score = score_one(scorer, db, job.id, jt, c)
         summ = summarize_candidate(c.resume_text)
         app = Application(
             job_id=job.id,
@@ -62,7 +76,11 @@ def seed(db: Session = Depends(get_db)):
             summary=summ,
             status=ApplicationStatus.APLICADO
         )
-        db.add(app)
+        apps.append(app)
+    record_applications_created(db, [(a.job_id, a.status, a.match_score) for a in apps])
+    db.add_all(apps)
+    db.flush()
+    record_transitions(db, [(a.id, a.job_id, None, a.status) for a in apps])
     db.commit()
 
     # documents
@@ -71,6 +89,7 @@ def seed(db: Session = Depends(get_db)):
         content="O colaborador tem direito a 30 dias de férias por ano, após 12 meses trabalhados."
     )
     db.add(doc)
+    store_passages(db, doc)
     db.commit()
 
     return {"status": "seed_ok"}
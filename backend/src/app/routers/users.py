@@ -1,14 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app.db.session import get_db
+from app.core.pagination import PageParams, paginate
 from app.db.models import User
 from app.schemas.users import UserCreate, UserOut
 
 router = APIRouter()
 
 @router.get("/", response_model=list[UserOut])
-def list_users(db: Session = Depends(get_db)):
-    return db.query(User).all()
+def list_users(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return paginate(db.query(User), response, page, User.created_at, User.id)
 
 
 @router.post("/", response_model=UserOut)
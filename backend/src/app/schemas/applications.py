@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional
 
@@ -17,9 +17,43 @@ class ApplicationOut(BaseModel):
     candidate_id: str
     status: str
     match_score: float
+    score_status: str = "done"  # "pending" enquanto o worker não pontuou
     summary: Optional[str] = None
     created_at: datetime
     updated_at: datetime
 
     class Config:
         from_attributes = True
+
+
+class ApplicationStatusChangeOut(BaseModel):
+    from_status: Optional[str] = None  # None = candidatura criada
+    to_status: str
+    changed_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class RescoreOut(BaseModel):
+    job_id: Optional[str] = None
+    rescored: int
+
+
+class ApplicationBulkCreate(BaseModel):
+    items: list[ApplicationCreate] = Field(..., min_length=1, max_length=1000)
+
+
+class ApplicationBulkItemOut(BaseModel):
+    index: int
+    job_id: str
+    candidate_id: str
+    application_id: Optional[str] = None
+    match_score: Optional[float] = None
+    error: Optional[str] = None
+
+
+class ApplicationBulkOut(BaseModel):
+    created: int
+    failed: int
+    items: list[ApplicationBulkItemOut]
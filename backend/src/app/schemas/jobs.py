@@ -15,3 +15,26 @@ class JobOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class TopCandidateOut(BaseModel):
+    candidate_id: str
+    name: str
+    email: str
+    match_score: float
+
+
+class FunnelStageOut(BaseModel):
+    stage: str
+    reached: int
+    rejected: int
+    conversion_rate: float | None = None  # chegaram à próxima etapa / chegaram a esta
+    median_seconds_in_stage: float | None = None
+    samples: int
+
+
+class JobFunnelOut(BaseModel):
+    job_id: str
+    applications: int
+    overall_conversion_rate: float | None = None
+    stages: list[FunnelStageOut]
@@ -1,8 +1,39 @@
+import re
+from typing import Iterator
+
+from app.services.document_index import DocumentIndex
+
+NOT_FOUND_ANSWER = "Não encontrei essa informação nos documentos enviados. Tente reformular a pergunta."
+
+# Trechos com score abaixo desta fração do melhor não entram na resposta
+MIN_RELATIVE_SCORE = 0.5
+
+_PIECE_RE = re.compile(r"\S+\s*")
+
+
+def split_tokens(text: str) -> list[str]:
+    # Pedaços (palavra + espaço seguinte) enviados no streaming; "".join devolve o texto
+    return _PIECE_RE.findall(text)
+
+
+def stream_answer_from_passages(passages: list[tuple[str, str, float]]) -> Iterator[str]:
+    # passages: [(title, texto, score), ...] já ordenados pelo ranking.
+    # Gera a resposta aos pedaços; um backend generativo entra aqui.
+    if not passages:
+        yield NOT_FOUND_ANSWER
+        return
+    best = passages[0][2]
+    relevant = [(title, text) for title, text, score in passages if score >= best * MIN_RELATIVE_SCORE]
+    for i, (title, text) in enumerate(relevant):
+        yield f"Com base no documento '{title}': " if i == 0 else f"\n\nVeja também '{title}': "
+        yield from split_tokens(text)
+
+
+def answer_from_passages(passages: list[tuple[str, str, float]]) -> str:
+    return "".join(stream_answer_from_passages(passages))
+
+
 def answer_from_documents(question: str, documents: list[tuple[str, str]]) -> str:
     # documents: [(title, content), ...]
-    # MVP: pega o doc mais “provável” só por conter palavras
-    q = question.lower()
-    for title, content in documents:
-        if any(w in content.lower() for w in q.split()):
-            return f"Com base no documento '{title}': {content[:240]}..."
-    return "Não encontrei essa informação nos documentos enviados. Tente reformular a pergunta."
+    # Sem índice residente: divide em trechos e ranqueia na hora (BM25)
+    return answer_from_passages(DocumentIndex.from_documents(documents).search(question))
@@ -1,18 +1,33 @@
 import re
+from collections import Counter
+
+# Incrementar sempre que _tokenize mudar: tokens persistidos com versão
+# diferente são recalculados (ver services/token_store.py)
+TOKENIZER_VERSION = 1
+
+_TOKEN_RE = re.compile(r"[a-zA-ZÀ-ÿ0-9\+\.\#]+")
 
 def _tokenize(text: str) -> set[str]:
-    words = re.findall(r"[a-zA-ZÀ-ÿ0-9\+\.\#]+", text.lower())
+    words = _TOKEN_RE.findall(text.lower())
     return set(words)
 
-def compute_match_score(job_text: str, resume_text: str) -> float:
-    # MVP simples: similaridade por interseção de tokens (rápido e gratuito)
-    jt = _tokenize(job_text)
-    rt = _tokenize(resume_text)
+def token_counts(text: str) -> Counter:
+    # Mesmos tokens de _tokenize, com frequência (usado pelo BM25)
+    return Counter(_TOKEN_RE.findall(text.lower()))
+
+def job_match_text(title: str, short_description: str, full_description: str | None) -> str:
+    return f"{title}\n{short_description}\n{full_description or ''}"
+
+def match_score_from_tokens(jt: set[str], rt: set[str]) -> float:
     if not jt or not rt:
         return 0.0
     score = len(jt & rt) / len(jt | rt)
     return float(round(score, 4))
 
+def compute_match_score(job_text: str, resume_text: str) -> float:
+    # MVP simples: similaridade por interseção de tokens (rápido e gratuito)
+    return match_score_from_tokens(_tokenize(job_text), _tokenize(resume_text))
+
 def summarize_candidate(resume_text: str) -> str:
     # MVP: “resumo” simples. Depois liga em LLM.
     snippet = resume_text.strip().replace("\n", " ")
@@ -0,0 +1,80 @@
+"""
+Cache de respostas do chat de RH.
+
+A chave é a pergunta normalizada (sem diferença de caixa, acentos,
+espaços e pontuação final) mais a versão do índice de documentos: quando
+create_document (ou a sincronização com outro worker) muda os trechos, a
+versão muda e as respostas antigas deixam de ser encontradas, saindo pelo
+LRU. Cada entrada também expira após o TTL.
+"""
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+from app.core.config import settings
+
+_TRAILING_PUNCTUATION = "?!.;: "
+
+
+def normalize_question(question: str) -> str:
+    """'  Quantos dias de FÉRIAS?? ' -> 'quantos dias de ferias'"""
+    text = unicodedata.normalize("NFKD", question.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(text.split()).rstrip(_TRAILING_PUNCTUATION)
+
+
+class AnswerCache:
+    def __init__(self, maxsize: int | None = None, ttl: float | None = None):
+        self.maxsize = settings.chat_cache_size if maxsize is None else maxsize
+        self.ttl = settings.chat_cache_ttl if ttl is None else ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, int], tuple[float, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def get(self, question: str, corpus_version: int) -> str | None:
+        key = (normalize_question(question), corpus_version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, question: str, corpus_version: int, answer: str) -> None:
+        if self.maxsize <= 0:
+            return
+        key = (normalize_question(question), corpus_version)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, answer)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+answer_cache = AnswerCache()
@@ -0,0 +1,101 @@
+"""
+Motor de score em lote: Jaccard para milhares de pares (vaga, currículo) de uma vez.
+
+Os tokens viram ids inteiros e cada conjunto vira uma linha de uma matriz
+esparsa binária em formato CSR (indptr/indices), montada direto com NumPy.
+A interseção de uma vaga com N currículos é uma soma por segmento de uma
+máscara booleana indexada pelos ids — sem laços Python por par.
+"""
+from itertools import chain
+
+import numpy as np
+from app.services.ai_resume_match import _tokenize
+
+
+class TokenVocabulary:
+    """Mapeia tokens para ids inteiros densos (0..V-1)"""
+
+    def __init__(self):
+        self._ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def flat_ids(self, token_sets: list[set[str]], total: int) -> np.ndarray:
+        """Ids de todos os tokens dos conjuntos, concatenados na ordem"""
+        ids = self._ids
+        new = set().union(*token_sets) - ids.keys()
+        ids.update(zip(new, range(len(ids), len(ids) + len(new))))
+        return np.fromiter(map(ids.__getitem__, chain.from_iterable(token_sets)), dtype=np.int64, count=total)
+
+
+class TokenMatrix:
+    """Conjuntos de tokens em CSR: linha i = indices[indptr[i]:indptr[i+1]]"""
+
+    def __init__(self, token_sets: list[set[str]], vocab: TokenVocabulary):
+        lengths = np.fromiter(map(len, token_sets), dtype=np.int64, count=len(token_sets))
+        self.indptr = np.zeros(len(token_sets) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.indptr[1:])
+        self.indices = vocab.flat_ids(token_sets, int(self.indptr[-1]))
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def gather(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Concatena as linhas pedidas; retorna (indices, indptr) do recorte"""
+        starts = self.indptr[rows]
+        lens = self.indptr[rows + 1] - starts
+        out_ptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lens, out=out_ptr[1:])
+        pos = np.arange(out_ptr[-1], dtype=np.int64) - np.repeat(out_ptr[:-1] - starts, lens)
+        return self.indices[pos], out_ptr
+
+
+def jaccard_pairs(
+    job_sets: list[set[str]],
+    resume_sets: list[set[str]],
+    job_idx: np.ndarray,
+    resume_idx: np.ndarray,
+) -> np.ndarray:
+    """
+    Jaccard de cada par (job_sets[job_idx[i]], resume_sets[resume_idx[i]]).
+    Resultado arredondado como em compute_match_score.
+    """
+    job_idx = np.asarray(job_idx, dtype=np.int64)
+    resume_idx = np.asarray(resume_idx, dtype=np.int64)
+
+    vocab = TokenVocabulary()
+    jobs = TokenMatrix(job_sets, vocab)
+    resumes = TokenMatrix(resume_sets, vocab)
+
+    inter = np.zeros(len(job_idx), dtype=np.int64)
+    mask = np.zeros(len(vocab), dtype=bool)
+
+    # Uma passada vetorizada por vaga distinta, cobrindo todos os seus currículos
+    order = np.argsort(job_idx, kind="stable")
+    bounds = np.flatnonzero(np.diff(job_idx[order])) + 1
+    for group in np.split(order, bounds):
+        if not len(group):
+            continue
+        job_tokens = jobs.indices[jobs.indptr[job_idx[group[0]]]:jobs.indptr[job_idx[group[0]] + 1]]
+        mask[job_tokens] = True
+        tokens, ptr = resumes.gather(resume_idx[group])
+        hits = np.concatenate(([0], np.cumsum(mask[tokens], dtype=np.int64)))
+        inter[group] = hits[ptr[1:]] - hits[ptr[:-1]]
+        mask[job_tokens] = False
+
+    union = jobs.lengths[job_idx] + resumes.lengths[resume_idx] - inter
+    scores = np.divide(inter, union, out=np.zeros(len(inter), dtype=np.float64), where=union > 0)
+    return np.round(scores, 4)
+
+
+def score_pairs(job_texts: list[str], resume_texts: list[str], job_idx, resume_idx) -> np.ndarray:
+    """Tokeniza cada texto uma única vez e pontua todos os pares em lote"""
+    return jaccard_pairs(
+        [_tokenize(t) for t in job_texts],
+        [_tokenize(t) for t in resume_texts],
+        job_idx,
+        resume_idx,
+    )
+
@@ -0,0 +1,106 @@
+"""
+Índice invertido persistente (token -> candidatos) sobre Candidate.resume_text.
+
+Permite ranquear candidatos para uma vaga lendo só as posting lists dos
+tokens da vaga, em vez de pontuar todos os currículos um a um.
+"""
+from sqlalchemy import select, delete, insert, update, func, cast, Float
+from sqlalchemy.orm import Session
+from app.db.models import Candidate, CandidateToken
+from app.services.ai_resume_match import token_counts
+from app.services.token_store import MAX_TOKEN_LENGTH, store_candidate_tokens
+from app.services.minhash import index_candidate_minhash, unindex_candidate_minhash
+from app.services.corpus_stats import add_terms, remove_terms, adjust_corpus
+from app.services.vocabulary import vocabulary
+
+
+def index_candidate(db: Session, cand: Candidate) -> None:
+    """
+    (Re)indexa o currículo do candidato de forma incremental:
+    atualiza os tokens persistidos, só remove/insere/atualiza as postings
+    que mudaram e aplica os deltas nas estatísticas do BM25. Também mantém
+    a assinatura MinHash/LSH e dá id no vocabulário aos tokens novos. Não
+    faz commit.
+    """
+    if cand.id is None:
+        db.flush()
+
+    counts = token_counts(cand.resume_text or "")
+    store_candidate_tokens(cand, set(counts))
+    counts = {t: n for t, n in counts.items() if len(t) <= MAX_TOKEN_LENGTH}
+
+    current = dict(db.execute(
+        select(CandidateToken.token, CandidateToken.tf).where(CandidateToken.candidate_id == cand.id)
+    ).all())
+
+    removed = current.keys() - counts.keys()
+    added = counts.keys() - current.keys()
+    changed = [t for t in counts.keys() & current.keys() if counts[t] != current[t]]
+    if removed:
+        db.execute(
+            delete(CandidateToken).where(
+                CandidateToken.candidate_id == cand.id,
+                CandidateToken.token.in_(removed),
+            )
+        )
+    if added:
+        db.execute(insert(CandidateToken), [{"token": t, "candidate_id": cand.id, "tf": counts[t]} for t in added])
+        vocabulary.resolve(db, added)
+    if changed:
+        db.execute(update(CandidateToken), [{"token": t, "candidate_id": cand.id, "tf": counts[t]} for t in changed])
+
+    add_terms(db, added)
+    remove_terms(db, removed)
+    doc_length = sum(counts.values())
+    adjust_corpus(db, docs=1 if cand.doc_length is None else 0, length=doc_length - (cand.doc_length or 0))
+
+    cand.doc_length = doc_length
+    cand.token_count = len(counts)
+    index_candidate_minhash(db, cand, set(counts))
+
+
+def unindex_candidate(db: Session, cand: Candidate) -> None:
+    """Remove o candidato do índice e das estatísticas (antes de apagá-lo). Não faz commit."""
+    tokens = list(db.scalars(select(CandidateToken.token).where(CandidateToken.candidate_id == cand.id)))
+    db.execute(delete(CandidateToken).where(CandidateToken.candidate_id == cand.id))
+    remove_terms(db, tokens)
+    if cand.doc_length is not None:
+        adjust_corpus(db, docs=-1, length=-cand.doc_length)
+
+    cand.doc_length = None
+    cand.token_count = 0
+    unindex_candidate_minhash(db, cand)
+
+
+def top_candidates(db: Session, job_tokens: set[str], k: int = 10) -> list[dict]:
+    """
+    Retorna os k candidatos com maior Jaccard contra os tokens da vaga.
+    A interseção vem de um GROUP BY sobre as postings dos tokens da vaga
+    e a união é |vaga| + |currículo| - interseção.
+    """
+    job_tokens = {t for t in job_tokens if len(t) <= MAX_TOKEN_LENGTH}
+    if not job_tokens:
+        return []
+
+    postings = (
+        select(CandidateToken.candidate_id, func.count().label("inter"))
+        .where(CandidateToken.token.in_(job_tokens))
+        .group_by(CandidateToken.candidate_id)
+        .subquery()
+    )
+    score = (
+        cast(postings.c.inter, Float)
+        / (len(job_tokens) + Candidate.token_count - postings.c.inter)
+    ).label("score")
+
+    rows = db.execute(
+        select(Candidate.id, Candidate.name, Candidate.email, score)
+        .join(postings, postings.c.candidate_id == Candidate.id)
+        .order_by(score.desc(), Candidate.id)
+        .limit(k)
+    ).all()
+
+    return [
+        {"candidate_id": r.id, "name": r.name, "email": r.email, "match_score": round(float(r.score), 4)}
+        for r in rows
+    ]
@@ -0,0 +1,200 @@
+"""
+Gravação das mensagens do chat (ChatMessage), com write-behind opcional.
+
+CHAT_LOG_MODE=sync mantém o comportamento original: INSERT + commit na
+própria requisição. Em "buffered" a mensagem entra num buffer limitado em
+memória e uma thread grava em lote (um INSERT executemany por lote) quando
+o buffer atinge CHAT_LOG_FLUSH_SIZE ou a cada CHAT_LOG_FLUSH_INTERVAL; o
+lifespan da API força um flush final no shutdown.
+
+Durabilidade: no modo buffered um crash do processo perde o que ainda não
+foi gravado (no máximo o intervalo de flush). Com o buffer cheio,
+CHAT_LOG_OVERFLOW decide entre gravar na requisição ("flush", sem perda
+enquanto o banco aceitar a gravação) e descartar a mensagem ("drop"). Em
+ambos o buffer nunca passa de CHAT_LOG_BUFFER_SIZE: se o flush na
+requisição falhar, a mensagem é descartada. Descartes contam em dropped.
+
+Um lote que falha é regravado linha a linha: as linhas que o banco
+rejeita (ex.: user_id inexistente, com FK) são descartadas e o resto é
+gravado, para uma mensagem inválida não travar o buffer. Só um erro que
+não seja da linha (banco fora do ar) devolve o lote ao buffer.
+"""
+import logging
+import threading
+import uuid
+from collections import deque
+from datetime import datetime
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.models import ChatMessage
+
+logger = logging.getLogger(__name__)
+
+
+class ChatLogBuffer:
+    def __init__(
+        self,
+        capacity: int | None = None,
+        flush_size: int | None = None,
+        flush_interval: float | None = None,
+        overflow: str | None = None,
+    ):
+        self.capacity = capacity or settings.chat_log_buffer_size
+        self.flush_size = flush_size or settings.chat_log_flush_size
+        self.flush_interval = settings.chat_log_flush_interval if flush_interval is None else flush_interval
+        self.overflow = overflow or settings.chat_log_overflow
+        self._rows: deque[dict] = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.flushed = 0
+        self.dropped = 0
+        self.flush_errors = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="chat-log-flusher", daemon=True)
+                self._thread.start()
+
+    def stop(self) -> None:
+        """Para a thread e grava o que restou no buffer"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def add(self, row: dict) -> bool:
+        """Enfileira a linha; False se ela foi descartada (buffer cheio e sem espaço após o overflow)"""
+        self.start()
+        with self._lock:
+            full = len(self._rows) >= self.capacity
+            if not full:
+                self._rows.append(row)
+                if len(self._rows) >= self.flush_size:
+                    self._wake.set()
+                return True
+        if self.overflow == "drop":
+            with self._lock:
+                self.dropped += 1
+            return False
+        # overflow=flush: esvazia o buffer na requisição e tenta de novo
+        self.flush()
+        with self._lock:
+            # O flush pode ter falhado (lote devolvido) ou outras requisições
+            # podem ter enchido o buffer de novo
+            if len(self._rows) >= self.capacity:
+                self.dropped += 1
+                return False
+            self._rows.append(row)
+        return True
+
+    def flush(self) -> int:
+        """Grava tudo o que está no buffer, em lotes de flush_size"""
+        from app.db import session as db_session
+
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = [self._rows.popleft() for _ in range(min(self.flush_size, len(self._rows)))]
+                if not batch:
+                    return written
+                db = db_session.SessionLocal()
+                try:
+                    db.execute(insert(ChatMessage), batch)
+                    db.commit()
+                    saved = len(batch)
+                except Exception:
+                    db.rollback()
+                    logger.exception("Falha ao gravar %d mensagens do chat; gravando uma a uma", len(batch))
+                    with self._lock:
+                        self.flush_errors += 1
+                    saved, pending = self._write_each(db, batch)
+                    if pending:
+                        # Banco indisponível: devolve o resto ao início do buffer para a próxima tentativa
+                        with self._lock:
+                            self.flushed += saved
+                            room = self.capacity - len(self._rows)
+                            self._rows.extendleft(reversed(pending[:max(room, 0)]))
+                            self.dropped += max(len(pending) - room, 0)
+                        return written + saved
+                finally:
+                    db.close()
+                written += saved
+                with self._lock:
+                    self.flushed += saved
+
+    def _write_each(self, db: Session, batch: list[dict]) -> tuple[int, list[dict]]:
+        """
+        Grava as linhas de um lote que falhou uma a uma. Linhas rejeitadas
+        pelo banco (FK, tamanho...) são descartadas e contadas; qualquer
+        outro erro interrompe e devolve as linhas ainda não gravadas.
+        """
+        saved = 0
+        for i, row in enumerate(batch):
+            try:
+                db.execute(insert(ChatMessage), [row])
+                db.commit()
+                saved += 1
+            except (IntegrityError, DataError):
+                db.rollback()
+                logger.warning("Mensagem do chat descartada (rejeitada pelo banco): %s", row.get("id"))
+                with self._lock:
+                    self.dropped += 1
+            except Exception:
+                db.rollback()
+                logger.exception("Falha ao gravar mensagens do chat")
+                return saved, batch[i:]
+        return saved, []
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._rows:
+                self.flush()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "mode": settings.chat_log_mode,
+                "buffered": len(self._rows),
+                "capacity": self.capacity,
+                "flushed": self.flushed,
+                "dropped": self.dropped,
+                "flush_errors": self.flush_errors,
+            }
+
+
+chat_log_buffer = ChatLogBuffer()
+
+
+def log_chat_message(db: Session, user_id: str, question: str, answer: str) -> str:
+    """Registra a pergunta/resposta conforme CHAT_LOG_MODE e devolve o id da mensagem"""
+    if settings.chat_log_mode != "buffered":
+        msg = ChatMessage(user_id=user_id, question=question, answer=answer)
+        db.add(msg)
+        db.commit()
+        return msg.id
+
+    row = {
+        "id": str(uuid.uuid4()),
+        "user_id": user_id,
+        "question": question,
+        "answer": answer,
+        "created_at": datetime.utcnow(),
+    }
+    chat_log_buffer.add(row)
+    return row["id"]
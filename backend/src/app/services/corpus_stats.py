@@ -0,0 +1,89 @@
+"""
+Estatísticas da base de currículos para o BM25, mantidas incrementalmente.
+
+term_stats guarda o df de cada token e corpus_stats (linha única) o número
+de documentos e a soma dos tamanhos. index_candidate/unindex_candidate
+aplicam só os deltas de cada escrita; nenhuma consulta recalcula sobre a
+base inteira.
+"""
+import math
+
+from sqlalchemy import select, update, delete
+from sqlalchemy.orm import Session
+from app.db.models import TermStat, CorpusStat
+
+_CHUNK = 500
+
+
+def _dialect_insert(db: Session):
+    """insert com suporte a ON CONFLICT para o dialeto atual (ou None)"""
+    name = db.get_bind().dialect.name
+    if name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+        return insert
+    if name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+        return insert
+    return None
+
+
+def add_terms(db: Session, tokens) -> None:
+    """df += 1 para cada token (cria a linha se ainda não existir)"""
+    tokens = list(tokens)
+    if not tokens:
+        return
+    insert = _dialect_insert(db)
+    for i in range(0, len(tokens), _CHUNK):
+        chunk = tokens[i:i + _CHUNK]
+        if insert is not None:
+            stmt = insert(TermStat).values([{"token": t, "df": 1} for t in chunk])
+            db.execute(stmt.on_conflict_do_update(index_elements=[TermStat.token], set_={"df": TermStat.df + 1}))
+            continue
+        existing = set(db.scalars(select(TermStat.token).where(TermStat.token.in_(chunk))))
+        if existing:
+            db.execute(update(TermStat).where(TermStat.token.in_(existing)).values(df=TermStat.df + 1))
+        db.add_all(TermStat(token=t, df=1) for t in chunk if t not in existing)
+
+
+def remove_terms(db: Session, tokens) -> None:
+    """df -= 1 para cada token; linhas que chegam a zero são apagadas"""
+    tokens = list(tokens)
+    for i in range(0, len(tokens), _CHUNK):
+        chunk = tokens[i:i + _CHUNK]
+        db.execute(update(TermStat).where(TermStat.token.in_(chunk)).values(df=TermStat.df - 1))
+        db.execute(delete(TermStat).where(TermStat.token.in_(chunk), TermStat.df <= 0))
+
+
+def adjust_corpus(db: Session, docs: int, length: int) -> None:
+    if not docs and not length:
+        return
+    insert = _dialect_insert(db)
+    if insert is not None:
+        stmt = insert(CorpusStat).values(id=1, doc_count=docs, total_length=length)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[CorpusStat.id],
+            set_={"doc_count": CorpusStat.doc_count + docs, "total_length": CorpusStat.total_length + length},
+        ))
+        return
+    if db.execute(
+        update(CorpusStat).where(CorpusStat.id == 1).values(
+            doc_count=CorpusStat.doc_count + docs, total_length=CorpusStat.total_length + length,
+        )
+    ).rowcount == 0:
+        db.add(CorpusStat(id=1, doc_count=docs, total_length=length))
+
+
+def corpus_size(db: Session) -> tuple[int, float]:
+    """(número de documentos, tamanho médio)"""
+    row = db.get(CorpusStat, 1)
+    if not row or not row.doc_count:
+        return 0, 0.0
+    return row.doc_count, row.total_length / row.doc_count
+
+
+def idf_weights(db: Session, tokens: set[str], doc_count: int) -> dict[str, float]:
+    """idf (variante BM25+ sempre positiva) dos tokens presentes na base"""
+    if not tokens or not doc_count:
+        return {}
+    dfs = db.execute(select(TermStat.token, TermStat.df).where(TermStat.token.in_(tokens), TermStat.df > 0))
+    return {t: math.log(1 + (doc_count - df + 0.5) / (df + 0.5)) for t, df in dfs}
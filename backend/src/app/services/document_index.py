@@ -0,0 +1,144 @@
+"""
+Índice de trechos de documentos residente para o chat de RH.
+
+Mantém em memória, entre requisições, um índice invertido token -> trechos
+(document_passages) e ranqueia os trechos com BM25. O chat consulta só o
+índice; o banco é lido uma vez na carga inicial e, depois, só os trechos
+de documentos criados desde a última sincronização (marca d'água em
+Document.created_at). Assim um documento criado por outro worker uvicorn
+também aparece aqui.
+
+Para a latência não crescer com a base, cada token percorre no máximo
+CHAMPION_LIST_SIZE postings: as de maior peso BM25 do termo (tf alto em
+trecho curto), calculadas sob demanda e descartadas quando o termo ganha
+postings novas. Tokens muito comuns ("de", "o") custam o mesmo que raros.
+"""
+import heapq
+import math
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.db.models import Document, DocumentPassage
+from app.services.ai_resume_match import _TOKEN_RE
+from app.services.passages import chunk_text
+
+# Relê uma pequena janela antes da marca d'água: um documento de outro
+# worker pode ter created_at anterior à marca e commit posterior
+SYNC_MARGIN = timedelta(seconds=5)
+CHAMPION_LIST_SIZE = 500
+
+
+class DocumentIndex:
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        self._passages: list[tuple[str, str, int]] = []  # (título, texto, nº de tokens)
+        self._ids: set[int] = set()
+        self._postings: dict[str, list[tuple[int, int]]] = {}  # token -> [(posição, tf)]
+        self._champions: dict[str, list[tuple[int, int]]] = {}
+        self._total_length = 0
+        self._watermark: datetime | None = None
+        self._loaded = False
+        # Muda sempre que o conjunto de trechos muda (chave do cache de respostas)
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._passages)
+
+    @classmethod
+    def from_documents(cls, documents: list[tuple[str, str]]) -> "DocumentIndex":
+        """Índice avulso (sem banco) sobre [(title, content), ...]"""
+        index = cls()
+        passage_id = 0
+        for title, content in documents:
+            for text in chunk_text(content):
+                index._add(passage_id, title, text)
+                passage_id += 1
+        index._loaded = True
+        return index
+
+    def _add(self, passage_id: int, title: str, text: str) -> None:
+        if passage_id in self._ids:
+            return
+        counts = Counter(_TOKEN_RE.findall(text.lower()))
+        length = sum(counts.values())
+        pos = len(self._passages)
+        self._passages.append((title, text, length))
+        self._ids.add(passage_id)
+        self._total_length += length
+        for token, tf in counts.items():
+            self._postings.setdefault(token, []).append((pos, tf))
+            self._champions.pop(token, None)
+
+    def _champion_list(self, term: str, avgdl: float) -> list[tuple[int, int]]:
+        postings = self._postings[term]
+        if len(postings) <= CHAMPION_LIST_SIZE:
+            return postings
+        champions = self._champions.get(term)
+        if champions is None:
+            champions = heapq.nlargest(
+                CHAMPION_LIST_SIZE,
+                postings,
+                key=lambda p: p[1] / (p[1] + self.k1 * (1 - self.b + self.b * self._passages[p[0]][2] / avgdl)),
+            )
+            self._champions[term] = champions
+        return champions
+
+    def add(self, doc: Document, passages: list[DocumentPassage]) -> None:
+        """Indexa um documento recém-criado neste processo (sem mexer na marca d'água)"""
+        with self._lock:
+            self.version += 1
+            if self._loaded:
+                for passage in passages:
+                    self._add(passage.id, doc.title, passage.content)
+
+    def sync(self, db: Session, chunk_size: int = 1000) -> int:
+        """Indexa os trechos dos documentos criados desde a última sincronização"""
+        query = (
+            select(DocumentPassage.id, DocumentPassage.content, Document.title, Document.created_at)
+            .join(Document, Document.id == DocumentPassage.document_id)
+        )
+        if self._watermark is not None:
+            query = query.where(Document.created_at >= self._watermark - SYNC_MARGIN)
+        query = query.order_by(Document.created_at, DocumentPassage.document_id, DocumentPassage.position)
+
+        added = 0
+        with self._lock:
+            for row in db.execute(query.execution_options(yield_per=chunk_size)):
+                if row.id not in self._ids:
+                    self._add(row.id, row.title, row.content)
+                    added += 1
+                self._watermark = row.created_at
+            self._loaded = True
+            if added:
+                self.version += 1
+        return added
+
+    def search(self, question: str, k: int = 3) -> list[tuple[str, str, float]]:
+        """Os k trechos com maior BM25 para a pergunta: (título, texto, score)"""
+        n = len(self._passages)
+        terms = {t for t in _TOKEN_RE.findall(question.lower()) if t in self._postings}
+        if not terms:
+            return []
+
+        avgdl = self._total_length / n
+        scores: dict[int, float] = {}
+        for term in terms:
+            df = len(self._postings[term])
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for pos, tf in self._champion_list(term, avgdl):
+                norm = 1 - self.b + self.b * self._passages[pos][2] / avgdl
+                scores[pos] = scores.get(pos, 0.0) + idf * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+
+        top = heapq.nsmallest(k, scores.items(), key=lambda kv: (-kv[1], kv[0]))
+        return [(self._passages[pos][0], self._passages[pos][1], score) for pos, score in top]
+
+
+document_index = DocumentIndex()
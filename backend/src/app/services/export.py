@@ -0,0 +1,98 @@
+"""
+Exportação em streaming (CSV ou NDJSON) de candidaturas e candidatos.
+
+As linhas vêm do banco em lotes de EXPORT_BATCH_SIZE com yield_per (no
+Postgres, cursor do lado do servidor via stream_results) e cada lote é
+serializado e enviado antes de buscar o próximo. A memória fica no
+tamanho de um lote, seja a exportação de 100 ou de 1M linhas.
+
+Cada gerador abre a própria sessão: a do Depends(get_db) não vive até o
+fim do streaming.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import select
+
+from app.db import session as db_session
+from app.db.models import Application, Candidate, Job
+
+EXPORT_BATCH_SIZE = 1000
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+APPLICATION_COLUMNS = (
+    Application.id,
+    Application.job_id,
+    Job.title.label("job_title"),
+    Application.candidate_id,
+    Candidate.name.label("candidate_name"),
+    Candidate.email.label("candidate_email"),
+    Application.status,
+    Application.match_score,
+    Application.created_at,
+    Application.updated_at,
+)
+CANDIDATE_COLUMNS = (Candidate.id, Candidate.name, Candidate.email, Candidate.cv_url, Candidate.created_at)
+
+
+def applications_query(job_id: str | None = None):
+    query = (
+        select(*APPLICATION_COLUMNS)
+        .join(Job, Job.id == Application.job_id)
+        .join(Candidate, Candidate.id == Application.candidate_id)
+    )
+    if job_id:
+        # Mesma ordem do ranking da vaga (índice job_id, match_score, id)
+        return query.where(Application.job_id == job_id).order_by(Application.match_score.desc(), Application.id.desc())
+    return query.order_by(Application.created_at.desc(), Application.id.desc())
+
+
+def candidates_query(include_resume: bool = False):
+    columns = CANDIDATE_COLUMNS + ((Candidate.resume_text,) if include_resume else ())
+    return select(*columns).order_by(Candidate.created_at.desc(), Candidate.id.desc())
+
+
+def _plain(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _csv_cell(value):
+    value = _plain(value)
+    # Texto começando com = + - @ vira fórmula na planilha; o apóstrofo desarma
+    if isinstance(value, str) and value[:1] in ("=", "+", "-", "@"):
+        return "'" + value
+    return value
+
+
+def stream_rows(query, fmt: str, batch_size: int = EXPORT_BATCH_SIZE):
+    """Gera o arquivo (CSV com cabeçalho ou NDJSON) lote a lote"""
+    db = db_session.SessionLocal()
+    try:
+        result = db.execute(query.execution_options(yield_per=batch_size))
+        names = list(result.keys())
+        buffer = io.StringIO()
+        writer = csv.writer(buffer) if fmt == "csv" else None
+        if writer:
+            writer.writerow(names)
+
+        for batch in result.partitions():
+            for row in batch:
+                if writer:
+                    writer.writerow([_csv_cell(v) for v in row])
+                else:
+                    buffer.write(json.dumps({k: _plain(v) for k, v in zip(names, row)}, ensure_ascii=False))
+                    buffer.write("\n")
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+    finally:
+        db.close()
@@ -0,0 +1,195 @@
+"""
+Métricas gerais do RH (GET /api/metrics/).
+
+METRICS_MODE=query: uma única consulta agregada por leitura (GROUP BY
+status sobre applications com contagem e soma dos scores, mais contagens
+de vagas, candidatos e vagas com candidaturas).
+
+METRICS_MODE=counters: a leitura é O(1), só as linhas de metric_counters.
+Cada escrita aplica seus deltas na mesma transação (record_* abaixo):
+vaga/candidato criados, candidaturas criadas, mudança de status, score
+gravado pelo worker assíncrono ou pelo rescore. Em modo query as funções
+record_* não fazem nada, para não haver linhas quentes disputadas à toa.
+active_jobs sai de job_application_counts: o upsert da linha da vaga
+devolve o total (RETURNING) e a vaga conta como nova só para a transação
+que a levou de 0 ao seu delta. A linha fica travada até o commit, então
+duas primeiras candidaturas concorrentes na mesma vaga não a contam duas
+vezes.
+Ao ligar o modo counters numa base existente a aplicação reconstrói a
+tabela na subida (se estiver vazia); rebuild_metric_counters também
+corrige eventuais desvios.
+"""
+from sqlalchemy import delete, func, null, select, union_all, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models import Application, ApplicationStatus, Candidate, Job, JobApplicationCount, MetricCounter
+from app.services.corpus_stats import _dialect_insert
+
+JOBS = "jobs"
+CANDIDATES = "candidates"
+APPLICATIONS = "applications"
+ACTIVE_JOBS = "active_jobs"  # vagas com ao menos uma candidatura
+SCORE_SUM = "score_sum"
+STATUS_PREFIX = "status:"
+
+
+def counters_enabled() -> bool:
+    return settings.metrics_mode == "counters"
+
+
+def aggregate_counters(db: Session) -> dict[str, float]:
+    """
+    Os mesmos contadores de metric_counters, calculados numa consulta só:
+    GROUP BY status (varre o índice de cobertura status, match_score) mais
+    uma linha de totais com status NULL, que existe mesmo sem candidaturas.
+    """
+    by_status = (
+        select(Application.status, func.count(), func.sum(Application.match_score), null())
+        .group_by(Application.status)
+    )
+    totals = select(
+        null(),
+        select(func.count()).select_from(Job).scalar_subquery(),
+        select(func.count()).select_from(Candidate).scalar_subquery(),
+        select(func.count(Application.job_id.distinct())).scalar_subquery(),
+    )
+    # by_status primeiro: os tipos das colunas (Enum do status) vêm dele
+    rows = db.execute(union_all(by_status, totals)).all()
+
+    counters = {JOBS: 0, CANDIDATES: 0, APPLICATIONS: 0, ACTIVE_JOBS: 0, SCORE_SUM: 0.0}
+    counters.update({STATUS_PREFIX + s.value: 0 for s in ApplicationStatus})
+    for status, a, b, c in rows:
+        if status is None:
+            counters.update({JOBS: int(a), CANDIDATES: int(b), ACTIVE_JOBS: int(c)})
+        else:
+            counters[STATUS_PREFIX + ApplicationStatus(status).value] = a
+            counters[APPLICATIONS] += a
+            counters[SCORE_SUM] += b or 0.0
+    return counters
+
+
+def _to_metrics(counters: dict[str, float]) -> dict:
+    total_applications = int(counters.get(APPLICATIONS, 0))
+    score_sum = counters.get(SCORE_SUM, 0.0)
+    return {
+        "total_jobs": int(counters.get(JOBS, 0)),
+        "active_jobs": int(counters.get(ACTIVE_JOBS, 0)),
+        "total_candidates": int(counters.get(CANDIDATES, 0)),
+        "total_applications": total_applications,
+        "applications_by_status": {
+            s.value: int(counters.get(STATUS_PREFIX + s.value, 0)) for s in ApplicationStatus
+        },
+        "avg_match_score": round(score_sum / total_applications, 2) if total_applications else 0.0,
+    }
+
+
+def read_metrics(db: Session) -> dict:
+    if counters_enabled():
+        counters = {row.name: row.value for row in db.scalars(select(MetricCounter))}
+    else:
+        counters = aggregate_counters(db)
+    return _to_metrics(counters)
+
+
+def rebuild_metric_counters(db: Session) -> None:
+    """Recalcula metric_counters a partir das tabelas. Não faz commit."""
+    counters = aggregate_counters(db)
+    db.execute(delete(MetricCounter))
+    db.execute(MetricCounter.__table__.insert(), [{"name": k, "value": v} for k, v in counters.items()])
+    db.execute(delete(JobApplicationCount))
+    db.execute(JobApplicationCount.__table__.insert().from_select(
+        ["job_id", "applications"],
+        select(Application.job_id, func.count()).group_by(Application.job_id),
+    ))
+
+
+def ensure_metric_counters(db: Session) -> None:
+    """Na subida, em modo counters: preenche a tabela se ainda estiver vazia"""
+    if counters_enabled() and db.scalar(select(func.count()).select_from(MetricCounter)) == 0:
+        rebuild_metric_counters(db)
+        db.commit()
+
+
+def apply_deltas(db: Session, deltas: dict[str, float]) -> None:
+    """Soma os deltas aos contadores (upsert, na transação da sessão). Não faz commit."""
+    deltas = {name: value for name, value in deltas.items() if value}
+    if not deltas or not counters_enabled():
+        return
+    insert = _dialect_insert(db)
+    # Ordem fixa: duas transações nunca travam os mesmos contadores em ordem inversa
+    names = sorted(deltas)
+    if insert is not None:
+        stmt = insert(MetricCounter).values([{"name": name, "value": deltas[name]} for name in names])
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[MetricCounter.name],
+            set_={"value": MetricCounter.value + stmt.excluded.value},
+        ))
+        return
+    for name in names:
+        result = db.execute(
+            update(MetricCounter).where(MetricCounter.name == name).values(value=MetricCounter.value + deltas[name])
+        )
+        if not result.rowcount:
+            db.execute(MetricCounter.__table__.insert().values(name=name, value=deltas[name]))
+
+
+def record_job_created(db: Session) -> None:
+    apply_deltas(db, {JOBS: 1})
+
+
+def record_candidates_changed(db: Session, delta: int) -> None:
+    apply_deltas(db, {CANDIDATES: delta})
+
+
+def _add_job_applications(db: Session, per_job: dict[str, int]) -> int:
+    """Soma candidaturas por vaga em job_application_counts; retorna quantas vagas saíram de zero"""
+    insert = _dialect_insert(db)
+    job_ids = sorted(per_job)  # mesma ordem de travamento em todas as transações
+    if insert is not None:
+        stmt = insert(JobApplicationCount).values([{"job_id": j, "applications": per_job[j]} for j in job_ids])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobApplicationCount.job_id],
+            set_={"applications": JobApplicationCount.applications + stmt.excluded.applications},
+        ).returning(JobApplicationCount.job_id, JobApplicationCount.applications)
+        return sum(1 for job_id, total in db.execute(stmt) if total == per_job[job_id])
+    activated = 0
+    for job_id in job_ids:
+        result = db.execute(
+            update(JobApplicationCount)
+            .where(JobApplicationCount.job_id == job_id)
+            .values(applications=JobApplicationCount.applications + per_job[job_id])
+        )
+        if not result.rowcount:
+            db.execute(JobApplicationCount.__table__.insert().values(job_id=job_id, applications=per_job[job_id]))
+            activated += 1
+    return activated
+
+
+def record_applications_created(db: Session, rows: list[tuple[str, str, float]]) -> None:
+    """Deltas de novas candidaturas [(job_id, status, match_score)]"""
+    if not rows or not counters_enabled():
+        return
+    per_job: dict[str, int] = {}
+    for job_id, _, _ in rows:
+        per_job[job_id] = per_job.get(job_id, 0) + 1
+
+    deltas = {
+        APPLICATIONS: len(rows),
+        ACTIVE_JOBS: _add_job_applications(db, per_job),
+        SCORE_SUM: sum(score or 0.0 for _, _, score in rows),
+    }
+    for _, status, _ in rows:
+        key = STATUS_PREFIX + ApplicationStatus(status).value
+        deltas[key] = deltas.get(key, 0) + 1
+    apply_deltas(db, deltas)
+
+
+def record_status_change(db: Session, old, new) -> None:
+    old, new = ApplicationStatus(old).value, ApplicationStatus(new).value
+    if old != new:
+        apply_deltas(db, {STATUS_PREFIX + old: -1, STATUS_PREFIX + new: 1})
+
+
+def record_score_change(db: Session, delta: float) -> None:
+    apply_deltas(db, {SCORE_SUM: delta})
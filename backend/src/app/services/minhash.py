@@ -0,0 +1,138 @@
+"""
+Matching aproximado com MinHash + LSH por bandas.
+
+Cada candidato guarda uma assinatura MinHash de NUM_PERM valores
+(Candidate.minhash). A assinatura é dividida em LSH_BANDS bandas; cada banda
+vira um bucket em candidate_lsh_buckets. Candidatos que colidem com a vaga
+em pelo menos uma banda formam a lista curta, que pode ser reordenada pelo
+Jaccard exato. A lista curta é limitada aos k * SHORTLIST_FACTOR candidatos
+que colidem em mais bandas (mais bandas iguais ≈ Jaccard maior), para o
+rerank não crescer com a base. Com 64 bandas de 2 linhas o limiar fica em ~(1/64)^(1/2) ≈ 0.125,
+na faixa dos scores típicos vaga x currículo.
+"""
+import hashlib
+import zlib
+
+import numpy as np
+from sqlalchemy import select, delete, insert, or_, and_, func
+from sqlalchemy.orm import Session
+from app.db.models import Candidate, CandidateLSHBucket
+from app.services.ai_resume_match import _tokenize, match_score_from_tokens, TOKENIZER_VERSION
+from app.services.token_store import MAX_TOKEN_LENGTH, deserialize_tokens
+
+NUM_PERM = 128
+LSH_BANDS = 64
+ROWS_PER_BAND = NUM_PERM // LSH_BANDS
+SHORTLIST_FACTOR = 10
+
+# Hash universal (a*x + b) mod P, com P primo de Mersenne 2^31 - 1.
+# a < 2^31 e x < 2^32, então a*x + b cabe em uint64 sem overflow.
+_PRIME = np.uint64((1 << 31) - 1)
+_rng = np.random.default_rng(20260210)
+_A = _rng.integers(1, (1 << 31) - 1, size=NUM_PERM, dtype=np.uint64)
+_B = _rng.integers(0, (1 << 31) - 1, size=NUM_PERM, dtype=np.uint64)
+
+
+def signature(tokens: set[str]) -> np.ndarray:
+    """Assinatura MinHash (uint32[NUM_PERM]); conjunto vazio vira tudo P"""
+    if not tokens:
+        return np.full(NUM_PERM, _PRIME, dtype=np.uint32)
+    # crc32 é estável entre processos (hash() do Python não é)
+    x = np.fromiter((zlib.crc32(t.encode()) for t in tokens), dtype=np.uint64, count=len(tokens))
+    hashed = (_A[:, None] * x[None, :] + _B[:, None]) % _PRIME
+    return hashed.min(axis=1).astype(np.uint32)
+
+
+def signature_from_bytes(data: bytes) -> np.ndarray:
+    return np.frombuffer(data, dtype=np.uint32)
+
+
+def band_buckets(sig: np.ndarray) -> list[str]:
+    """Um bucket (hex de 64 bits) por banda da assinatura"""
+    return [
+        hashlib.blake2b(band.tobytes(), digest_size=8).hexdigest()
+        for band in sig.reshape(LSH_BANDS, ROWS_PER_BAND)
+    ]
+
+
+def estimate_jaccard(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    return float(round(np.count_nonzero(sig_a == sig_b) / NUM_PERM, 4))
+
+
+def index_candidate_minhash(db: Session, cand: Candidate, tokens: set[str]) -> None:
+    """Atualiza assinatura e buckets do candidato (só as bandas que mudaram). Não faz commit."""
+    sig = signature(tokens)
+    buckets = band_buckets(sig)
+
+    current = {
+        band: bucket
+        for band, bucket in db.execute(
+            select(CandidateLSHBucket.band, CandidateLSHBucket.bucket).where(CandidateLSHBucket.candidate_id == cand.id)
+        )
+    }
+    changed = [band for band, bucket in enumerate(buckets) if current.get(band) != bucket]
+    if changed:
+        db.execute(
+            delete(CandidateLSHBucket).where(
+                CandidateLSHBucket.candidate_id == cand.id,
+                CandidateLSHBucket.band.in_(changed),
+            )
+        )
+        db.execute(
+            insert(CandidateLSHBucket),
+            [{"band": band, "bucket": buckets[band], "candidate_id": cand.id} for band in changed],
+        )
+
+    cand.minhash = sig.tobytes()
+
+
+def unindex_candidate_minhash(db: Session, cand: Candidate) -> None:
+    db.execute(delete(CandidateLSHBucket).where(CandidateLSHBucket.candidate_id == cand.id))
+    cand.minhash = None
+
+
+def approx_top_candidates(db: Session, job_tokens: set[str], k: int = 10, rerank: bool = True) -> list[dict]:
+    """
+    Top-k aproximado: busca só os candidatos que colidem com a vaga em
+    alguma banda LSH (no máximo k * SHORTLIST_FACTOR, os de mais bandas em
+    comum). Com rerank=True a lista curta é ordenada pelo Jaccard exato
+    (tokens persistidos); senão, pela estimativa MinHash. Os tokens passam
+    pelo mesmo filtro de MAX_TOKEN_LENGTH do índice exato.
+    """
+    job_tokens = {t for t in job_tokens if len(t) <= MAX_TOKEN_LENGTH}
+    if not job_tokens:
+        return []
+
+    job_sig = signature(job_tokens)
+    # OR de igualdades (e não tuple IN) para o SQLite usar a PK (band, bucket)
+    shortlist = (
+        select(CandidateLSHBucket.candidate_id)
+        .where(or_(*(
+            and_(CandidateLSHBucket.band == band, CandidateLSHBucket.bucket == bucket)
+            for band, bucket in enumerate(band_buckets(job_sig))
+        )))
+        .group_by(CandidateLSHBucket.candidate_id)
+        .order_by(func.count().desc(), CandidateLSHBucket.candidate_id)
+        .limit(k * SHORTLIST_FACTOR)
+    )
+
+    rows = db.execute(
+        select(Candidate.id, Candidate.name, Candidate.email, Candidate.tokens, Candidate.tokens_version, Candidate.minhash)
+        .where(Candidate.id.in_(shortlist))
+    ).all()
+    # Tokens ausentes ou de outra versão do tokenizador: recalcula do currículo (como candidate_tokens)
+    stale = [row.id for row in rows if row.tokens_version != TOKENIZER_VERSION] if rerank else []
+    resumes = dict(db.execute(select(Candidate.id, Candidate.resume_text).where(Candidate.id.in_(stale))).all()) if stale else {}
+
+    results = []
+    for row in rows:
+        if rerank:
+            tokens = _tokenize(resumes[row.id] or "") if row.id in resumes else deserialize_tokens(row.tokens)
+            tokens = {t for t in tokens if len(t) <= MAX_TOKEN_LENGTH}
+            score = match_score_from_tokens(job_tokens, tokens)
+        else:
+            score = estimate_jaccard(job_sig, signature_from_bytes(row.minhash))
+        results.append({"candidate_id": row.id, "name": row.name, "email": row.email, "match_score": score})
+
+    results.sort(key=lambda r: (-r["match_score"], r["candidate_id"]))
+    return results[:k]
@@ -0,0 +1,51 @@
+"""
+Divisão de Document.content em trechos (passages) na ingestão.
+
+O chat ranqueia trechos, não documentos inteiros: uma política longa vira
+vários trechos de até MAX_PASSAGE_WORDS palavras, quebrados em fim de
+frase sempre que possível, e a resposta cita só os trechos relevantes.
+"""
+import re
+
+from sqlalchemy.orm import Session
+from app.db.models import Document, DocumentPassage
+
+MAX_PASSAGE_WORDS = 120
+
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+_SENTENCE_RE = re.compile(r"(?<=[.!?;:])\s+")
+
+
+def chunk_text(text: str, max_words: int = MAX_PASSAGE_WORDS) -> list[str]:
+    """Junta frases em trechos de até max_words palavras, sem cruzar parágrafos"""
+    passages = []
+    for paragraph in _PARAGRAPH_RE.split(text or ""):
+        current: list[str] = []
+        for sentence in _SENTENCE_RE.split(paragraph.strip()):
+            words = sentence.split()
+            # Frase maior que o limite é cortada por palavras
+            while len(words) > max_words:
+                if current:
+                    passages.append(" ".join(current))
+                    current = []
+                passages.append(" ".join(words[:max_words]))
+                words = words[max_words:]
+            if current and len(current) + len(words) > max_words:
+                passages.append(" ".join(current))
+                current = []
+            current.extend(words)
+        if current:
+            passages.append(" ".join(current))
+    return passages
+
+
+def store_passages(db: Session, doc: Document) -> list[DocumentPassage]:
+    """Grava os trechos do documento (recém-criado). Não faz commit."""
+    if doc.id is None:
+        db.flush()
+    passages = [
+        DocumentPassage(document_id=doc.id, position=i, content=text)
+        for i, text in enumerate(chunk_text(doc.content))
+    ]
+    db.add_all(passages)
+    return passages
@@ -0,0 +1,259 @@
+"""
+Rollups diários do dashboard (GET /api/metrics/dashboard).
+
+Tabelas:
+- daily_application_stats: candidaturas criadas por dia + soma dos scores
+- daily_job_applications: o mesmo por vaga e dia
+- daily_status_transitions: transições para cada status por dia
+
+O dashboard só lê essas tabelas (uma linha por dia, ou por dia e status),
+então 12 meses são algumas centenas de linhas por chave primária, sem
+GROUP BY sobre applications.
+
+Quem mantém os rollups é RollupWorker, uma thread no processo da API que
+roda refresh_rollups a cada ROLLUP_INTERVAL segundos:
+- Sem marca d'água (primeira execução ou reset_rollups), faz o backfill a
+  partir das tabelas brutas em blocos de ROLLUP_CHUNK_DAYS dias, um
+  commit por bloco.
+- Depois, só recalcula os dias afetados desde a marca d'água: os dias de
+  criação das candidaturas com updated_at novo (score do worker, rescore,
+  mudança de status) e os dias com linhas novas no histórico de status.
+
+Recalcular um dia é DELETE + INSERT ... SELECT das linhas daquele dia, o
+que torna a atualização idempotente: rodar duas vezes dá o mesmo
+resultado. Dois processos não podem intercalar esses comandos (o INSERT de
+um bateria na chave primária das linhas que o outro acabou de gravar),
+então cada transação de recálculo começa pegando um lock: no Postgres um
+advisory lock de transação (ROLLUP_LOCK_KEY); no SQLite o próprio lock de
+escrita do banco, tomado pelo DELETE. A marca d'água recua ROLLUP_MARGIN
+para não perder linhas de transações que fizeram commit depois da leitura.
+Os dias alterados saem do índice (updated_at, created_at) de applications.
+"""
+import logging
+import threading
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models import (
+    Application, ApplicationStatusChange, DailyApplicationStats, DailyJobApplications,
+    DailyStatusTransitions, RollupState,
+)
+
+logger = logging.getLogger(__name__)
+
+STATE = "dashboard"
+ROLLUP_MARGIN = timedelta(minutes=5)
+ROLLUP_LOCK_KEY = 0x726F6C6C  # "roll"
+
+
+def _start_of(day: date) -> datetime:
+    return datetime.combine(day, time.min)
+
+
+def _ranges(days, chunk_days: int):
+    """Agrupa dias em faixas [início, fim) de dias consecutivos, com no máximo chunk_days"""
+    start = end = None
+    for day in sorted(days):
+        if start is not None and day == end and (end - start).days < chunk_days:
+            end = day + timedelta(days=1)
+            continue
+        if start is not None:
+            yield start, end
+        start, end = day, day + timedelta(days=1)
+    if start is not None:
+        yield start, end
+
+
+def _lock(db: Session) -> None:
+    """Serializa os recálculos entre processos até o fim da transação (Postgres)"""
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": ROLLUP_LOCK_KEY})
+
+
+def recompute_applications(db: Session, start: date, end: date) -> None:
+    """Refaz daily_application_stats e daily_job_applications em [start, end). Não faz commit."""
+    _lock(db)
+    lo, hi = _start_of(start), _start_of(end)
+    day = func.date(Application.created_at)
+    in_range = (Application.created_at >= lo, Application.created_at < hi)
+
+    db.execute(delete(DailyApplicationStats).where(DailyApplicationStats.day >= start, DailyApplicationStats.day < end))
+    db.execute(delete(DailyJobApplications).where(DailyJobApplications.day >= start, DailyJobApplications.day < end))
+    db.execute(insert(DailyJobApplications).from_select(
+        ["job_id", "day", "applications", "score_sum"],
+        select(Application.job_id, day, func.count(), func.coalesce(func.sum(Application.match_score), 0.0))
+        .where(*in_range)
+        .group_by(Application.job_id, day),
+    ))
+    # O total do dia sai do rollup por vaga recém-gravado, não de applications de novo
+    db.execute(insert(DailyApplicationStats).from_select(
+        ["day", "applications", "score_sum"],
+        select(DailyJobApplications.day, func.sum(DailyJobApplications.applications), func.sum(DailyJobApplications.score_sum))
+        .where(DailyJobApplications.day >= start, DailyJobApplications.day < end)
+        .group_by(DailyJobApplications.day),
+    ))
+
+
+def recompute_transitions(db: Session, start: date, end: date) -> None:
+    """Refaz daily_status_transitions em [start, end). Não faz commit."""
+    _lock(db)
+    day = func.date(ApplicationStatusChange.changed_at)
+    db.execute(delete(DailyStatusTransitions).where(DailyStatusTransitions.day >= start, DailyStatusTransitions.day < end))
+    db.execute(insert(DailyStatusTransitions).from_select(
+        ["day", "status", "transitions"],
+        select(day, ApplicationStatusChange.to_status, func.count())
+        .where(ApplicationStatusChange.changed_at >= _start_of(start), ApplicationStatusChange.changed_at < _start_of(end))
+        .group_by(day, ApplicationStatusChange.to_status),
+    ))
+
+
+def _state(db: Session) -> RollupState:
+    state = db.get(RollupState, STATE)
+    if state is None:
+        state = RollupState(name=STATE)
+        db.add(state)
+    return state
+
+
+def _backfill(db: Session, chunk_days: int, today: date) -> int:
+    first = [
+        db.scalar(select(func.min(Application.created_at))),
+        db.scalar(select(func.min(ApplicationStatusChange.changed_at))),
+    ]
+    first = [value.date() for value in first if value is not None]
+    if not first:
+        return 0
+    day, chunks = min(first), 0
+    while day <= today:
+        end = min(day + timedelta(days=chunk_days), today + timedelta(days=1))
+        recompute_applications(db, day, end)
+        recompute_transitions(db, day, end)
+        db.commit()
+        day, chunks = end, chunks + 1
+    return chunks
+
+
+def refresh_rollups(db: Session, chunk_days: int | None = None) -> int:
+    """
+    Atualiza os rollups (backfill na primeira vez, incremental depois) e
+    avança a marca d'água. Retorna quantos blocos de dias foram recalculados.
+    """
+    chunk_days = chunk_days or settings.rollup_chunk_days
+    started = datetime.utcnow()
+    watermark = _state(db).watermark
+
+    if watermark is None:
+        chunks = _backfill(db, chunk_days, started.date())
+    else:
+        since = watermark - ROLLUP_MARGIN
+        dirty = {
+            created_at.date()
+            for created_at in db.scalars(
+                select(Application.created_at)
+                .where(Application.updated_at >= since)
+                .execution_options(yield_per=10_000)
+            )
+        }
+        chunks = 0
+        for start, end in _ranges(dirty, chunk_days):
+            recompute_applications(db, start, end)
+            db.commit()
+            chunks += 1
+        # O histórico só recebe INSERT: os dias afetados são os de since em diante
+        for start, end in _ranges(
+            (since.date() + timedelta(days=i) for i in range((started.date() - since.date()).days + 1)),
+            chunk_days,
+        ):
+            recompute_transitions(db, start, end)
+            db.commit()
+            chunks += 1
+
+    # Lido de novo: os commits acima expiram a instância
+    _state(db).watermark = started
+    db.commit()
+    return chunks
+
+
+def _avg(score_sum: float, applications: int) -> float:
+    return round(score_sum / applications, 2) if applications else 0.0
+
+
+def read_series(db: Session, since: date, job_id: str | None = None) -> dict:
+    """Séries diárias a partir de `since`, lidas só das tabelas de rollup"""
+    applications = db.execute(
+        select(DailyApplicationStats.day, DailyApplicationStats.applications, DailyApplicationStats.score_sum)
+        .where(DailyApplicationStats.day >= since)
+        .order_by(DailyApplicationStats.day)
+    ).all()
+    transitions = db.execute(
+        select(DailyStatusTransitions.day, DailyStatusTransitions.status, DailyStatusTransitions.transitions)
+        .where(DailyStatusTransitions.day >= since)
+        .order_by(DailyStatusTransitions.day, DailyStatusTransitions.status)
+    ).all()
+    job_rows = []
+    if job_id:
+        job_rows = db.execute(
+            select(DailyJobApplications.day, DailyJobApplications.applications, DailyJobApplications.score_sum)
+            .where(DailyJobApplications.job_id == job_id, DailyJobApplications.day >= since)
+            .order_by(DailyJobApplications.day)
+        ).all()
+    state = db.get(RollupState, STATE)
+
+    return {
+        "applications_per_day": [
+            {"day": day, "applications": count, "avg_match_score": _avg(total, count)}
+            for day, count, total in applications
+        ],
+        "status_transitions_per_day": [
+            {"day": day, "status": status, "transitions": count} for day, status, count in transitions
+        ],
+        "job_applications_per_day": [
+            {"day": day, "applications": count, "avg_match_score": _avg(total, count)}
+            for day, count, total in job_rows
+        ],
+        "rollups_updated_at": state.watermark if state else None,
+    }
+
+
+def reset_rollups(db: Session) -> None:
+    """Apaga rollups e marca d'água; a próxima execução refaz o backfill. Não faz commit."""
+    for model in (DailyApplicationStats, DailyJobApplications, DailyStatusTransitions, RollupState):
+        db.execute(delete(model))
+
+
+class RollupWorker:
+    """Thread que chama refresh_rollups periodicamente (ROLLUP_INTERVAL=0 desliga)"""
+
+    def __init__(self, interval: float | None = None):
+        self.interval = settings.rollup_interval if interval is None else interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self.interval <= 0:
+            return
+        self._thread = threading.Thread(target=self._run, name="rollup-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        from app.db import session as db_session
+
+        while not self._stop.is_set():
+            db = db_session.SessionLocal()
+            try:
+                refresh_rollups(db)
+            except Exception:
+                db.rollback()
+                logger.exception("Falha ao atualizar os rollups do dashboard")
+            finally:
+                db.close()
+            self._stop.wait(self.interval)
@@ -0,0 +1,202 @@
+"""
+Interface plugável de score vaga x currículo.
+
+O pipeline de match_score (create_application, seed, rescore) pede o scorer
+a get_scorer(), que escolhe pela configuração MATCH_SCORER:
+
+- "jaccard": interseção/união dos conjuntos de tokens (padrão, sem estado)
+- "bm25": BM25 normalizado para [0, 1], com df e tamanho médio lidos das
+  tabelas term_stats/corpus_stats mantidas pelo índice de candidatos
+"""
+import heapq
+from typing import Protocol
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.models import Application, Job, Candidate, CandidateToken
+from app.services.batch_scoring import jaccard_pairs
+from app.services.candidate_index import top_candidates, MAX_TOKEN_LENGTH
+from app.services.corpus_stats import corpus_size, idf_weights
+from app.services.metrics import record_score_change
+from app.services.token_store import job_tokens, candidate_tokens
+
+
+class Scorer(Protocol):
+    name: str
+
+    def score_pairs(
+        self,
+        db: Session,
+        jobs: dict[str, set[str]],
+        candidates: list[Candidate],
+        pairs: list[tuple[str, str]],
+    ) -> list[float]:
+        """Score de cada par (job_id, candidate_id); jobs mapeia job_id -> tokens"""
+        ...
+
+    def top_k(self, db: Session, job_tokens: set[str], k: int) -> list[dict]:
+        ...
+
+
+def score_one(scorer: Scorer, db: Session, job_id: str, job_tokens: set[str], cand: Candidate) -> float:
+    return scorer.score_pairs(db, {job_id: job_tokens}, [cand], [(job_id, cand.id)])[0]
+
+
+class JaccardScorer:
+    name = "jaccard"
+
+    def score_pairs(self, db, jobs, candidates, pairs):
+        if not pairs:
+            return []
+        job_pos = {jid: i for i, jid in enumerate(jobs)}
+        cand_pos = {c.id: i for i, c in enumerate(candidates)}
+        scores = jaccard_pairs(
+            list(jobs.values()),
+            [candidate_tokens(c) for c in candidates],
+            [job_pos[j] for j, _ in pairs],
+            [cand_pos[c] for _, c in pairs],
+        )
+        return scores.tolist()
+
+    def top_k(self, db, job_tokens, k):
+        return top_candidates(db, job_tokens, k)
+
+
+class BM25Scorer:
+    """
+    BM25 (k1, b clássicos) com a vaga como consulta. O score é dividido pelo
+    máximo atingível para a vaga (soma de idf * (k1 + 1)), ficando em [0, 1)
+    como o Jaccard; tokens da vaga ausentes da base não entram na conta.
+    """
+    name = "bm25"
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+    def _query(self, db: Session, job_tokens: set[str]) -> tuple[dict[str, float], float, float]:
+        doc_count, avgdl = corpus_size(db)
+        tokens = {t for t in job_tokens if len(t) <= MAX_TOKEN_LENGTH}
+        idf = idf_weights(db, tokens, doc_count)
+        return idf, avgdl, sum(idf.values()) * (self.k1 + 1)
+
+    def _term(self, idf: float, tf: int, doc_length: int, avgdl: float) -> float:
+        norm = 1 - self.b + self.b * (doc_length / avgdl if avgdl else 1.0)
+        return idf * tf * (self.k1 + 1) / (tf + self.k1 * norm)
+
+    def _postings(self, db: Session, tokens, candidate_ids=None):
+        query = (
+            select(CandidateToken.candidate_id, CandidateToken.token, CandidateToken.tf, Candidate.doc_length)
+            .join(Candidate, Candidate.id == CandidateToken.candidate_id)
+            .where(CandidateToken.token.in_(tokens))
+        )
+        if candidate_ids is not None:
+            query = query.where(CandidateToken.candidate_id.in_(candidate_ids))
+        return db.execute(query)
+
+    def score_pairs(self, db, jobs, candidates, pairs):
+        wanted: dict[str, set[str]] = {}
+        for job_id, cand_id in pairs:
+            wanted.setdefault(job_id, set()).add(cand_id)
+
+        scores: dict[tuple[str, str], float] = {}
+        for job_id, cand_ids in wanted.items():
+            idf, avgdl, max_score = self._query(db, jobs[job_id])
+            if not max_score:
+                continue
+            for row in self._postings(db, idf.keys(), cand_ids):
+                key = (job_id, row.candidate_id)
+                scores[key] = scores.get(key, 0.0) + self._term(idf[row.token], row.tf, row.doc_length, avgdl)
+            for cand_id in cand_ids:
+                if (job_id, cand_id) in scores:
+                    scores[(job_id, cand_id)] /= max_score
+
+        return [float(round(scores.get(pair, 0.0), 4)) for pair in pairs]
+
+    def top_k(self, db, job_tokens, k):
+        """Acumula o BM25 lendo só as postings dos tokens da vaga"""
+        idf, avgdl, max_score = self._query(db, job_tokens)
+        if not max_score:
+            return []
+
+        acc: dict[str, float] = {}
+        for row in self._postings(db, idf.keys()):
+            acc[row.candidate_id] = acc.get(row.candidate_id, 0.0) + self._term(idf[row.token], row.tf, row.doc_length, avgdl)
+        top = heapq.nsmallest(k, acc.items(), key=lambda kv: (-kv[1], kv[0]))
+        names = {
+            c.id: c for c in db.execute(
+                select(Candidate.id, Candidate.name, Candidate.email).where(Candidate.id.in_([cid for cid, _ in top]))
+            )
+        }
+        return [
+            {
+                "candidate_id": cid,
+                "name": names[cid].name,
+                "email": names[cid].email,
+                "match_score": float(round(value / max_score, 4)),
+            }
+            for cid, value in top
+        ]
+
+
+SCORERS = {
+    JaccardScorer.name: JaccardScorer,
+    BM25Scorer.name: BM25Scorer,
+}
+
+
+def get_scorer(name: str | None = None) -> Scorer:
+    name = name or settings.match_scorer
+    if name not in SCORERS:
+        raise ValueError(f"Scorer desconhecido: {name}. Use: {list(SCORERS)}")
+    return SCORERS[name]()
+
+
+def rescore_applications(db: Session, job_id: str | None = None, chunk_size: int = 5000, scorer: Scorer | None = None) -> int:
+    """
+    Recalcula match_score das candidaturas (de uma vaga ou de todas) em blocos
+    de chunk_size com o scorer configurado, gravando cada bloco com um único
+    UPDATE em lote. Usa os tokens persistidos; rode refresh_stale_tokens antes
+    se o tokenizador mudou.
+    """
+    scorer = scorer or get_scorer()
+    tokens_by_job: dict[str, set[str]] = {}
+    rescored = 0
+    last_id = ""
+
+    while True:
+        query = (
+            select(Application.id, Application.job_id, Application.candidate_id, Application.match_score)
+            .where(Application.id > last_id)
+        )
+        if job_id:
+            query = query.where(Application.job_id == job_id)
+        rows = db.execute(query.order_by(Application.id).limit(chunk_size)).all()
+        if not rows:
+            break
+
+        # Tokens pré-calculados (token_store); cada vaga é lida uma vez por execução
+        missing_jobs = {r.job_id for r in rows} - tokens_by_job.keys()
+        if missing_jobs:
+            for job in db.scalars(select(Job).where(Job.id.in_(missing_jobs))):
+                tokens_by_job[job.id] = job_tokens(job)
+
+        candidates = db.scalars(
+            select(Candidate).where(Candidate.id.in_({r.candidate_id for r in rows}))
+        ).all()
+        jobs = {r.job_id: tokens_by_job[r.job_id] for r in rows}
+        scores = scorer.score_pairs(db, jobs, candidates, [(r.job_id, r.candidate_id) for r in rows])
+
+        db.execute(
+            update(Application),
+            [{"id": r.id, "match_score": s} for r, s in zip(rows, scores)],
+        )
+        record_score_change(db, sum(s - r.match_score for r, s in zip(rows, scores)))
+        db.commit()
+        db.expunge_all()
+
+        rescored += len(rows)
+        last_id = rows[-1].id
+
+    return rescored
@@ -0,0 +1,233 @@
+"""
+Fila de score assíncrono para o intake de candidaturas.
+
+No modo APPLICATION_INTAKE_MODE=async a candidatura é gravada na hora com
+score_status="pending" e uma linha em scoring_tasks. Um despachante (thread
+no processo da API) reivindica lotes da fila com um único UPDATE e os
+entrega a um ProcessPoolExecutor; cada worker abre sua própria sessão,
+calcula match_score/summary e atualiza a linha.
+
+Como a fila vive no banco, nada se perde num restart: tarefas "running"
+cujo started_at passou de SCORING_TASK_TIMEOUT voltam para "pending",
+contando uma tentativa (SCORING_MAX_ATTEMPTS vale também para elas).
+"""
+import logging
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update, func
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.models import Application, Job, Candidate, ScoringTask, ScoreStatus, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue(db: Session, application_id: str) -> None:
+    """Adiciona a candidatura à fila. Não faz commit."""
+    db.add(ScoringTask(application_id=application_id))
+
+
+def claim(db: Session, limit: int) -> list[int]:
+    """
+    Reivindica até `limit` tarefas pendentes (as mais antigas primeiro).
+    O UPDATE ... WHERE status = 'pending' é atômico, então vários
+    despachantes (um por processo uvicorn) não pegam a mesma tarefa.
+    """
+    token = str(uuid.uuid4())
+    oldest = (
+        select(ScoringTask.id)
+        .where(ScoringTask.status == TaskStatus.PENDING.value)
+        .order_by(ScoringTask.enqueued_at, ScoringTask.id)
+        .limit(limit)
+    )
+    db.execute(
+        update(ScoringTask)
+        .where(ScoringTask.id.in_(oldest.scalar_subquery()), ScoringTask.status == TaskStatus.PENDING.value)
+        .values(status=TaskStatus.RUNNING.value, claimed_by=token, started_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return list(db.scalars(select(ScoringTask.id).where(ScoringTask.claimed_by == token)))
+
+
+def requeue_stale(db: Session, timeout: int | None = None) -> int:
+    """
+    Devolve à fila tarefas "running" abandonadas (worker morto, restart).
+    Cada devolução conta como tentativa: a tarefa que já esgotou
+    SCORING_MAX_ATTEMPTS vai para "failed" em vez de voltar, senão uma
+    candidatura que derruba o worker seria reprocessada para sempre.
+    Retorna quantas tarefas voltaram para "pending".
+    """
+    timeout = settings.scoring_task_timeout if timeout is None else timeout
+    now = datetime.utcnow()
+    stale = (
+        ScoringTask.status == TaskStatus.RUNNING.value,
+        ScoringTask.started_at < now - timedelta(seconds=timeout),
+    )
+    exhausted = ScoringTask.attempts + 1 >= settings.scoring_max_attempts
+    db.execute(
+        update(Application)
+        .where(Application.id.in_(select(ScoringTask.application_id).where(*stale, exhausted)))
+        .values(score_status=ScoreStatus.FAILED.value)
+        .execution_options(synchronize_session=False)
+    )
+    db.execute(
+        update(ScoringTask)
+        .where(*stale, exhausted)
+        .values(
+            status=TaskStatus.FAILED.value,
+            attempts=ScoringTask.attempts + 1,
+            error="Tarefa abandonada além do SCORING_TASK_TIMEOUT",
+            claimed_by=None,
+            finished_at=now,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    result = db.execute(
+        update(ScoringTask)
+        .where(*stale)
+        .values(status=TaskStatus.PENDING.value, attempts=ScoringTask.attempts + 1, claimed_by=None)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+
+def process_task(task_id: int) -> str:
+    """Executado no processo worker: pontua a candidatura da tarefa"""
+    from app.db import session as db_session
+    from app.services.ai_resume_match import summarize_candidate
+    from app.services.metrics import record_score_change
+    from app.services.scoring import get_scorer, score_one
+    from app.services.token_store import job_tokens
+
+    db = db_session.SessionLocal()
+    try:
+        task = db.get(ScoringTask, task_id)
+        if task is None or task.status != TaskStatus.RUNNING.value:
+            return "skipped"
+        app = db.get(Application, task.application_id)
+        if app is None:
+            # Candidatura apagada depois de enfileirada: nada a pontuar nem a tentar de novo
+            task.status = TaskStatus.FAILED.value
+            task.error = "Candidatura não encontrada"
+            task.claimed_by = None
+            task.finished_at = datetime.utcnow()
+            db.commit()
+            return "skipped"
+        try:
+            job = db.get(Job, app.job_id)
+            cand = db.get(Candidate, app.candidate_id)
+            score = score_one(get_scorer(), db, job.id, job_tokens(job), cand)
+            record_score_change(db, score - (app.match_score or 0.0))
+            app.match_score = score
+            app.summary = summarize_candidate(cand.resume_text)
+            app.score_status = ScoreStatus.DONE.value
+            task.status = TaskStatus.DONE.value
+            task.finished_at = datetime.utcnow()
+            db.commit()
+            return task.status
+        except Exception as exc:
+            db.rollback()
+            task = db.get(ScoringTask, task_id)
+            task.attempts += 1
+            task.error = repr(exc)
+            task.claimed_by = None
+            if task.attempts >= settings.scoring_max_attempts:
+                task.status = TaskStatus.FAILED.value
+                task.finished_at = datetime.utcnow()
+                app = db.get(Application, task.application_id)
+                if app is not None:
+                    app.score_status = ScoreStatus.FAILED.value
+            else:
+                task.status = TaskStatus.PENDING.value
+            db.commit()
+            return task.status
+    finally:
+        db.close()
+
+
+def queue_stats(db: Session) -> dict:
+    """Profundidade da fila e atraso (idade da tarefa pendente mais antiga)"""
+    counts = dict(db.execute(
+        select(ScoringTask.status, func.count())
+        .where(ScoringTask.status.in_([TaskStatus.PENDING.value, TaskStatus.RUNNING.value, TaskStatus.FAILED.value]))
+        .group_by(ScoringTask.status)
+    ).all())
+    oldest = db.scalar(
+        select(func.min(ScoringTask.enqueued_at)).where(ScoringTask.status == TaskStatus.PENDING.value)
+    )
+    return {
+        "depth": counts.get(TaskStatus.PENDING.value, 0),
+        "running": counts.get(TaskStatus.RUNNING.value, 0),
+        "failed": counts.get(TaskStatus.FAILED.value, 0),
+        "oldest_enqueued_at": oldest,
+        "lag_seconds": round((datetime.utcnow() - oldest).total_seconds(), 3) if oldest else 0.0,
+    }
+
+
+def _init_worker() -> None:
+    # Conexões herdadas do processo pai (fork) não podem ser reutilizadas
+    from app.db.session import engine
+    engine.dispose(close=False)
+
+
+class ScoringWorkerPool:
+    """Despachante + pool de processos que drena a fila de score"""
+
+    def __init__(self, workers: int | None = None, poll_interval: float | None = None):
+        self.workers = workers or settings.scoring_workers
+        self.poll_interval = settings.scoring_poll_interval if poll_interval is None else poll_interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._executor: ProcessPoolExecutor | None = None
+
+    def start(self) -> None:
+        self._executor = self._new_executor()
+        self._thread = threading.Thread(target=self._run, name="scoring-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        if self._executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+
+    def _run(self) -> None:
+        from app.db import session as db_session
+
+        while not self._stop.is_set():
+            db = db_session.SessionLocal()
+            try:
+                requeue_stale(db)
+                task_ids = claim(db, self.workers * 2)
+            except Exception:
+                logger.exception("Falha ao reivindicar tarefas de score")
+                task_ids = []
+            finally:
+                db.close()
+
+            if not task_ids:
+                self._stop.wait(self.poll_interval)
+                continue
+            try:
+                futures = [self._executor.submit(process_task, task_id) for task_id in task_ids]
+                wait(futures)
+                for future in futures:
+                    future.result()
+            except BrokenProcessPool:
+                # Um worker morreu (OOM, segfault): o pool não aceita mais nada.
+                # As tarefas do lote ficam "running" e voltam via requeue_stale.
+                logger.exception("Pool de score quebrado; recriando os workers")
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._new_executor()
+            except Exception:
+                logger.exception("Falha ao pontuar tarefas de score")
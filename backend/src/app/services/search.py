@@ -0,0 +1,87 @@
+"""
+Busca textual ranqueada de candidatos e vagas (parâmetro ?search=).
+
+Usa as estruturas de app.db.fulltext: FTS5 + bm25 no SQLite, tsvector +
+ts_rank e pg_trgm no Postgres. Cada termo da busca casa por prefixo
+("pyth" encontra "python") e todos precisam aparecer. A relevância
+considera todas as colunas indexadas com pesos (nome/título acima do
+texto do currículo ou da descrição).
+
+Devolve também a chave de paginação: (relevância, id) quando há ranking,
+para o cursor seguir a mesma ordem; em outros bancos cai no ILIKE antigo,
+paginado por (created_at, id).
+"""
+import re
+
+from sqlalchemy import Float, cast, column, func, literal_column, or_, select, table, text, type_coerce
+
+from app.db.fulltext import CANDIDATES, JOBS, TS_CONFIG, FullTextSpec, tsvector_sql
+from app.db.models import Candidate, Job
+
+_TERM_RE = re.compile(r"\w+")
+
+
+def search_terms(term: str) -> list[str]:
+    return _TERM_RE.findall(term.lower())
+
+
+def _fts5_match(terms: list[str]) -> str:
+    """Consulta MATCH do FTS5: cada termo entre aspas (sem sintaxe do usuário) e por prefixo"""
+    return " ".join(f'"{t}"*' for t in terms)
+
+
+def _tsquery(terms: list[str]) -> str:
+    return " & ".join(f"{t}:*" for t in terms)
+
+
+def _sqlite_search(query, model, spec: FullTextSpec, terms: list[str]):
+    fts = table(spec.fts_table, column("rowid"))
+    weights = ", ".join(str(w) for w in spec.weights)
+    # bm25() é menor para o melhor resultado; negado para ordenar DESC como as outras chaves
+    ranked = (
+        select(
+            fts.c.rowid.label("rowid"),
+            type_coerce(literal_column(f"-bm25({spec.fts_table}, {weights})"), Float).label("rank"),
+        )
+        .where(text(f"{spec.fts_table} MATCH :match").bindparams(match=_fts5_match(terms)))
+        .subquery()
+    )
+    query = query.join(ranked, ranked.c.rowid == literal_column(f"{spec.table}.rowid"))
+    return query, (ranked.c.rank, model.id)
+
+
+def _postgres_search(query, model, spec: FullTextSpec, term: str, terms: list[str]):
+    document = literal_column(tsvector_sql(spec, prefix=f"{spec.table}."))
+    tsquery = func.to_tsquery(TS_CONFIG, _tsquery(terms))
+    partial = [getattr(model, col).ilike(f"%{term}%") for col in spec.trigram]
+    # ts_rank e similarity são real; em double para o cursor comparar com o valor exato
+    rank = cast(func.ts_rank(document, tsquery) + func.similarity(getattr(model, spec.trigram[0]), term), Float)
+    query = query.filter(or_(document.op("@@")(tsquery), *partial))
+    return query, (rank, model.id)
+
+
+def _fallback_search(query, model, spec: FullTextSpec, term: str):
+    columns = [getattr(model, col) for col in spec.trigram]
+    query = query.filter(or_(*(col.ilike(f"%{term}%") for col in columns)))
+    return query, (model.created_at, model.id)
+
+
+def full_text_search(query, model, spec: FullTextSpec, term: str):
+    """Filtra a query ORM de `model` por `term`; retorna (query, chave de paginação)"""
+    terms = search_terms(term)
+    if not terms:
+        return query, (model.created_at, model.id)
+    dialect = query.session.get_bind().dialect.name
+    if dialect == "sqlite":
+        return _sqlite_search(query, model, spec, terms)
+    if dialect == "postgresql":
+        return _postgres_search(query, model, spec, term, terms)
+    return _fallback_search(query, model, spec, term)
+
+
+def search_candidates(query, term: str):
+    return full_text_search(query, Candidate, CANDIDATES, term)
+
+
+def search_jobs(query, term: str):
+    return full_text_search(query, Job, JOBS, term)
@@ -0,0 +1,233 @@
+"""
+Histórico de status das candidaturas e funil de contratação por vaga.
+
+Cada criação (from_status NULL) e cada mudança de status grava uma linha
+em application_status_history na mesma transação da escrita, então o
+histórico nunca diverge do status atual. A tabela só recebe INSERT: os
+rollups diários (services/rollups.py) leem por faixa de changed_at.
+
+O funil (GET /api/jobs/{job_id}/funnel) não lê o histórico: na mesma
+transação, record_transitions soma deltas em dois agregados por vaga:
+- job_stage_stats: candidaturas que chegaram a cada etapa de FUNNEL (pular
+  etapas conta como ter passado por elas) e rejeitadas saindo de cada uma
+- job_stage_durations: histograma do tempo na etapa, em buckets
+  geométricos de razão BUCKET_RATIO a partir de BUCKET_BASE segundos
+
+A leitura são algumas dezenas de linhas por chave primária, não importa
+quantos milhões de transições a vaga tenha. A mediana sai do histograma
+por interpolação dentro do bucket (erro relativo abaixo de ~20%).
+rebuild_funnel refaz os agregados a partir do histórico.
+"""
+import math
+from collections import Counter, defaultdict
+from datetime import datetime
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.db.models import ApplicationStatus, ApplicationStatusChange, JobStageDuration, JobStageStat
+from app.services.corpus_stats import _dialect_insert
+
+FUNNEL = (
+    ApplicationStatus.APLICADO.value,
+    ApplicationStatus.EM_ANALISE.value,
+    ApplicationStatus.ENTREVISTA.value,
+    ApplicationStatus.OFERECIDO.value,
+)
+REJECTED = ApplicationStatus.REJEITADO.value
+BUCKET_BASE = 60.0  # segundos; o bucket 0 vai de 0 a BUCKET_BASE * BUCKET_RATIO
+BUCKET_RATIO = math.sqrt(2)
+REBUILD_BATCH_SIZE = 10_000
+
+
+def _value(status) -> str | None:
+    return None if status is None else ApplicationStatus(status).value
+
+
+def _bucket(seconds: float) -> int:
+    return 0 if seconds < BUCKET_BASE else int(math.log(seconds / BUCKET_BASE, BUCKET_RATIO))
+
+
+def _bucket_bounds(bucket: int) -> tuple[float, float]:
+    low = 0.0 if bucket == 0 else BUCKET_BASE * BUCKET_RATIO ** bucket
+    return low, BUCKET_BASE * BUCKET_RATIO ** (bucket + 1)
+
+
+class _FunnelDeltas:
+    """Deltas dos agregados do funil acumulados em memória"""
+
+    def __init__(self):
+        self.reached: Counter = Counter()  # (job_id, etapa)
+        self.rejected: Counter = Counter()  # (job_id, etapa de onde saiu)
+        self.durations: Counter = Counter()  # (job_id, etapa, bucket)
+
+    def add(self, job_id: str, history: list[tuple[str, datetime | None]], new: str, at: datetime) -> None:
+        """Transição para `new` em `at`; history = [(status, entrou_em)] anteriores, em ordem"""
+        if history:
+            old, entered_at = history[-1]
+            if entered_at is not None:
+                self.durations[(job_id, old, _bucket(max((at - entered_at).total_seconds(), 0.0)))] += 1
+            if new == REJECTED:
+                self.rejected[(job_id, old)] += 1
+        if new in FUNNEL:
+            top = max((FUNNEL.index(s) for s, _ in history if s in FUNNEL), default=-1)
+            for stage in FUNNEL[top + 1:FUNNEL.index(new) + 1]:
+                self.reached[(job_id, stage)] += 1
+
+    def stage_rows(self) -> list[dict]:
+        keys = sorted(set(self.reached) | set(self.rejected))
+        return [
+            {"job_id": job_id, "stage": stage, "reached": self.reached[(job_id, stage)],
+             "rejected": self.rejected[(job_id, stage)]}
+            for job_id, stage in keys
+        ]
+
+    def duration_rows(self) -> list[dict]:
+        return [
+            {"job_id": job_id, "stage": stage, "bucket": bucket, "count": self.durations[(job_id, stage, bucket)]}
+            for job_id, stage, bucket in sorted(self.durations)
+        ]
+
+
+def _upsert_add(db: Session, model, keys: tuple[str, ...], rows: list[dict]) -> None:
+    """Soma as colunas não-chave de `rows` às linhas existentes (ou cria). Não faz commit."""
+    if not rows:
+        return
+    columns = [c for c in rows[0] if c not in keys]
+    insert_ = _dialect_insert(db)
+    if insert_ is not None:
+        stmt = insert_(model).values(rows)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[getattr(model, k) for k in keys],
+            set_={c: getattr(model, c) + getattr(stmt.excluded, c) for c in columns},
+        ))
+        return
+    for row in rows:
+        result = db.execute(
+            update(model)
+            .where(*(getattr(model, k) == row[k] for k in keys))
+            .values({c: getattr(model, c) + row[c] for c in columns})
+        )
+        if not result.rowcount:
+            db.execute(insert(model).values(row))
+
+
+def record_transitions(db: Session, rows: list[tuple[str, str, object, object]], at: datetime | None = None) -> None:
+    """
+    Grava [(application_id, job_id, from_status, to_status)] no histórico
+    (executemany) e aplica os deltas do funil. Não faz commit.
+    """
+    at = at or datetime.utcnow()
+    rows = [(app_id, job_id, _value(old), _value(new)) for app_id, job_id, old, new in rows if _value(old) != _value(new)]
+    if not rows:
+        return
+
+    # Histórico anterior só de quem já existia (criações não têm)
+    history = defaultdict(list)
+    existing = [app_id for app_id, _, old, _ in rows if old is not None]
+    if existing:
+        for app_id, status, changed_at in db.execute(
+            select(ApplicationStatusChange.application_id, ApplicationStatusChange.to_status, ApplicationStatusChange.changed_at)
+            .where(ApplicationStatusChange.application_id.in_(existing))
+            .order_by(ApplicationStatusChange.id)
+        ):
+            history[app_id].append((status, changed_at))
+
+    deltas = _FunnelDeltas()
+    for app_id, job_id, old, new in rows:
+        previous = history[app_id]
+        if old is not None and not previous:
+            previous.append((old, None))  # sem histórico: não sabemos desde quando está em `old`
+        deltas.add(job_id, previous, new, at)
+        previous.append((new, at))
+
+    db.execute(insert(ApplicationStatusChange), [
+        {"application_id": app_id, "job_id": job_id, "from_status": old, "to_status": new, "changed_at": at}
+        for app_id, job_id, old, new in rows
+    ])
+    # Ordem fixa (ordenada): duas transações nunca travam as mesmas linhas em ordem inversa
+    _upsert_add(db, JobStageStat, ("job_id", "stage"), deltas.stage_rows())
+    _upsert_add(db, JobStageDuration, ("job_id", "stage", "bucket"), deltas.duration_rows())
+
+
+def rebuild_funnel(db) -> None:
+    """
+    Recalcula job_stage_stats e job_stage_durations lendo o histórico em
+    lotes, na ordem de cada candidatura. Aceita Session ou Connection. Não
+    faz commit.
+    """
+    deltas = _FunnelDeltas()
+    current, previous = None, []
+    result = db.execute(
+        select(
+            ApplicationStatusChange.application_id, ApplicationStatusChange.job_id,
+            ApplicationStatusChange.to_status, ApplicationStatusChange.changed_at,
+        )
+        .order_by(ApplicationStatusChange.application_id, ApplicationStatusChange.id)
+        .execution_options(yield_per=REBUILD_BATCH_SIZE)
+    )
+    for batch in result.partitions():
+        for app_id, job_id, status, changed_at in batch:
+            if app_id != current:
+                current, previous = app_id, []
+            deltas.add(job_id, previous, status, changed_at)
+            previous.append((status, changed_at))
+
+    db.execute(delete(JobStageStat))
+    db.execute(delete(JobStageDuration))
+    for model, rows in ((JobStageStat, deltas.stage_rows()), (JobStageDuration, deltas.duration_rows())):
+        if rows:
+            db.execute(insert(model), rows)
+
+
+def _median(histogram: dict[int, int]) -> float | None:
+    total = sum(histogram.values())
+    if not total:
+        return None
+    target, seen = total / 2, 0
+    for bucket in sorted(histogram):
+        count = histogram[bucket]
+        if seen + count >= target:
+            low, high = _bucket_bounds(bucket)
+            return round(low + (high - low) * (target - seen) / count, 1)
+        seen += count
+    return None
+
+
+def job_funnel(db: Session, job_id: str) -> dict:
+    """Conversão entre etapas e mediana do tempo em cada etapa, dos agregados da vaga"""
+    stats = {
+        row.stage: row
+        for row in db.scalars(select(JobStageStat).where(JobStageStat.job_id == job_id))
+    }
+    histograms = defaultdict(dict)
+    for stage, bucket, count in db.execute(
+        select(JobStageDuration.stage, JobStageDuration.bucket, JobStageDuration.count)
+        .where(JobStageDuration.job_id == job_id)
+    ):
+        histograms[stage][bucket] = count
+
+    def reached(stage):
+        return stats[stage].reached if stage in stats else 0
+
+    stages = []
+    for i, stage in enumerate(FUNNEL):
+        total = reached(stage)
+        following = reached(FUNNEL[i + 1]) if i + 1 < len(FUNNEL) else None
+        stages.append({
+            "stage": stage,
+            "reached": total,
+            "rejected": stats[stage].rejected if stage in stats else 0,
+            "conversion_rate": round(following / total, 4) if following is not None and total else None,
+            # Só candidaturas que já saíram da etapa têm tempo nela
+            "median_seconds_in_stage": _median(histograms[stage]),
+            "samples": sum(histograms[stage].values()),
+        })
+
+    applications = reached(FUNNEL[0])
+    return {
+        "job_id": job_id,
+        "applications": applications,
+        "overall_conversion_rate": round(reached(FUNNEL[-1]) / applications, 4) if applications else None,
+        "stages": stages,
+    }
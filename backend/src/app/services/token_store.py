@@ -0,0 +1,77 @@
+"""
+Representação pré-tokenizada de vagas e currículos.
+
+Os tokens são calculados uma vez na escrita e persistidos em Job.tokens /
+Candidate.tokens junto com a TOKENIZER_VERSION usada. O caminho de score só
+desserializa; se a versão estiver defasada, recalcula e atualiza o objeto
+(o commit fica a cargo de quem chamou).
+"""
+from sqlalchemy import select, or_
+from sqlalchemy.orm import Session
+from app.db.models import Job, Candidate
+from app.services.ai_resume_match import _tokenize, job_match_text, TOKENIZER_VERSION
+
+# Tokens maiores que a coluna (URLs, hashes) não ajudam no match: ficam fora
+# do índice invertido e da assinatura MinHash
+MAX_TOKEN_LENGTH = 128
+
+
+def serialize_tokens(tokens: set[str]) -> str:
+    # _tokenize nunca produz espaços, então espaço é um separador seguro
+    return " ".join(sorted(tokens))
+
+
+def deserialize_tokens(data: str | None) -> set[str]:
+    return set(data.split()) if data else set()
+
+
+def store_job_tokens(job: Job) -> set[str]:
+    tokens = _tokenize(job_match_text(job.title, job.short_description, job.full_description))
+    job.tokens = serialize_tokens(tokens)
+    job.tokens_version = TOKENIZER_VERSION
+    return tokens
+
+
+def store_candidate_tokens(cand: Candidate, tokens: set[str] | None = None) -> set[str]:
+    if tokens is None:
+        tokens = _tokenize(cand.resume_text or "")
+    cand.tokens = serialize_tokens(tokens)
+    cand.tokens_version = TOKENIZER_VERSION
+    return tokens
+
+
+def job_tokens(job: Job) -> set[str]:
+    if job.tokens_version != TOKENIZER_VERSION:
+        return store_job_tokens(job)
+    return deserialize_tokens(job.tokens)
+
+
+def candidate_tokens(cand: Candidate) -> set[str]:
+    if cand.tokens_version != TOKENIZER_VERSION:
+        return store_candidate_tokens(cand)
+    return deserialize_tokens(cand.tokens)
+
+
+def refresh_stale_tokens(db: Session, chunk_size: int = 1000) -> int:
+    """
+    Recalcula tokens de vagas e candidatos gravados com outra versão do
+    tokenizador (backfill após mudar _tokenize). Candidatos também são
+    reindexados no índice invertido. Retorna quantas linhas mudaram.
+    """
+    from app.services.candidate_index import index_candidate
+
+    refreshed = 0
+    for model in (Job, Candidate):
+        stale = or_(model.tokens_version.is_(None), model.tokens_version != TOKENIZER_VERSION)
+        while True:
+            rows = db.scalars(select(model).where(stale).limit(chunk_size)).all()
+            if not rows:
+                break
+            for row in rows:
+                if model is Job:
+                    store_job_tokens(row)
+                else:
+                    index_candidate(db, row)
+            db.commit()
+            refreshed += len(rows)
+    return refreshed
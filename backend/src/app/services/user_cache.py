@@ -0,0 +1,159 @@
+"""
+Cache dos usuários autenticados (get_current_user).
+
+A chave é o token já verificado e o valor é um UserSnapshot (cópia
+imutável das colunas do usuário, sem sessão nem relacionamentos), então
+um acerto dispensa a sessão e a consulta por email. Cada entrada expira
+no que vier primeiro: AUTH_CACHE_TTL ou a expiração do token; o LRU
+limita a AUTH_CACHE_SIZE entradas.
+
+Invalidação: eventos do SQLAlchemy removem as entradas do email quando um
+User é atualizado (nome, email, papel...) ou apagado, no flush e de novo
+depois do commit (uma requisição concorrente pode ter recolocado o valor
+antigo entre os dois). UPDATE/DELETE em massa sobre users limpa o cache
+inteiro. O cache é por processo: com vários workers, os outros enxergam a
+mudança em até AUTH_CACHE_TTL segundos.
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import settings
+from app.db.models import User, UserRole
+
+_DIRTY = "user_cache_dirty"
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    id: str
+    name: str
+    email: str
+    role: UserRole
+    created_at: datetime
+
+    @classmethod
+    def of(cls, user: User) -> "UserSnapshot":
+        return cls(id=user.id, name=user.name, email=user.email, role=user.role, created_at=user.created_at)
+
+
+class UserCache:
+    def __init__(self, maxsize: int | None = None, ttl: float | None = None):
+        self.maxsize = settings.auth_cache_size if maxsize is None else maxsize
+        self.ttl = settings.auth_cache_ttl if ttl is None else ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, UserSnapshot]] = OrderedDict()
+        self._tokens_by_email: dict[str, set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_email.clear()
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def _remove(self, token: str) -> None:
+        _, user = self._entries.pop(token)
+        tokens = self._tokens_by_email.get(user.email)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_email[user.email]
+
+    def get(self, token: str) -> UserSnapshot | None:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(token)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                self._remove(token)
+            self.misses += 1
+            return None
+
+    def set(self, token: str, user: UserSnapshot, expires_in: float | None = None) -> None:
+        """Guarda o usuário do token; expires_in limita a entrada à validade do token"""
+        if self.maxsize <= 0:
+            return
+        ttl = self.ttl if expires_in is None else min(self.ttl, expires_in)
+        if ttl <= 0:
+            return
+        with self._lock:
+            if token in self._entries:
+                self._remove(token)
+            self._entries[token] = (time.monotonic() + ttl, user)
+            self._tokens_by_email.setdefault(user.email, set()).add(token)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, emails) -> None:
+        with self._lock:
+            for email in emails:
+                for token in list(self._tokens_by_email.get(email, ())):
+                    self._remove(token)
+                    self.invalidations += 1
+
+    def invalidate_all(self) -> None:
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._tokens_by_email.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+user_cache = UserCache()
+
+
+def _user_changed(mapper, connection, target: User) -> None:
+    # Email antigo e novo: o token aponta para o email da época do login
+    emails = {target.email, *inspect(target).attrs.email.history.deleted}
+    user_cache.invalidate(emails)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_DIRTY, set()).update(emails)
+
+
+event.listen(User, "after_update", _user_changed)
+event.listen(User, "after_delete", _user_changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    emails = session.info.pop(_DIRTY, None)
+    if emails:
+        user_cache.invalidate(emails)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session: Session) -> None:
+    session.info.pop(_DIRTY, None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bulk_write(state) -> None:
+    table = getattr(state.statement, "table", None)
+    if (state.is_update or state.is_delete) and table is not None and table.name == User.__tablename__:
+        user_cache.invalidate_all()
@@ -0,0 +1,243 @@
+"""
+Vocabulário de tokens com ids inteiros estáveis e conjuntos compactos.
+
+Cada token ganha um id uint32 na tabela vocabulary (nunca reaproveitado),
+e um conjunto de tokens vira um array NumPy ordenado de ids: 4 bytes por
+token, contra dezenas de bytes de um str mais o overhead do set. Interseção
+e união saem do merge dos arrays ordenados.
+
+index_candidate cria os ids dos tokens novos na mesma transação do
+currículo. O cache token -> id é por processo e só recebe ids já
+commitados: os criados por uma sessão ficam em session.info até o commit
+e são descartados se a transação terminar sem ele.
+
+CandidatePool mantém a base inteira residente num único par CSR
+(indptr/indices), montado direto de candidate_tokens + vocabulary, e é
+relido quando a versão da tabela candidates (db/table_versions.py) muda,
+então cada worker enxerga as escritas commitadas pelos outros.
+"""
+import heapq
+import threading
+import weakref
+
+import numpy as np
+from sqlalchemy import event, select, insert
+from sqlalchemy.orm import Session
+from app.db.models import Candidate, CandidateToken, VocabularyEntry
+from app.db.table_versions import read_versions
+from app.services.corpus_stats import _dialect_insert
+from app.services.token_store import MAX_TOKEN_LENGTH
+
+TOKEN_ID_DTYPE = np.uint32
+_CHUNK = 500
+_PENDING = "vocabulary_pending"
+
+
+def intersection_size(a: np.ndarray, b: np.ndarray) -> int:
+    """|a ∩ b| para arrays ordenados sem repetição (busca binária do menor no maior)"""
+    if len(a) > len(b):
+        a, b = b, a
+    if not len(a):
+        return 0
+    pos = np.searchsorted(b, a)
+    pos[pos == len(b)] = 0
+    return int(np.count_nonzero(b[pos] == a))
+
+
+def jaccard_ids(a: np.ndarray, b: np.ndarray) -> float:
+    """Mesmo Jaccard de match_score_from_tokens, sobre arrays de ids"""
+    if not len(a) or not len(b):
+        return 0.0
+    inter = intersection_size(a, b)
+    return float(round(inter / (len(a) + len(b) - inter), 4))
+
+
+class Vocabulary:
+    """
+    Cache em processo de token -> id sobre a tabela vocabulary. lookup só
+    lê; resolve também insere os tokens que faltam na sessão do chamador
+    (sem commit). Tokens maiores que a coluna não ganham id.
+    """
+
+    _instances: "weakref.WeakSet[Vocabulary]" = weakref.WeakSet()
+
+    def __init__(self):
+        self._ids: dict[str, int] = {}
+        Vocabulary._instances.add(self)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def clear(self) -> None:
+        self._ids.clear()
+
+    def _select(self, db: Session, tokens: list[str]) -> dict[str, int]:
+        found: dict[str, int] = {}
+        for i in range(0, len(tokens), _CHUNK):
+            found.update(db.execute(
+                select(VocabularyEntry.token, VocabularyEntry.id).where(VocabularyEntry.token.in_(tokens[i:i + _CHUNK]))
+            ).all())
+        return found
+
+    def lookup(self, db: Session, tokens) -> dict[str, int]:
+        """Ids dos tokens que já estão no vocabulário; não insere nada"""
+        tokens = {t for t in tokens if len(t) <= MAX_TOKEN_LENGTH}
+        pending = db.info.get(_PENDING, {})
+        found: dict[str, int] = {}
+        for t in tokens:
+            token_id = self._ids.get(t, pending.get(t))
+            if token_id is not None:
+                found[t] = token_id
+        missing = sorted(tokens - found.keys())
+        if missing:
+            # Os ids criados por esta sessão estão todos em pending: o resto já foi commitado
+            loaded = self._select(db, missing)
+            self._ids.update(loaded)
+            found.update(loaded)
+        return found
+
+    def resolve(self, db: Session, tokens) -> dict[str, int]:
+        """Como lookup, criando os tokens que faltam. Não faz commit."""
+        tokens = {t for t in tokens if len(t) <= MAX_TOKEN_LENGTH}
+        found = self.lookup(db, tokens)
+        missing = sorted(tokens - found.keys())
+        if missing:
+            insert_ = _dialect_insert(db)
+            for i in range(0, len(missing), _CHUNK):
+                rows = [{"token": t} for t in missing[i:i + _CHUNK]]
+                if insert_ is not None:
+                    db.execute(insert_(VocabularyEntry).values(rows).on_conflict_do_nothing(index_elements=[VocabularyEntry.token]))
+                else:
+                    db.execute(insert(VocabularyEntry), rows)
+            created = self._select(db, missing)
+            db.info.setdefault(_PENDING, {}).update(created)
+            found.update(created)
+        return found
+
+    def encode(self, db: Session, tokens) -> np.ndarray:
+        """Array ordenado dos ids conhecidos (leitura: tokens fora do vocabulário ficam de fora)"""
+        arr = np.fromiter(self.lookup(db, tokens).values(), dtype=TOKEN_ID_DTYPE)
+        arr.sort()
+        return arr
+
+
+vocabulary = Vocabulary()
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session: Session) -> None:
+    created = session.info.pop(_PENDING, None)
+    if created:
+        for vocab in list(Vocabulary._instances):
+            vocab._ids.update(created)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _after_transaction_end(session: Session, transaction) -> None:
+    # Rollback ou sessão fechada sem commit: os ids criados não existem no banco
+    if transaction.parent is None:
+        session.info.pop(_PENDING, None)
+
+
+class CandidatePool:
+    """
+    Currículos residentes em memória como CSR de ids: candidate_ids[i] tem
+    seus tokens em indices[indptr[i]:indptr[i + 1]], em ordem crescente.
+    Os tamanhos das linhas são os token_count do índice invertido, então o
+    ranking é o mesmo de top_candidates.
+    """
+
+    def __init__(self, vocab: Vocabulary | None = None):
+        self.vocabulary = vocab or vocabulary
+        self._lock = threading.Lock()
+        self.version: int | None = None  # versão de candidates na última carga
+        self.loads = 0
+        self._data: tuple[list[str], np.ndarray, np.ndarray] = ([], np.zeros(1, dtype=np.int64), np.zeros(0, dtype=TOKEN_ID_DTYPE))
+
+    def clear(self) -> None:
+        with self._lock:
+            self.version = None
+            self.loads = 0
+            self._data = ([], np.zeros(1, dtype=np.int64), np.zeros(0, dtype=TOKEN_ID_DTYPE))
+
+    def __len__(self) -> int:
+        return len(self._data[0])
+
+    def memory_bytes(self) -> int:
+        """Bytes dos arrays de tokens (sem a lista de ids de candidato)"""
+        _, indptr, indices = self._data
+        return indptr.nbytes + indices.nbytes
+
+    def load(self, db: Session, chunk_size: int = 50000) -> int:
+        """Lê a base inteira (postings com o id de cada token) numa consulta"""
+        query = (
+            select(CandidateToken.candidate_id, VocabularyEntry.id)
+            .join(VocabularyEntry, VocabularyEntry.token == CandidateToken.token)
+            .order_by(CandidateToken.candidate_id, VocabularyEntry.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        ids: list[str] = []
+        lengths: list[int] = []
+        chunks: list[np.ndarray] = []
+        for part in db.execute(query).partitions():
+            for cid, _ in part:
+                if ids and ids[-1] == cid:
+                    lengths[-1] += 1
+                else:
+                    ids.append(cid)
+                    lengths.append(1)
+            chunks.append(np.fromiter((r[1] for r in part), dtype=TOKEN_ID_DTYPE, count=len(part)))
+
+        indptr = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        indices = np.concatenate(chunks) if chunks else np.zeros(0, dtype=TOKEN_ID_DTYPE)
+        self._data = (ids, indptr, indices)
+        self.loads += 1
+        return len(ids)
+
+    def refresh(self, db: Session) -> bool:
+        """Relê a base se a tabela candidates mudou desde a última carga"""
+        with self._lock:
+            version = read_versions(db, ["candidates"])[0]["candidates"]
+            if version == self.version:
+                return False
+            self.load(db)
+            self.version = version
+            return True
+
+    def top_k(self, db: Session, job_tokens: set[str], k: int = 10) -> list[dict]:
+        """Os k maiores Jaccard contra a vaga, varrendo a base residente de uma vez"""
+        self.refresh(db)
+        candidate_ids, indptr, indices = self._data
+        job_tokens = {t for t in job_tokens if len(t) <= MAX_TOKEN_LENGTH}
+        job = self.vocabulary.encode(db, job_tokens)
+        if not len(job) or not candidate_ids:
+            return []
+
+        # Marca cada posição de indices que está na vaga e soma por linha
+        pos = np.searchsorted(job, indices)
+        pos[pos == len(job)] = 0
+        hits = np.concatenate(([0], np.cumsum(job[pos] == indices)))
+        inter = hits[indptr[1:]] - hits[indptr[:-1]]
+        # Tokens da vaga fora do vocabulário também entram na união
+        scores = inter / (len(job_tokens) + np.diff(indptr) - inter)
+
+        top = heapq.nsmallest(k, ((-scores[i], candidate_ids[i]) for i in np.flatnonzero(inter)))
+        names = {
+            c.id: c for c in db.execute(
+                select(Candidate.id, Candidate.name, Candidate.email).where(Candidate.id.in_([cid for _, cid in top]))
+            )
+        }
+        return [
+            {
+                "candidate_id": cid,
+                "name": names[cid].name,
+                "email": names[cid].email,
+                "match_score": round(float(-score), 4),
+            }
+            for score, cid in top
+            if cid in names
+        ]
+
+
+candidate_pool = CandidatePool()
@@ -1,5 +1,71 @@
 import sys
 from pathlib import Path
 
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
 # Adiciona src ao path para que 'app' seja importável
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+@pytest.fixture
+def engine():
+    """Banco SQLite em memória, isolado por teste"""
+    from app.db.models import Base
+    from app.services.vocabulary import candidate_pool, vocabulary
+
+    # Ids do vocabulário e a base residente valem só para o banco em que foram lidos
+    vocabulary.clear()
+    candidate_pool.clear()
+
+    eng = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=eng)
+    yield eng
+    eng.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(engine, monkeypatch):
+    """TestClient com get_db (e SessionLocal) apontando para o banco em memória"""
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.db import session as db_session
+    from app.db.session import get_db
+    from app.services.answer_cache import answer_cache
+    from app.services.document_index import document_index
+    from app.services.user_cache import user_cache
+
+    # Índices e caches residentes não podem carregar dados do banco de outro teste
+    document_index.clear()
+    answer_cache.clear()
+    user_cache.clear()
+    TestingSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(db_session, "SessionLocal", TestingSession)
+
+    def _get_db():
+        session = TestingSession()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = _get_db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,37 @@
+from app.services.answer_cache import AnswerCache, normalize_question
+
+
+def test_normalize_question():
+    assert normalize_question("  Quantos dias de FÉRIAS?? ") == "quantos dias de ferias"
+    assert normalize_question("quantos   dias de ferias") == "quantos dias de ferias"
+
+
+def test_lru_eviction_and_ttl():
+    cache = AnswerCache(maxsize=2, ttl=60)
+    cache.set("a", 1, "A")
+    cache.set("b", 1, "B")
+    assert cache.get("A?", 1) == "A"   # "a" vira o mais recente
+    cache.set("c", 1, "C")             # despeja "b"
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 2) is None   # outra versão do corpus
+
+    expired = AnswerCache(maxsize=2, ttl=-1)
+    expired.set("a", 1, "A")
+    assert expired.get("a", 1) is None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 2, 1)
+
+
+def test_chat_cache_invalidated_by_new_document(client):
+    client.post("/api/documents/", json={"title": "Férias", "content": "Férias de 30 dias por ano."})
+    first = client.post("/api/chat/", json={"user_id": "u1", "question": "Quantos dias de férias?"}).json()
+    again = client.post("/api/chat/", json={"user_id": "u1", "question": "quantos dias de FERIAS"}).json()
+    assert again == first
+
+    stats = client.get("/api/metrics/chat-cache").json()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    client.post("/api/documents/", json={"title": "Férias coletivas", "content": "Férias coletivas de 10 dias em dezembro."})
+    client.post("/api/chat/", json={"user_id": "u1", "question": "Quantos dias de férias?"})
+    assert client.get("/api/metrics/chat-cache").json()["misses"] == 2
@@ -0,0 +1,48 @@
+from app.services.ai_resume_match import compute_match_score
+from app.services.batch_scoring import score_pairs
+
+JOBS = [
+    "Dev Backend Python\nPython, FastAPI e PostgreSQL",
+    "Dev Frontend\nReact, TypeScript e CSS",
+    "",
+]
+RESUMES = [
+    "Python, FastAPI, PostgreSQL, Docker",
+    "React, TypeScript, HTML5, CSS3",
+    "Java, Spring Boot",
+    "",
+]
+
+
+def test_score_pairs_matches_compute_match_score():
+    pairs = [(j, r) for j in range(len(JOBS)) for r in range(len(RESUMES))]
+    scores = score_pairs(JOBS, RESUMES, [j for j, _ in pairs], [r for _, r in pairs])
+
+    expected = [compute_match_score(JOBS[j], RESUMES[r]) for j, r in pairs]
+    assert scores.tolist() == expected
+
+
+def _auth_headers(client, role="rh"):
+    r = client.post("/api/auth/register", json={
+        "name": "RH", "email": f"{role}@demo.com", "password": "password", "role": role,
+    })
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+def test_rescore_endpoint_updates_scores(client, db):
+    from app.db.models import Application
+
+    job = client.post("/api/jobs/", json={"title": "Dev Backend Python", "short_description": "Python e FastAPI"}).json()
+    cand = client.post("/api/candidates/", json={"name": "Joao", "email": "joao@demo.com", "resume_text": "Python FastAPI"}).json()
+    app_out = client.post("/api/applications/", json={"job_id": job["id"], "candidate_id": cand["id"]}).json()
+
+    db.query(Application).update({"match_score": 0.0})
+    db.commit()
+
+    assert client.post("/api/applications/rescore").status_code == 401
+    r = client.post("/api/applications/rescore", params={"job_id": job["id"]}, headers=_auth_headers(client))
+    assert r.status_code == 200
+    assert r.json() == {"job_id": job["id"], "rescored": 1}
+
+    db.expire_all()
+    assert db.get(Application, app_out["id"]).match_score == app_out["match_score"] > 0
@@ -0,0 +1,52 @@
+from app.core.config import settings
+from app.services.ai_resume_match import compute_match_score, job_match_text
+from app.services.scoring_queue import queue_stats
+
+
+def _setup(client):
+    job = client.post("/api/jobs/", json={"title": "Dev Backend Python", "short_description": "Python e FastAPI"}).json()
+    ana = client.post("/api/candidates/", json={"name": "Ana", "email": "ana@demo.com", "resume_text": "Python FastAPI SQL"}).json()
+    bia = client.post("/api/candidates/", json={"name": "Bia", "email": "bia@demo.com", "resume_text": "React TypeScript"}).json()
+    return job, ana, bia
+
+
+def test_bulk_create_reports_errors_per_item(client):
+    job, ana, bia = _setup(client)
+    client.post("/api/applications/", json={"job_id": job["id"], "candidate_id": bia["id"]})
+
+    r = client.post("/api/applications/bulk", json={"items": [
+        {"job_id": job["id"], "candidate_id": ana["id"]},
+        {"job_id": job["id"], "candidate_id": ana["id"]},   # repetida no lote
+        {"job_id": job["id"], "candidate_id": bia["id"]},   # já existe no banco
+        {"job_id": "nao-existe", "candidate_id": ana["id"]},
+        {"job_id": job["id"], "candidate_id": "nao-existe"},
+    ]})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["created"] == 1
+    assert body["failed"] == 4
+    assert [i["error"] for i in body["items"]] == [
+        None, "Candidatura duplicada", "Candidatura duplicada", "Vaga não encontrada", "Candidato não encontrado",
+    ]
+
+    expected = compute_match_score(
+        job_match_text(job["title"], job["short_description"], job["full_description"]), "Python FastAPI SQL"
+    )
+    assert body["items"][0]["match_score"] == expected
+
+    apps = client.get("/api/applications/", params={"job_id": job["id"]}).json()
+    created = next(a for a in apps if a["id"] == body["items"][0]["application_id"])
+    assert created["match_score"] == expected
+    assert created["summary"] == "Python FastAPI SQL"
+
+
+def test_bulk_create_async_enqueues(client, db, monkeypatch):
+    monkeypatch.setattr(settings, "application_intake_mode", "async")
+    job, ana, bia = _setup(client)
+
+    r = client.post("/api/applications/bulk", json={"items": [
+        {"job_id": job["id"], "candidate_id": ana["id"]},
+        {"job_id": job["id"], "candidate_id": bia["id"]},
+    ]})
+    assert r.json()["created"] == 2
+    assert queue_stats(db)["depth"] == 2
@@ -0,0 +1,49 @@
+from app.db.models import Candidate, CandidateToken
+from app.services.ai_resume_match import _tokenize, compute_match_score
+from app.services.candidate_index import index_candidate, top_candidates
+
+JOB_TEXT = "Dev Backend Python\nVaga para Backend Python com FastAPI e PostgreSQL"
+
+
+def _add(db, name, resume):
+    cand = Candidate(name=name, email=f"{name.lower()}@demo.com", resume_text=resume)
+    db.add(cand)
+    index_candidate(db, cand)
+    db.commit()
+    return cand
+
+
+def test_top_candidates_matches_exact_jaccard(db):
+    joao = _add(db, "Joao", "Python, FastAPI, PostgreSQL, Docker")
+    ana = _add(db, "Ana", "Java, Spring Boot, MySQL")
+    bia = _add(db, "Bia", "Python com Django e Flask")
+
+    ranked = top_candidates(db, _tokenize(JOB_TEXT), k=10)
+
+    # Ana não compartilha nenhum token e não aparece nas postings
+    assert [r["candidate_id"] for r in ranked] == [joao.id, bia.id]
+    for r, cand in zip(ranked, [joao, bia]):
+        assert r["match_score"] == compute_match_score(JOB_TEXT, cand.resume_text)
+    assert ana.id not in {r["candidate_id"] for r in ranked}
+
+
+def test_reindex_is_incremental(db):
+    cand = _add(db, "Joao", "Python FastAPI")
+    cand.resume_text = "Python Django"
+    index_candidate(db, cand)
+    db.commit()
+
+    tokens = {t.token for t in db.query(CandidateToken).filter_by(candidate_id=cand.id)}
+    assert tokens == {"python", "django"}
+    assert cand.token_count == 2
+
+
+def test_top_candidates_endpoint(client):
+    job = client.post("/api/jobs/", json={"title": "Dev Backend Python", "short_description": "Python e FastAPI"}).json()
+    cand = client.post("/api/candidates/", json={"name": "Joao", "email": "joao@demo.com", "resume_text": "Python FastAPI"}).json()
+
+    r = client.get(f"/api/jobs/{job['id']}/top-candidates", params={"k": 5})
+    assert r.status_code == 200
+    assert r.json()[0]["candidate_id"] == cand["id"]
+
+    assert client.get("/api/jobs/nao-existe/top-candidates").status_code == 404
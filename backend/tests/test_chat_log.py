@@ -0,0 +1,67 @@
+from app.core.config import settings
+from app.db.models import ChatMessage
+from app.services.chat_log import ChatLogBuffer, chat_log_buffer
+
+
+def _row(i):
+    return {"id": f"m{i}", "user_id": "u1", "question": f"q{i}", "answer": "a"}
+
+
+def test_buffer_flushes_in_batches_and_drops_on_overflow(client, db):
+    buffer = ChatLogBuffer(capacity=3, flush_size=2, flush_interval=60, overflow="drop")
+    assert all(buffer.add(_row(i)) for i in range(3))
+    assert buffer.add(_row(3)) is False
+
+    buffer.stop()
+    assert db.query(ChatMessage).count() == 3
+    assert buffer.stats()["flushed"] == 3
+    assert buffer.stats()["dropped"] == 1
+    assert len(buffer) == 0
+
+
+def test_overflow_flush_writes_inline(client, db):
+    buffer = ChatLogBuffer(capacity=2, flush_size=10, flush_interval=60, overflow="flush")
+    for i in range(3):
+        assert buffer.add(_row(i))
+    assert db.query(ChatMessage).count() == 2  # os dois primeiros, gravados na requisição
+    buffer.stop()
+    assert db.query(ChatMessage).count() == 3
+
+
+def test_buffered_chat_endpoint(client, db, monkeypatch):
+    monkeypatch.setattr(settings, "chat_log_mode", "buffered")
+    client.post("/api/chat/", json={"user_id": "u1", "question": "férias"})
+
+    chat_log_buffer.flush()
+    assert db.query(ChatMessage).count() == 1
+    stats = client.get("/api/metrics/chat-log").json()
+    assert stats["mode"] == "buffered" and stats["buffered"] == 0
+
+
+def test_overflow_flush_failure_keeps_capacity(client, db, engine):
+    buffer = ChatLogBuffer(capacity=2, flush_size=10, flush_interval=60, overflow="flush")
+    assert buffer.add(_row(0)) and buffer.add(_row(1))
+    with engine.begin() as conn:  # banco "fora do ar" para as mensagens
+        conn.exec_driver_sql("ALTER TABLE chat_messages RENAME TO chat_messages_off")
+
+    assert buffer.add(_row(2)) is False
+    assert len(buffer) == 2
+    assert buffer.stats()["flush_errors"] == 1 and buffer.stats()["dropped"] == 1
+
+
+def test_rejected_row_does_not_block_its_batch(client, db):
+    db.add(ChatMessage(**_row(1)))  # o lote vai falhar no id duplicado
+    db.commit()
+    buffer = ChatLogBuffer(capacity=10, flush_size=10, flush_interval=60, overflow="drop")
+    for i in range(3):
+        buffer.add(_row(i))
+
+    assert buffer.flush() == 2
+    assert len(buffer) == 0
+    assert {m.id for m in db.query(ChatMessage)} == {"m0", "m1", "m2"}
+    stats = buffer.stats()
+    assert stats["flushed"] == 2 and stats["dropped"] == 1 and stats["flush_errors"] == 1
+
+    # O buffer segue gravando normalmente
+    buffer.add(_row(3))
+    assert buffer.flush() == 1
@@ -0,0 +1,37 @@
+import json
+
+from app.db.models import ChatMessage
+
+
+def _events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_chat_stream_sends_retrieval_tokens_and_done(client, db):
+    client.post("/api/documents/", json={"title": "Férias", "content": "Férias de 30 dias por ano, divididas em até três períodos."})
+    question = {"user_id": "u1", "question": "Quantos dias de férias?"}
+
+    r = client.post("/api/chat/stream", json=question)
+    assert r.headers["content-type"].startswith("text/event-stream")
+    events = _events(r.text)
+
+    kinds = [kind for kind, _ in events]
+    assert kinds[0] == "retrieval" and kinds[-1] == "done"
+    assert set(kinds[1:-1]) == {"token"} and len(kinds) > 3
+    assert events[0][1]["passages"][0]["title"] == "Férias"
+
+    answer = "".join(data["text"] for kind, data in events if kind == "token")
+    assert answer == events[-1][1]["answer"]
+    assert answer == client.post("/api/chat/", json=question).json()["answer"]
+
+    saved = db.get(ChatMessage, events[-1][1]["message_id"])
+    assert saved.answer == answer
+
+    # Segunda vez vem do cache, com os mesmos pedaços
+    cached = _events(client.post("/api/chat/stream", json=question).text)
+    assert cached[0][1]["cached"] is True
+    assert cached[-1][1]["answer"] == answer
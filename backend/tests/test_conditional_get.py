@@ -0,0 +1,68 @@
+from sqlalchemy import event, insert
+
+from app.db.models import Application, Job
+
+
+def _selects(engine):
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", _record)
+
+
+def test_not_modified_skips_main_query(client, engine):
+    client.post("/api/jobs/", json={"title": "Dev Python", "short_description": "Python"})
+    first = client.get("/api/jobs/")
+    etag = first.headers["ETag"]
+    assert first.headers["Last-Modified"]
+
+    statements, stop = _selects(engine)
+    try:
+        r = client.get("/api/jobs/", headers={"If-None-Match": etag})
+    finally:
+        stop()
+    assert r.status_code == 304
+    assert r.content == b""
+    assert r.headers["ETag"] == etag
+    # Só a leitura das versões; a listagem de vagas não roda
+    assert len(statements) == 1 and "table_versions" in statements[0]
+
+    # Outra query string, outro ETag
+    assert client.get("/api/jobs/", params={"limit": 1}, headers={"If-None-Match": etag}).status_code == 200
+    assert client.get("/api/jobs/", headers={"If-Modified-Since": first.headers["Last-Modified"]}).status_code == 304
+
+
+def test_writes_change_etag(client, db):
+    job = client.post("/api/jobs/", json={"title": "Dev Python", "short_description": "Python"}).json()
+    cand = client.post("/api/candidates/", json={"name": "Ana", "email": "ana@demo.com", "resume_text": "Python"}).json()
+    jobs_etag = client.get("/api/jobs/").headers["ETag"]
+    apps_etag = client.get("/api/applications/").headers["ETag"]
+    metrics_etag = client.get("/api/metrics/").headers["ETag"]
+
+    # Entidade via ORM: muda candidaturas e métricas, não vagas
+    app_id = client.post("/api/applications/", json={"job_id": job["id"], "candidate_id": cand["id"]}).json()["id"]
+    assert client.get("/api/jobs/", headers={"If-None-Match": jobs_etag}).status_code == 304
+    r = client.get("/api/applications/", headers={"If-None-Match": apps_etag})
+    assert r.status_code == 200 and len(r.json()) == 1
+    assert client.get("/api/metrics/", headers={"If-None-Match": metrics_etag}).json()["total_applications"] == 1
+
+    # Escrita em massa pela Session (sem entidades) também conta
+    apps_etag = client.get("/api/applications/").headers["ETag"]
+    db.execute(insert(Application), [{"id": "bulk-1", "job_id": job["id"], "candidate_id": cand["id"], "match_score": 0.5}])
+    db.commit()
+    assert client.get("/api/applications/", headers={"If-None-Match": apps_etag}).status_code == 200
+
+    # Update e rollback
+    apps_etag = client.get("/api/applications/").headers["ETag"]
+    client.patch(f"/api/applications/{app_id}/status", json={"status": "em_analise"})
+    assert client.get("/api/applications/", headers={"If-None-Match": apps_etag}).status_code == 200
+
+    jobs_etag = client.get("/api/jobs/").headers["ETag"]
+    db.get(Job, job["id"]).title = "Outro título"
+    db.flush()
+    db.rollback()
+    assert client.get("/api/jobs/", headers={"If-None-Match": jobs_etag}).status_code == 304
@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, insert, update
+
+from app.db.models import Application, ApplicationStatusChange, Candidate, Job, User, UserRole
+from app.services.rollups import refresh_rollups
+
+
+def _selects(engine):
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", _record)
+
+
+def _populate(db, days: int, per_day: int = 3):
+    """Candidaturas espalhadas por `days` dias até hoje, com histórico de criação"""
+    db.add_all([Job(id="j1", title="Dev", short_description="Python"), Job(id="j2", title="QA", short_description="Testes")])
+    now = datetime.utcnow().replace(hour=12)
+    rows = []
+    for d in range(days):
+        created = now - timedelta(days=d)
+        for i in range(per_day):
+            db.add(Candidate(id=f"c{d}-{i}", name="C", email="c@x.dev", resume_text="Python"))
+            rows.append({
+                "id": f"a{d}-{i}", "job_id": "j1" if i % 2 == 0 else "j2", "candidate_id": f"c{d}-{i}",
+                "match_score": float(i * 10), "created_at": created, "updated_at": created,
+            })
+    db.flush()
+    db.execute(insert(Application), rows)
+    db.execute(insert(ApplicationStatusChange), [
+        {"application_id": r["id"], "job_id": r["job_id"], "to_status": "aplicado", "changed_at": r["created_at"]}
+        for r in rows
+    ])
+    db.commit()
+    return rows
+
+
+def test_dashboard_reads_only_rollups(client, db, engine):
+    db.add(User(name="F", email="f@demo.com", password_hash="x", role=UserRole.FUNCIONARIO))
+    db.commit()
+    job = client.post("/api/jobs/", json={"title": "Dev Python", "short_description": "Python FastAPI"}).json()
+    cands = [
+        client.post("/api/candidates/", json={"name": f"C{i}", "email": f"c{i}@demo.com", "resume_text": "Python"}).json()
+        for i in range(2)
+    ]
+    apps = [client.post("/api/applications/", json={"job_id": job["id"], "candidate_id": c["id"]}).json() for c in cands]
+    client.patch(f"/api/applications/{apps[0]['id']}/status", json={"status": "entrevista"})
+    refresh_rollups(db)
+
+    statements, stop = _selects(engine)
+    try:
+        body = client.get("/api/metrics/dashboard", params={"days": 30, "job_id": job["id"]}).json()
+    finally:
+        stop()
+    assert not any("FROM applications" in s for s in statements)
+
+    assert body["total_employees"] == 1
+    assert body["total_teams"] == 0 and body["pending_os"] == 0
+    assert body["messages_today"] == 0
+    today = datetime.utcnow().date().isoformat()
+    assert body["applications_per_day"] == [{
+        "day": today, "applications": 2,
+        "avg_match_score": round(sum(a["match_score"] for a in apps) / 2, 2),
+    }]
+    assert body["job_applications_per_day"] == body["applications_per_day"]
+    transitions = {t["status"]: t["transitions"] for t in body["status_transitions_per_day"]}
+    assert transitions == {"aplicado": 2, "entrevista": 1}
+    assert body["rollups_updated_at"] is not None
+
+
+def test_backfill_in_chunks_then_incremental(client, db):
+    rows = _populate(db, days=90)
+    # 90 dias em blocos de 10 dias
+    assert refresh_rollups(db, chunk_days=10) == 9
+
+    body = client.get("/api/metrics/dashboard", params={"days": 365}).json()
+    assert len(body["applications_per_day"]) == 90
+    assert all(d["applications"] == 3 and d["avg_match_score"] == 10.0 for d in body["applications_per_day"])
+    assert sum(t["transitions"] for t in body["status_transitions_per_day"]) == len(rows)
+    body = client.get("/api/metrics/dashboard", params={"days": 30, "job_id": "j2"}).json()
+    assert len(body["applications_per_day"]) == 30
+    assert [d["applications"] for d in body["job_applications_per_day"]] == [1] * 30
+
+    # Score regravado numa candidatura antiga: só o dia de criação dela é recalculado
+    old = rows[-1]
+    db.execute(update(Application).where(Application.id == old["id"]).values(match_score=80.0, updated_at=datetime.utcnow()))
+    db.commit()
+    refresh_rollups(db, chunk_days=10)
+
+    body = client.get("/api/metrics/dashboard", params={"days": 365}).json()
+    oldest = body["applications_per_day"][0]
+    assert oldest["day"] == old["created_at"].date().isoformat()
+    assert oldest["avg_match_score"] == round((0 + 10 + 80) / 3, 2)
+
+    client.patch(f"/api/applications/{old['id']}/status", json={"status": "rejeitado"})
+    refresh_rollups(db, chunk_days=10)
+    body = client.get("/api/metrics/dashboard", params={"days": 1}).json()
+    assert {"day": datetime.utcnow().date().isoformat(), "status": "rejeitado", "transitions": 1} in body["status_transitions_per_day"]
+
+
+def test_incremental_refresh_finds_dirty_days_by_index(db, engine):
+    _populate(db, days=3)
+    refresh_rollups(db)
+
+    statements, stop = _selects(engine)
+    try:
+        refresh_rollups(db)
+    finally:
+        stop()
+    dirty = [s for s in statements if "FROM applications" in s]
+    assert dirty
+    with engine.connect() as conn:
+        plans = [row[3] for s in dirty for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + s, (datetime.utcnow(),))]
+    assert not any(p.startswith("SCAN applications") for p in plans), plans
+    assert any("ix_applications_updated_at_created_at" in p for p in plans), plans
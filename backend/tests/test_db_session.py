@@ -0,0 +1,41 @@
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.session import create_db_engine
+
+
+def _pragmas(engine) -> dict:
+    with engine.connect() as conn:
+        return {
+            name: conn.execute(text(f"PRAGMA {name}")).scalar()
+            for name in ("journal_mode", "synchronous", "busy_timeout", "cache_size")
+        }
+
+
+def test_sqlite_production_profile_applies_pragmas_on_connect(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path}/prod.db", "production")
+    try:
+        assert _pragmas(engine) == {
+            "journal_mode": "wal",
+            "synchronous": 1,  # NORMAL
+            "busy_timeout": settings.sqlite_busy_timeout,
+            "cache_size": settings.sqlite_cache_size,
+        }
+        assert engine.pool.size() == settings.database_pool_size
+        assert engine.pool._recycle == settings.database_pool_recycle
+    finally:
+        engine.dispose()
+
+
+def test_sqlite_default_profile_keeps_rollback_journal(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path}/dev.db", "default")
+    try:
+        assert _pragmas(engine)["journal_mode"] == "delete"
+    finally:
+        engine.dispose()
+    # Em memória: nem pool configurável nem pragmas do perfil
+    memory = create_db_engine("sqlite://", "production")
+    try:
+        assert _pragmas(memory)["journal_mode"] == "memory"
+    finally:
+        memory.dispose()
@@ -0,0 +1,65 @@
+from sqlalchemy import event
+
+from app.db.models import Document
+from app.services.ai_chatbot import answer_from_documents
+from app.services.document_index import DocumentIndex
+from app.services.passages import chunk_text, store_passages
+
+
+def _add(db, title, content):
+    doc = Document(title=title, content=content)
+    db.add(doc)
+    store_passages(db, doc)
+    db.commit()
+    return doc
+
+
+def test_chat_answers_from_index(client):
+    client.post("/api/documents/", json={"title": "Férias", "content": "As férias podem ser divididas em três períodos."})
+    client.post("/api/documents/", json={"title": "Home office", "content": "Trabalho remoto até três dias por semana."})
+
+    r = client.post("/api/chat/", json={"user_id": "u1", "question": "Posso fazer trabalho remoto?"})
+    assert r.json()["answer"].startswith("Com base no documento 'Home office'")
+
+    # Documento criado depois da carga entra no índice sem recarregar tudo
+    client.post("/api/documents/", json={"title": "Reembolso", "content": "Reembolso de viagem em 30 dias."})
+    r = client.post("/api/chat/", json={"user_id": "u1", "question": "prazo do reembolso"})
+    assert r.json()["answer"].startswith("Com base no documento 'Reembolso'")
+
+    r = client.post("/api/chat/", json={"user_id": "u1", "question": "xyz"})
+    assert r.json()["answer"].startswith("Não encontrei")
+
+
+def test_sync_reads_only_new_documents(db, engine):
+    index = DocumentIndex()
+    _add(db, "Férias", "férias em três períodos")
+    assert index.sync(db) == 1
+
+    # Simula um documento criado por outro worker
+    _add(db, "Ponto", "registro de ponto obrigatório")
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cur, stmt, *a: statements.append(stmt))
+    assert index.sync(db) == 1
+    assert all("WHERE" in s for s in statements if "FROM document_passages" in s)
+    assert len(index) == 2
+    assert index.search("ponto")[0][0] == "Ponto"
+
+
+def test_chunk_text_splits_on_sentences():
+    text = "Primeira frase curta. Segunda frase curta.\n\nOutro parágrafo aqui."
+    assert chunk_text(text, max_words=6) == ["Primeira frase curta. Segunda frase curta.", "Outro parágrafo aqui."]
+    assert chunk_text(text, max_words=3) == ["Primeira frase curta.", "Segunda frase curta.", "Outro parágrafo aqui."]
+    assert chunk_text(" ".join(["palavra"] * 7), max_words=3) == ["palavra palavra palavra"] * 2 + ["palavra"]
+
+
+def test_answer_uses_ranked_passage_of_long_document():
+    handbook = "\n\n".join(
+        [f"Seção {i}: regras gerais de conduta e uso de equipamentos." for i in range(50)]
+        + ["O reembolso de despesas de viagem é pago em até 30 dias após a entrega da nota fiscal."]
+    )
+    documents = [("Código de conduta", "Regras gerais de conduta."), ("Manual do colaborador", handbook)]
+
+    answer = answer_from_documents("Qual o prazo do reembolso de viagem?", documents)
+    assert answer.startswith("Com base no documento 'Manual do colaborador': O reembolso de despesas")
+    assert "Seção" not in answer
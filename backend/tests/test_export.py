@@ -0,0 +1,78 @@
+import csv
+import io
+import json
+
+from sqlalchemy import insert
+
+from app.db.models import Candidate
+from app.services.export import candidates_query, stream_rows
+
+
+def _auth_headers(client, role="rh"):
+    r = client.post("/api/auth/register", json={
+        "name": "RH", "email": f"{role}@demo.com", "password": "password", "role": role,
+    })
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+def _seed(client):
+    job = client.post("/api/jobs/", json={"title": "Dev Python", "short_description": "Python FastAPI"}).json()
+    other = client.post("/api/jobs/", json={"title": "Designer", "short_description": "Figma"}).json()
+    for i, (name, resume) in enumerate([("Ana", "Python FastAPI"), ("=HYPERLINK()", "Python"), ("Bruno", "Java")]):
+        cand = client.post("/api/candidates/", json={"name": name, "email": f"c{i}@demo.com", "resume_text": resume}).json()
+        client.post("/api/applications/", json={"job_id": job["id"], "candidate_id": cand["id"]})
+    client.post("/api/applications/", json={"job_id": other["id"], "candidate_id": cand["id"]})
+    return job
+
+
+def test_export_applications_csv_for_job(client):
+    job = _seed(client)
+    headers = _auth_headers(client)
+    r = client.get("/api/applications/export", params={"job_id": job["id"]}, headers=headers)
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/csv")
+    assert f"candidaturas-{job['id']}.csv" in r.headers["content-disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(r.text)))
+    assert len(rows) == 3
+    assert {row["job_title"] for row in rows} == {"Dev Python"}
+    # Ranking da vaga e fórmula desarmada
+    assert rows[0]["candidate_name"] == "Ana"
+    assert [float(row["match_score"]) for row in rows] == sorted((float(row["match_score"]) for row in rows), reverse=True)
+    assert "'=HYPERLINK()" in {row["candidate_name"] for row in rows}
+    assert rows[0]["status"] == "aplicado"
+
+    assert client.get("/api/applications/export", params={"job_id": "nao-existe"}, headers=headers).status_code == 404
+
+
+def test_export_ndjson(client):
+    _seed(client)
+    headers = _auth_headers(client)
+    r = client.get("/api/applications/export", params={"format": "ndjson"}, headers=headers)
+    lines = [json.loads(line) for line in r.text.splitlines()]
+    assert len(lines) == 4
+    assert {line["job_title"] for line in lines} == {"Dev Python", "Designer"}
+
+    r = client.get("/api/candidates/export", params={"format": "ndjson", "include_resume": True}, headers=headers)
+    cands = [json.loads(line) for line in r.text.splitlines()]
+    assert {c["name"] for c in cands} == {"Ana", "=HYPERLINK()", "Bruno"}
+    assert all("resume_text" in c for c in cands)
+    assert "resume_text" not in client.get("/api/candidates/export", headers=headers).text.splitlines()[0]
+
+
+def test_export_requires_hr_role(client):
+    _seed(client)
+    candidate = _auth_headers(client, "candidato")
+    for url in ("/api/candidates/export", "/api/applications/export"):
+        assert client.get(url, params={"include_resume": True}).status_code == 401
+        assert client.get(url, headers=candidate).status_code == 403
+
+
+def test_export_streams_in_batches(client, db):
+    db.execute(insert(Candidate), [
+        {"id": f"c{i:03d}", "name": f"C{i}", "email": f"c{i}@demo.com", "resume_text": "x"} for i in range(25)
+    ])
+    db.commit()
+    chunks = list(stream_rows(candidates_query(), "csv", batch_size=10))
+    assert len(chunks) == 3
+    assert sum(chunk.count("\n") for chunk in chunks) == 26  # cabeçalho + 25 linhas
@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from app.db.models import Application, Candidate, Job, JobStageDuration, JobStageStat
+from app.services.status_history import job_funnel, rebuild_funnel, record_transitions
+
+
+def _aggregates(db):
+    stats = sorted((r.job_id, r.stage, r.reached, r.rejected) for r in db.scalars(select(JobStageStat)))
+    durations = sorted((r.job_id, r.stage, r.bucket, r.count) for r in db.scalars(select(JobStageDuration)))
+    return stats, durations
+
+
+def test_funnel_from_aggregates_matches_rebuild(db):
+    db.add(Job(id="j1", title="Dev", short_description="Python"))
+    for i in range(4):
+        db.add(Candidate(id=f"c{i}", name="C", email="c@x.dev", resume_text="Python"))
+        db.add(Application(id=f"a{i}", job_id="j1", candidate_id=f"c{i}"))
+    db.flush()
+
+    t0 = datetime(2026, 1, 1, 9, 0)
+    record_transitions(db, [(f"a{i}", "j1", None, "aplicado") for i in range(4)], at=t0)
+    # a0 e a1: 1h e 3h em aplicado; a2 pula direto para entrevista depois de 2h; a3 fica parado
+    record_transitions(db, [("a0", "j1", "aplicado", "em_analise")], at=t0 + timedelta(hours=1))
+    record_transitions(db, [("a1", "j1", "aplicado", "em_analise")], at=t0 + timedelta(hours=3))
+    record_transitions(db, [("a2", "j1", "aplicado", "entrevista")], at=t0 + timedelta(hours=2))
+    record_transitions(db, [("a0", "j1", "em_analise", "entrevista")], at=t0 + timedelta(days=1))
+    record_transitions(db, [("a1", "j1", "em_analise", "rejeitado")], at=t0 + timedelta(days=2))
+    record_transitions(db, [("a0", "j1", "entrevista", "oferecido")], at=t0 + timedelta(days=3))
+    db.commit()
+
+    funnel = job_funnel(db, "j1")
+    stages = {s["stage"]: s for s in funnel["stages"]}
+    assert funnel["applications"] == 4
+    assert funnel["overall_conversion_rate"] == 0.25
+    assert [s["reached"] for s in funnel["stages"]] == [4, 3, 2, 1]
+    assert stages["aplicado"]["conversion_rate"] == 0.75
+    assert stages["em_analise"]["conversion_rate"] == round(2 / 3, 4)
+    assert stages["oferecido"]["conversion_rate"] is None
+    assert stages["em_analise"]["rejected"] == 1
+
+    # Mediana de 1h, 2h e 3h em aplicado: 2h, com o erro do bucket
+    assert stages["aplicado"]["samples"] == 3
+    assert abs(stages["aplicado"]["median_seconds_in_stage"] - 7200) / 7200 < 0.2
+    assert stages["oferecido"]["median_seconds_in_stage"] is None
+
+    before = _aggregates(db)
+    rebuild_funnel(db)
+    db.commit()
+    assert _aggregates(db) == before
+
+
+def test_status_changes_feed_history_and_funnel(client):
+    job = client.post("/api/jobs/", json={"title": "Dev Python", "short_description": "Python FastAPI"}).json()
+    cand = client.post("/api/candidates/", json={"name": "C", "email": "c@demo.com", "resume_text": "Python"}).json()
+    app = client.post("/api/applications/", json={"job_id": job["id"], "candidate_id": cand["id"]}).json()
+    for status in ("em_analise", "em_analise", "entrevista"):
+        client.patch(f"/api/applications/{app['id']}/status", json={"status": status})
+
+    history = client.get(f"/api/applications/{app['id']}/history").json()
+    assert [(h["from_status"], h["to_status"]) for h in history] == [
+        (None, "aplicado"), ("aplicado", "em_analise"), ("em_analise", "entrevista"),
+    ]
+
+    funnel = client.get(f"/api/jobs/{job['id']}/funnel").json()
+    assert [s["reached"] for s in funnel["stages"]] == [1, 1, 1, 0]
+    assert [s["samples"] for s in funnel["stages"]] == [1, 1, 0, 0]
+    assert client.get("/api/jobs/nao-existe/funnel").status_code == 404
+    assert client.get("/api/applications/nao-existe/history").status_code == 404
@@ -0,0 +1,113 @@
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.services.metrics import aggregate_counters, _to_metrics, rebuild_metric_counters, record_applications_created
+from app.services.scoring import rescore_applications
+from app.services.scoring_queue import claim, process_task
+
+
+def _selects(engine):
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", _record)
+
+
+def _job(client, title="Dev Python"):
+    return client.post("/api/jobs/", json={"title": title, "short_description": "Python FastAPI"}).json()
+
+
+def _cand(client, i, resume="Python FastAPI"):
+    return client.post("/api/candidates/", json={"name": f"C{i}", "email": f"c{i}@demo.com", "resume_text": resume}).json()
+
+
+def _metrics(client, engine):
+    statements, stop = _selects(engine)
+    try:
+        body = client.get("/api/metrics/").json()
+    finally:
+        stop()
+    # Versões das tabelas (ETag) + a leitura das métricas
+    return body, [s for s in statements if "table_versions" not in s]
+
+
+def test_metrics_in_one_query(client, engine):
+    body, statements = _metrics(client, engine)
+    assert body["total_jobs"] == 0 and body["avg_match_score"] == 0.0
+    assert set(body["applications_by_status"]) == {"aplicado", "em_analise", "entrevista", "oferecido", "rejeitado"}
+
+    job, _ = _job(client), _job(client, "Designer")
+    cands = [_cand(client, i) for i in range(3)]
+    apps = [client.post("/api/applications/", json={"job_id": job["id"], "candidate_id": c["id"]}).json() for c in cands]
+    client.patch(f"/api/applications/{apps[0]['id']}/status", json={"status": "entrevista"})
+
+    body, statements = _metrics(client, engine)
+    assert len(statements) == 1
+    assert body["total_jobs"] == 2
+    assert body["active_jobs"] == 1
+    assert body["total_candidates"] == 3
+    assert body["total_applications"] == 3
+    assert body["applications_by_status"]["aplicado"] == 2
+    assert body["applications_by_status"]["entrevista"] == 1
+    assert body["avg_match_score"] == round(sum(a["match_score"] for a in apps) / 3, 2)
+
+
+def test_counters_follow_every_write_path(client, db, engine, monkeypatch):
+    monkeypatch.setattr(settings, "metrics_mode", "counters")
+
+    def check():
+        db.expire_all()
+        body, statements = _metrics(client, engine)
+        assert body == _to_metrics(aggregate_counters(db))
+        assert len(statements) == 1 and "metric_counters" in statements[0]
+        return body
+
+    job, other = _job(client), _job(client, "Dev Java")
+    cands = [_cand(client, i, resume) for i, resume in enumerate(["Python", "Java", "Python FastAPI", "Go"])]
+    check()
+
+    app = client.post("/api/applications/", json={"job_id": job["id"], "candidate_id": cands[0]["id"]}).json()
+    client.post("/api/applications/bulk", json={"items": [
+        {"job_id": job["id"], "candidate_id": cands[1]["id"]},
+        {"job_id": other["id"], "candidate_id": cands[1]["id"]},
+        {"job_id": other["id"], "candidate_id": cands[2]["id"]},
+    ]})
+    client.patch(f"/api/applications/{app['id']}/status", json={"status": "oferecido"})
+    client.delete(f"/api/candidates/{cands[3]['id']}")
+    body = check()
+    assert body["active_jobs"] == 2 and body["total_applications"] == 4 and body["total_candidates"] == 3
+
+    # Score gravado pelo worker assíncrono e pelo rescore
+    monkeypatch.setattr(settings, "application_intake_mode", "async")
+    client.post("/api/applications/", json={"job_id": other["id"], "candidate_id": cands[0]["id"]})
+    (task_id,) = claim(db, limit=10)
+    assert process_task(task_id) == "done"
+    check()
+
+    monkeypatch.setattr(settings, "match_scorer", "bm25")
+    assert rescore_applications(db) == 5
+    check()
+
+    # A reconstrução chega aos mesmos valores
+    before = check()
+    rebuild_metric_counters(db)
+    db.commit()
+    assert check() == before
+
+
+def test_first_applications_in_concurrent_transactions_count_job_once(client, db, engine, monkeypatch):
+    monkeypatch.setattr(settings, "metrics_mode", "counters")
+    job = _job(client)
+    # Duas transações que ainda não enxergam candidatura nenhuma da vaga
+    Session = sessionmaker(bind=engine)
+    for _ in range(2):
+        with Session() as other:
+            record_applications_created(other, [(job["id"], "aplicado", 0.0)])
+            other.commit()
+
+    assert client.get("/api/metrics/").json()["active_jobs"] == 1
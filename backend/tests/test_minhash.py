@@ -0,0 +1,63 @@
+import numpy as np
+from sqlalchemy import update
+
+from app.db.models import Candidate
+from app.services.ai_resume_match import _tokenize
+from app.services.candidate_index import index_candidate, top_candidates
+from app.services.minhash import NUM_PERM, signature, estimate_jaccard, approx_top_candidates
+
+
+def test_signature_is_deterministic_and_estimates_jaccard():
+    a = {f"t{i}" for i in range(100)}
+    b = {f"t{i}" for i in range(50, 150)}  # Jaccard exato = 50/150
+
+    sig_a = signature(a)
+    assert sig_a.dtype == np.uint32 and sig_a.shape == (NUM_PERM,)
+    assert np.array_equal(sig_a, signature(set(a)))
+    assert abs(estimate_jaccard(sig_a, signature(b)) - 1 / 3) < 0.15
+    assert estimate_jaccard(sig_a, sig_a) == 1.0
+
+
+def test_approx_with_rerank_agrees_with_exact_on_close_matches(db):
+    job = _tokenize("Dev Backend Python FastAPI PostgreSQL Docker APIs REST pytest")
+    resumes = [
+        "Python FastAPI PostgreSQL Docker APIs REST pytest Linux",
+        "Python FastAPI PostgreSQL Docker Kubernetes",
+        "Java Spring Boot MySQL microsserviços",
+    ]
+    for i, text in enumerate(resumes):
+        cand = Candidate(name=f"C{i}", email=f"c{i}@demo.com", resume_text=text)
+        db.add(cand)
+        index_candidate(db, cand)
+    db.commit()
+
+    exact = top_candidates(db, job, k=2)
+    approx = approx_top_candidates(db, job, k=2, rerank=True)
+    assert approx == exact
+
+
+def test_approx_ignores_overlong_tokens_like_exact_index(db):
+    url = "https://example.com/" + "x" * 200
+    cand = Candidate(name="C", email="c@demo.com", resume_text=f"Python FastAPI PostgreSQL {url}")
+    db.add(cand)
+    index_candidate(db, cand)
+    db.commit()
+
+    job = _tokenize(f"Python FastAPI PostgreSQL {url}")
+    assert approx_top_candidates(db, job, k=1, rerank=True) == top_candidates(db, job, k=1)
+    assert approx_top_candidates(db, job, k=1, rerank=False)[0]["match_score"] == 1.0
+
+
+def test_rerank_retokenizes_candidates_without_persisted_tokens(db):
+    cand = Candidate(name="C", email="c@demo.com", resume_text="Python FastAPI Docker Kubernetes")
+    db.add(cand)
+    index_candidate(db, cand)
+    db.commit()
+    # Como uma linha anterior aos tokens persistidos
+    db.execute(update(Candidate).where(Candidate.id == cand.id).values(tokens=None, tokens_version=None))
+    db.commit()
+
+    job = _tokenize("Dev Python FastAPI")
+    approx = approx_top_candidates(db, job, k=1, rerank=True)
+    assert approx == top_candidates(db, job, k=1)
+    assert approx[0]["match_score"] > 0
@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from app.db.models import Job
+
+
+def _walk(client, url, limit, **params):
+    pages, cursor = [], None
+    while True:
+        r = client.get(url, params={**params, "limit": limit, **({"cursor": cursor} if cursor else {})})
+        assert r.status_code == 200
+        pages.append([item["id"] for item in r.json()])
+        cursor = r.headers.get("X-Next-Cursor")
+        if not cursor:
+            return pages
+
+
+def test_cursor_walks_all_rows_once(client, db):
+    # Timestamps repetidos: o id desempata e nenhuma linha se perde entre páginas
+    same = datetime(2026, 1, 1)
+    db.add_all([Job(title=f"Vaga {i}", short_description="x", created_at=same if i % 2 else datetime(2026, 1, i + 1)) for i in range(7)])
+    db.commit()
+
+    pages = _walk(client, "/api/jobs/", limit=3)
+    assert [len(p) for p in pages] == [3, 3, 1]
+    flat = [job_id for page in pages for job_id in page]
+    assert flat == [item["id"] for item in client.get("/api/jobs/", params={"limit": 500}).json()]
+    assert len(set(flat)) == 7
+
+
+def test_cursor_on_match_score(client):
+    job = client.post("/api/jobs/", json={"title": "Dev Python", "short_description": "Python"}).json()
+    for i, resume in enumerate(["Python", "Python", "Java", "Python FastAPI"]):
+        cand = client.post("/api/candidates/", json={"name": f"C{i}", "email": f"c{i}@demo.com", "resume_text": resume}).json()
+        client.post("/api/applications/", json={"job_id": job["id"], "candidate_id": cand["id"]})
+
+    pages = _walk(client, f"/api/applications/by-job/{job['id']}", limit=1)
+    assert len(pages) == 4
+    scores = [client.get(f"/api/applications/by-job/{job['id']}").json()[i]["match_score"] for i in range(4)]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_invalid_cursor_and_limit(client):
+    assert client.get("/api/jobs/", params={"cursor": "lixo"}).status_code == 400
+    assert client.get("/api/jobs/", params={"limit": 501}).status_code == 422
@@ -0,0 +1,52 @@
+from sqlalchemy import event
+
+from app.db.models import Application
+from app.schemas.applications import ApplicationOut
+
+
+def test_fields_selects_only_requested_columns(client, engine):
+    client.post("/api/jobs/", json={"title": "Dev Python", "short_description": "Python"})
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        r = client.get("/api/jobs/", params={"fields": "title,id"})
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert r.status_code == 200
+    assert r.json()[0].keys() == {"id", "title"}
+    assert "full_description" not in statements[-1]
+
+    # Sem fields: só as colunas do schema (nunca o currículo)
+    client.post("/api/candidates/", json={"name": "Ana", "email": "ana@demo.com", "resume_text": "Python"})
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        assert client.get("/api/candidates/").json()[0].keys() == {"id", "name", "email"}
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    assert "resume_text" not in statements[-1]
+
+
+def test_invalid_field(client):
+    r = client.get("/api/candidates/", params={"fields": "id,resume_text"})
+    assert r.status_code == 400
+    assert "resume_text" in r.json()["detail"]
+
+
+def test_fast_path_matches_pydantic_output(client, db):
+    job = client.post("/api/jobs/", json={"title": "Dev Python", "short_description": "Python"}).json()
+    for i in range(3):
+        cand = client.post("/api/candidates/", json={"name": f"C{i}", "email": f"c{i}@demo.com", "resume_text": "Python"}).json()
+        client.post("/api/applications/", json={"job_id": job["id"], "candidate_id": cand["id"]})
+
+    r = client.get("/api/applications/", params={"limit": 2})
+    assert r.headers["X-Next-Cursor"]
+    expected = [
+        ApplicationOut.model_validate(db.get(Application, item["id"])).model_dump(mode="json")
+        for item in r.json()
+    ]
+    assert r.json() == expected
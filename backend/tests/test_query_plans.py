@@ -0,0 +1,205 @@
+"""
+Regressão de plano de consulta: exercita os endpoints quentes, captura o
+SQL que os routers emitem e roda EXPLAIN em cada SELECT. Falha se alguma
+tabela for lida por varredura completa.
+
+SQLite roda sempre (EXPLAIN QUERY PLAN): falha em qualquer "SCAN <tabela>",
+inclusive "USING INDEX"/"USING COVERING INDEX" (varre o índice inteiro). A
+exceção é o percurso de índice da primeira página de uma listagem: o
+índice entrega a ordem do ORDER BY (sem B-tree temporária) e o LIMIT
+interrompe a varredura. Consultas com WHERE precisam de ao menos um
+SEARCH no plano. Postgres só com TEST_POSTGRES_URL apontando para um banco
+descartável; lá o EXPLAIN roda com enable_seqscan=off e falha em qualquer
+"Seq Scan" (o planner só escolhe um se não houver índice utilizável).
+"""
+import json
+import os
+import re
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import (
+    Base, User, Job, Candidate, Application, Interview, InterviewNote, Notification, Document,
+)
+from app.services.candidate_index import index_candidate
+from app.services.passages import store_passages
+from app.services.token_store import store_job_tokens
+
+_SQLITE_SCAN_RE = re.compile(r"^SCAN (\w+)(?: USING (COVERING )?INDEX \w+)?")
+_LIMIT_RE = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+
+
+def _sqlite_full_scans(plan: list[str], statement: str, tables: set[str]) -> list[str]:
+    ordered_by_index = _LIMIT_RE.search(statement) and not any("TEMP B-TREE FOR ORDER BY" in p for p in plan)
+    scans = []
+    for detail in plan:
+        match = _SQLITE_SCAN_RE.match(detail)
+        if not match or match.group(1) not in tables or "INTEGER PRIMARY KEY" in detail:
+            continue
+        if "INDEX" in detail and ordered_by_index:
+            continue  # primeira página: percorre o índice na ordem e para no LIMIT
+        scans.append(detail)
+    if " WHERE " in statement and not any(p.startswith("SEARCH") for p in plan):
+        scans.append("sem SEARCH: " + " | ".join(plan))
+    return scans
+
+
+def _seed(db) -> dict:
+    """Duas linhas de cada tabela listada, para haver uma segunda página"""
+    users = [User(name=f"RH {i}", email=f"rh{i}@demo.com", password_hash="x") for i in range(2)]
+    job = Job(title="Dev Backend Python", short_description="Python e FastAPI")
+    other_job = Job(title="Dev Frontend", short_description="React")
+    cands = [Candidate(name=f"C{i}", email=f"c{i}@demo.com", resume_text="Python FastAPI PostgreSQL") for i in range(2)]
+    for j in (job, other_job):
+        store_job_tokens(j)
+    db.add_all(users + [job, other_job] + cands)
+    db.flush()
+    for cand in cands:
+        index_candidate(db, cand)
+    apps = [Application(job_id=job.id, candidate_id=cand.id, match_score=0.3) for cand in cands]
+    db.add_all(apps)
+    db.flush()
+    for i in range(2):
+        doc = Document(title=f"Férias {i}", content="Férias de 30 dias por ano.")
+        db.add_all([
+            Interview(application_id=apps[0].id, interviewer_id=users[0].id, scheduled_at=datetime(2026, 1, 1)),
+            InterviewNote(application_id=apps[0].id, author_id=users[0].id, content="ok"),
+            Notification(user_id=users[0].id, type="status_changed", title="t", message="m"),
+            doc,
+        ])
+        store_passages(db, doc)
+    db.commit()
+    return {"user": users[0].id, "job": job.id, "cand": cands[0].id, "app": apps[0].id}
+
+
+def _hot_requests(ids: dict) -> list[tuple[str, str, dict]]:
+    return [
+        ("GET", "/api/jobs/", {}),
+        ("GET", "/api/jobs/", {"params": {"search": "python"}}),
+        ("GET", f"/api/jobs/{ids['job']}", {}),
+        ("GET", f"/api/jobs/{ids['job']}/top-candidates", {}),
+        ("GET", f"/api/jobs/{ids['job']}/top-candidates", {"params": {"mode": "approx"}}),
+        ("GET", "/api/candidates/", {}),
+        ("GET", "/api/candidates/", {"params": {"search": "fastapi"}}),
+        ("GET", f"/api/candidates/{ids['cand']}", {}),
+        ("GET", "/api/applications/", {}),
+        ("GET", "/api/applications/", {"params": {"status": "aplicado"}}),
+        ("GET", "/api/applications/", {"params": {"min_score": 0.1}}),
+        ("GET", f"/api/applications/by-job/{ids['job']}", {}),
+        ("GET", f"/api/applications/by-job/{ids['job']}", {"params": {"status": "aplicado"}}),
+        ("POST", "/api/applications/", {"json": {"job_id": ids["job"], "candidate_id": ids["cand"]}}),
+        ("GET", f"/api/notifications/user/{ids['user']}", {}),
+        ("GET", "/api/interviews/", {}),
+        ("GET", "/api/interviews/", {"params": {"application_id": ids["app"]}}),
+        ("GET", "/api/interview-notes/", {}),
+        ("GET", "/api/interview-notes/", {"params": {"application_id": ids["app"]}}),
+        ("GET", "/api/users/", {}),
+        ("GET", "/api/documents/", {}),
+        ("POST", "/api/chat/", {"json": {"user_id": ids["user"], "question": "férias"}}),
+    ]
+
+
+def _capture(client, engine, requests) -> list[tuple[str, object]]:
+    """SELECTs emitidos pelos routers, incluindo as páginas seguintes via cursor"""
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        for method, url, kwargs in requests:
+            r = client.request(method, url, **kwargs)
+            assert r.status_code == 200, (url, r.text)
+            if method == "GET" and isinstance(r.json(), list):
+                # Página seguinte: mesma consulta com o filtro do cursor
+                params = {**kwargs.get("params", {}), "limit": 1}
+                cursor = client.get(url, params=params).headers.get("X-Next-Cursor")
+                if cursor:
+                    assert client.get(url, params={**params, "cursor": cursor}).status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    return statements
+
+
+def _setup_client(engine, monkeypatch):
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.db import session as db_session
+    from app.db.session import get_db
+    from app.services.answer_cache import answer_cache
+    from app.services.document_index import document_index
+
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(db_session, "SessionLocal", Session)
+
+    def _get_db():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = _get_db
+    document_index.clear()
+    answer_cache.clear()
+    return Session, TestClient(app)
+
+
+def _run_hot_path(engine, monkeypatch):
+    from app.main import app
+
+    Session, client = _setup_client(engine, monkeypatch)
+    try:
+        with Session() as db:
+            ids = _seed(db)
+        # Carga inicial do índice de documentos lê tudo por definição; fica fora da captura
+        client.post("/api/chat/", json={"user_id": ids["user"], "question": "férias"})
+        return _capture(client, engine, _hot_requests(ids))
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_sqlite_hot_queries_use_indexes(engine, monkeypatch):
+    statements = _run_hot_path(engine, monkeypatch)
+    assert statements
+
+    tables = set(Base.metadata.tables)
+    scans = []
+    with engine.connect() as conn:
+        for statement, params in statements:
+            plan = [row[3] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, params)]
+            scans += [(detail, statement) for detail in _sqlite_full_scans(plan, statement, tables)]
+    assert not scans, "\n\n".join(f"{plan}\n{sql}" for plan, sql in scans)
+
+
+@pytest.mark.skipif(not os.getenv("TEST_POSTGRES_URL"), reason="TEST_POSTGRES_URL não definido")
+def test_postgres_hot_queries_use_indexes(monkeypatch):
+    engine = create_engine(os.environ["TEST_POSTGRES_URL"])
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    try:
+        statements = _run_hot_path(engine, monkeypatch)
+
+        def _seq_scans(node):
+            found = [node["Relation Name"]] if node.get("Node Type") == "Seq Scan" else []
+            for child in node.get("Plans", []):
+                found += _seq_scans(child)
+            return found
+
+        scans = []
+        with engine.connect() as conn:
+            conn.exec_driver_sql("SET enable_seqscan = off")
+            for statement, params in statements:
+                plan = conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, params).scalar()
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+                for table in _seq_scans(plan[0]["Plan"]):
+                    scans.append((table, statement))
+        assert not scans, "\n\n".join(f"Seq Scan em {table}\n{sql}" for table, sql in scans)
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
@@ -0,0 +1,69 @@
+import math
+
+import pytest
+
+from app.db.models import Candidate, CorpusStat, TermStat
+from app.services.ai_resume_match import _tokenize
+from app.services.candidate_index import index_candidate, unindex_candidate
+from app.services.scoring import BM25Scorer, JaccardScorer, get_scorer, score_one
+
+JOB = _tokenize("Backend Python FastAPI e PostgreSQL")
+
+
+def _add(db, name, resume):
+    cand = Candidate(name=name, email=f"{name.lower()}@demo.com", resume_text=resume)
+    db.add(cand)
+    index_candidate(db, cand)
+    db.commit()
+    return cand
+
+
+def test_corpus_stats_are_incremental(db):
+    joao = _add(db, "Joao", "Python Python FastAPI e Docker")
+    _add(db, "Ana", "Java e Spring")
+
+    stats = db.get(CorpusStat, 1)
+    assert (stats.doc_count, stats.total_length) == (2, 8)
+    assert db.get(TermStat, "e").df == 2
+
+    joao.resume_text = "Python e Django"
+    index_candidate(db, joao)
+    db.commit()
+    assert (stats.doc_count, stats.total_length) == (2, 6)
+    assert db.get(TermStat, "fastapi") is None
+    assert db.get(TermStat, "django").df == 1
+
+    unindex_candidate(db, joao)
+    db.delete(joao)
+    db.commit()
+    assert (stats.doc_count, stats.total_length) == (1, 3)
+    assert db.get(TermStat, "e").df == 1
+
+
+def test_bm25_weighs_rare_terms_over_stopwords(db):
+    rare = _add(db, "Rare", "Python FastAPI PostgreSQL")
+    common = _add(db, "Common", "e e e Java")
+    for i in range(5):
+        _add(db, f"Filler{i}", "e de com Java")
+
+    bm25 = BM25Scorer()
+    score_rare = score_one(bm25, db, "job", JOB, rare)
+    score_common = score_one(bm25, db, "job", JOB, common)
+    assert 0 < score_common < score_rare < 1
+
+    # Jaccard trata "e" como qualquer outro token
+    jaccard = JaccardScorer()
+    assert score_one(jaccard, db, "job", JOB, common) > 0
+
+    ranked = bm25.top_k(db, JOB, k=2)
+    assert [r["candidate_id"] for r in ranked] == [rare.id, common.id]
+    assert math.isclose(ranked[0]["match_score"], score_rare)
+
+
+def test_get_scorer_uses_settings(monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "match_scorer", "bm25")
+    assert isinstance(get_scorer(), BM25Scorer)
+    with pytest.raises(ValueError):
+        get_scorer("tfidf")
@@ -0,0 +1,132 @@
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.services import scoring_queue
+from app.db.models import Application, ScoringTask
+from app.services.scoring_queue import ScoringWorkerPool, claim, process_task, queue_stats, requeue_stale
+
+
+def _create_application(client):
+    job = client.post("/api/jobs/", json={"title": "Dev Backend Python", "short_description": "Python e FastAPI"}).json()
+    cand = client.post("/api/candidates/", json={"name": "Joao", "email": "joao@demo.com", "resume_text": "Python FastAPI"}).json()
+    return client.post("/api/applications/", json={"job_id": job["id"], "candidate_id": cand["id"]}).json()
+
+
+def test_async_intake_is_scored_by_worker(client, db, monkeypatch):
+    monkeypatch.setattr(settings, "application_intake_mode", "async")
+
+    app_out = _create_application(client)
+    assert app_out["score_status"] == "pending"
+    assert app_out["match_score"] == 0.0
+    assert queue_stats(db)["depth"] == 1
+
+    task_ids = claim(db, limit=10)
+    assert len(task_ids) == 1
+    assert claim(db, limit=10) == []  # já reivindicada
+
+    assert process_task(task_ids[0]) == "done"
+    db.expire_all()
+    app = db.get(Application, app_out["id"])
+    assert app.score_status == "done"
+    assert app.match_score > 0
+    assert app.summary == "Python FastAPI"
+    assert queue_stats(db)["depth"] == 0
+
+
+def test_task_for_missing_application_fails_without_retry(client, db):
+    db.add(ScoringTask(application_id="nao-existe"))
+    db.commit()
+    (task_id,) = claim(db, limit=10)
+
+    assert process_task(task_id) == "skipped"
+    db.expire_all()
+    task = db.get(ScoringTask, task_id)
+    assert task.status == "failed" and task.finished_at is not None
+    assert queue_stats(db) == {**queue_stats(db), "depth": 0, "running": 0, "failed": 1}
+
+
+def test_stale_running_tasks_are_requeued(client, db, monkeypatch):
+    monkeypatch.setattr(settings, "application_intake_mode", "async")
+    _create_application(client)
+
+    (task_id,) = claim(db, limit=10)
+    assert requeue_stale(db, timeout=60) == 0
+
+    # Simula um worker que morreu no meio da tarefa
+    db.get(ScoringTask, task_id).started_at = datetime.utcnow() - timedelta(minutes=10)
+    db.commit()
+    assert requeue_stale(db, timeout=60) == 1
+    assert claim(db, limit=10) == [task_id]
+    assert db.get(ScoringTask, task_id).attempts == 1
+
+
+def test_task_abandoned_too_often_is_failed(client, db, monkeypatch):
+    monkeypatch.setattr(settings, "application_intake_mode", "async")
+    monkeypatch.setattr(settings, "scoring_max_attempts", 2)
+    app_out = _create_application(client)
+
+    for requeued in (1, 0):
+        (task_id,) = claim(db, limit=10)
+        # Worker morre na mesma candidatura a cada tentativa
+        db.get(ScoringTask, task_id).started_at = datetime.utcnow() - timedelta(minutes=10)
+        db.commit()
+        assert requeue_stale(db, timeout=60) == requeued
+
+    db.expire_all()
+    task = db.get(ScoringTask, task_id)
+    assert task.status == "failed" and task.attempts == 2 and task.finished_at is not None
+    assert db.get(Application, app_out["id"]).score_status == "failed"
+    assert claim(db, limit=10) == []
+
+
+def test_scoring_queue_metrics_endpoint(client):
+    r = client.get("/api/metrics/scoring-queue")
+    assert r.status_code == 200
+    assert r.json()["depth"] == 0
+
+
+class _FakeExecutor:
+    """Executor síncrono; o primeiro criado quebra como um pool cujo worker morreu"""
+    created = 0
+
+    def __init__(self, *args, **kwargs):
+        _FakeExecutor.created += 1
+        self.broken = _FakeExecutor.created == 1
+
+    def submit(self, fn, *args):
+        future = Future()
+        if self.broken:
+            future.set_exception(BrokenProcessPool("worker morto"))
+        else:
+            future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+def test_dispatcher_recreates_broken_process_pool(client, db, monkeypatch):
+    monkeypatch.setattr(settings, "application_intake_mode", "async")
+    monkeypatch.setattr(scoring_queue, "ProcessPoolExecutor", _FakeExecutor)
+    monkeypatch.setattr(_FakeExecutor, "created", 0)
+    app_out = _create_application(client)
+
+    pool = ScoringWorkerPool(workers=1, poll_interval=0.01)
+    pool.start()
+    try:
+        deadline = datetime.utcnow() + timedelta(seconds=5)
+        while _FakeExecutor.created < 2 and datetime.utcnow() < deadline:
+            time.sleep(0.01)
+        assert pool._thread.is_alive()
+    finally:
+        pool.stop()
+    assert _FakeExecutor.created == 2
+
+    # A tarefa do lote perdido fica "running" até o requeue_stale devolvê-la
+    db.expire_all()
+    assert db.get(Application, app_out["id"]).score_status == "pending"
+    (task,) = db.query(ScoringTask).all()
+    assert task.status == "running"
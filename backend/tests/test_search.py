@@ -0,0 +1,67 @@
+from app.db.models import Candidate
+
+
+def _create(client, name, email, resume):
+    return client.post("/api/candidates/", json={"name": name, "email": email, "resume_text": resume}).json()
+
+
+def _names(client, url, search, **params):
+    r = client.get(url, params={"search": search, **params})
+    assert r.status_code == 200
+    return [item.get("name") or item.get("title") for item in r.json()]
+
+
+def test_candidate_search_ranks_name_above_resume(client):
+    _create(client, "Ana Souza", "ana@demo.com", "Analista de dados com Python")
+    _create(client, "Bruno Lima", "bruno@demo.com", "Desenvolvedor Python e FastAPI, trabalhou com a Ana em Python")
+    _create(client, "Carla Python", "carla@demo.com", "Gerente de projetos")
+    _create(client, "Diego Rocha", "diego@demo.com", "Java e Spring")
+
+    # Nome vale mais que currículo; só o currículo também entra no resultado
+    assert _names(client, "/api/candidates/", "python") == ["Carla Python", "Bruno Lima", "Ana Souza"]
+    # Prefixo, acentos, email e todos os termos obrigatórios
+    assert _names(client, "/api/candidates/", "fast") == ["Bruno Lima"]
+    assert _names(client, "/api/candidates/", "análista") == ["Ana Souza"]
+    assert _names(client, "/api/candidates/", "diego@demo") == ["Diego Rocha"]
+    assert _names(client, "/api/candidates/", "python java") == []
+    # Sintaxe do FTS5 digitada pelo usuário é tratada como texto
+    assert client.get("/api/candidates/", params={"search": 'python" OR NEAR(*'}).status_code == 200
+
+
+def test_search_index_follows_updates_and_deletes(client, db):
+    cand = _create(client, "Eva Martins", "eva@demo.com", "Contadora")
+    assert _names(client, "/api/candidates/", "kotlin") == []
+
+    row = db.get(Candidate, cand["id"])
+    row.resume_text = "Desenvolvedora Kotlin"
+    db.commit()
+    assert _names(client, "/api/candidates/", "kotlin") == ["Eva Martins"]
+    assert _names(client, "/api/candidates/", "contadora") == []
+
+    client.delete(f"/api/candidates/{cand['id']}")
+    assert _names(client, "/api/candidates/", "kotlin") == []
+
+
+def test_search_cursor_follows_relevance(client):
+    for i in range(5):
+        _create(client, f"Dev {i}", f"d{i}@demo.com", "python " * (i + 1) + "texto " * 20)
+
+    ranked = _names(client, "/api/candidates/", "python")
+    pages, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        r = client.get("/api/candidates/", params={"search": "python", **params})
+        pages += [item["name"] for item in r.json()]
+        cursor = r.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert pages == ranked == [f"Dev {i}" for i in reversed(range(5))]
+
+
+def test_job_search_uses_descriptions(client):
+    client.post("/api/jobs/", json={"title": "Dev Backend", "short_description": "APIs com Django"})
+    client.post("/api/jobs/", json={"title": "Django Developer", "short_description": "Backend"})
+    client.post("/api/jobs/", json={"title": "Designer", "short_description": "Figma"})
+
+    assert _names(client, "/api/jobs/", "django") == ["Django Developer", "Dev Backend"]
+    assert _names(client, "/api/jobs/", "back") == ["Dev Backend", "Django Developer"]
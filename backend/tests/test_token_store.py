@@ -0,0 +1,26 @@
+from app.db.models import Job, Candidate
+from app.services import token_store
+from app.services.ai_resume_match import _tokenize, TOKENIZER_VERSION
+from app.services.candidate_index import index_candidate
+
+
+def test_tokens_are_persisted_on_write(db):
+    job = Job(title="Dev Python", short_description="FastAPI e PostgreSQL")
+    token_store.store_job_tokens(job)
+    db.add(job)
+    db.commit()
+
+    assert job.tokens_version == TOKENIZER_VERSION
+    assert token_store.job_tokens(job) == _tokenize("Dev Python\nFastAPI e PostgreSQL\n")
+
+
+def test_stale_version_is_recomputed(db, monkeypatch):
+    cand = Candidate(name="Joao", email="joao@demo.com", resume_text="Python FastAPI")
+    db.add(cand)
+    index_candidate(db, cand)
+    db.commit()
+
+    monkeypatch.setattr(token_store, "TOKENIZER_VERSION", TOKENIZER_VERSION + 1)
+    assert token_store.refresh_stale_tokens(db) == 1
+    assert cand.tokens_version == TOKENIZER_VERSION + 1
+    assert token_store.refresh_stale_tokens(db) == 0
@@ -0,0 +1,76 @@
+from sqlalchemy import event, update
+
+from app.db.models import User, UserRole
+from app.services.user_cache import UserCache, UserSnapshot, user_cache
+
+
+def _user_selects(engine):
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM users" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", _record)
+
+
+def _register(client, email="ana@demo.com"):
+    body = client.post(
+        "/api/auth/register", json={"name": "Ana", "email": email, "password": "secret", "role": "rh"}
+    ).json()
+    return {"Authorization": f"Bearer {body['access_token']}"}
+
+
+def test_cached_user_skips_lookup_and_follows_role_change(client, db, engine):
+    headers = _register(client)
+    statements, stop = _user_selects(engine)
+    try:
+        first = client.get("/api/employees/me/profile", headers=headers).json()
+        second = client.get("/api/employees/me/profile", headers=headers).json()
+    finally:
+        stop()
+    assert first == second and first["role"] == "rh"
+    assert len(statements) == 1
+    stats = client.get("/api/metrics/auth-cache").json()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+    # Mudança de papel pelo ORM invalida a entrada do email
+    user = db.query(User).filter(User.email == "ana@demo.com").one()
+    user.role = UserRole.ADMIN
+    db.commit()
+    assert client.get("/api/employees/me/profile", headers=headers).json()["role"] == UserRole.ADMIN.value
+    assert client.get("/api/metrics/auth-cache").json()["invalidations"] == 1
+
+    # UPDATE em massa limpa o cache inteiro
+    db.execute(update(User).values(name="Ana Maria"))
+    db.commit()
+    assert client.get("/api/employees/me/profile", headers=headers).json()["name"] == "Ana Maria"
+
+    db.delete(user)
+    db.commit()
+    assert client.get("/api/employees/me/profile", headers=headers).status_code == 401
+
+
+def test_bounded_and_expiring_entries(monkeypatch):
+    cache = UserCache(maxsize=2, ttl=60)
+    users = [UserSnapshot(id=str(i), name="U", email=f"u{i}@demo.com", role=UserRole.RH, created_at=None) for i in range(3)]
+    for i, user in enumerate(users):
+        cache.set(f"t{i}", user)
+    assert cache.get("t0") is None and cache.get("t2") == users[2]
+    assert cache.stats()["evictions"] == 1
+
+    # A entrada nunca vive além da validade do token
+    cache.set("expired", users[0], expires_in=-1)
+    assert cache.get("expired") is None
+    clock = [1000.0]
+    monkeypatch.setattr("app.services.user_cache.time.monotonic", lambda: clock[0])
+    cache.set("short", users[0], expires_in=5)
+    clock[0] += 6
+    assert cache.get("short") is None
+
+    cache.set("t1", users[1])
+    cache.invalidate({"u1@demo.com"})
+    assert cache.get("t1") is None
+    assert user_cache is not cache
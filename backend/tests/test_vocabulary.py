@@ -0,0 +1,96 @@
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Candidate, VocabularyEntry
+from app.services.ai_resume_match import _tokenize, compute_match_score
+from app.services.candidate_index import index_candidate, top_candidates, unindex_candidate
+from app.services.vocabulary import CandidatePool, Vocabulary, jaccard_ids, vocabulary
+
+JOB_TEXT = "Dev Backend Python\nVaga para Backend Python com FastAPI e PostgreSQL"
+RESUMES = {
+    "Joao": "Python, FastAPI, PostgreSQL, Docker",
+    "Ana": "Java, Spring Boot, MySQL",
+    "Bia": "Python com Django e Flask",
+}
+
+
+def _add(db, name, resume):
+    cand = Candidate(name=name, email=f"{name.lower()}@demo.com", resume_text=resume)
+    db.add(cand)
+    index_candidate(db, cand)
+    db.commit()
+    return cand
+
+
+def test_ids_are_stable_and_jaccard_matches(db):
+    vocab = Vocabulary()
+    vocab.resolve(db, _tokenize(JOB_TEXT) | _tokenize(RESUMES["Joao"]))
+    db.commit()
+    job = vocab.encode(db, _tokenize(JOB_TEXT))
+    resume = vocab.encode(db, _tokenize(RESUMES["Joao"]))
+
+    # Outro processo (cache vazio) enxerga os mesmos ids
+    assert (Vocabulary().encode(db, _tokenize(JOB_TEXT)) == job).all()
+    assert list(job) == sorted(job)
+    assert jaccard_ids(job, resume) == compute_match_score(JOB_TEXT, RESUMES["Joao"])
+
+
+def test_ids_are_cached_only_after_commit(engine, db):
+    vocab = Vocabulary()
+    vocab.resolve(db, {"python"})
+    assert len(vocab) == 0  # ainda não commitado
+    db.rollback()
+    assert len(vocab) == 0 and db.query(VocabularyEntry).count() == 0
+
+    # Sessão fechada sem commit também não deixa id no cache
+    other = sessionmaker(bind=engine)()
+    vocab.resolve(other, {"python"})
+    other.close()
+    assert len(vocab) == 0 and vocab.lookup(db, {"python"}) == {}
+
+    vocab.resolve(db, {"python"})
+    db.commit()
+    assert vocab.lookup(db, {"python"}) == {"python": db.query(VocabularyEntry.id).scalar()}
+    assert len(vocab) == 1
+
+
+def test_lookup_does_not_insert(db):
+    assert vocabulary.encode(db, {"python", "fastapi"}).size == 0
+    assert db.query(VocabularyEntry).count() == 0
+
+
+def test_candidate_pool_matches_index_and_follows_writes(engine, db):
+    cands = {name: _add(db, name, text) for name, text in RESUMES.items()}
+    pool = CandidatePool()
+    job_tokens = _tokenize(JOB_TEXT)
+
+    assert pool.top_k(db, job_tokens, k=10) == top_candidates(db, job_tokens, k=10)
+    assert len(pool) == 3 and pool.loads == 1
+    pool.top_k(db, job_tokens, k=10)
+    assert pool.loads == 1  # sem escrita, sem releitura
+
+    # Escritas commitadas por outra sessão (outro worker) mudam a versão de candidates
+    other = sessionmaker(bind=engine)()
+    ana = other.get(Candidate, cands["Ana"].id)
+    ana.resume_text = "Python FastAPI PostgreSQL Backend"
+    index_candidate(other, ana)
+    joao = other.get(Candidate, cands["Joao"].id)
+    unindex_candidate(other, joao)
+    other.delete(joao)
+    other.commit()
+    other.close()
+
+    ranked = pool.top_k(db, job_tokens, k=10)
+    assert ranked == top_candidates(db, job_tokens, k=10)
+    assert [r["candidate_id"] for r in ranked] == [cands["Ana"].id, cands["Bia"].id]
+    assert len(pool) == 2 and pool.loads == 2
+
+
+def test_top_candidates_pool_mode(client):
+    job = client.post("/api/jobs/", json={"title": "Dev Backend Python", "short_description": "Backend Python com FastAPI e PostgreSQL"}).json()
+    for name, text in RESUMES.items():
+        client.post("/api/candidates/", json={"name": name, "email": f"{name.lower()}@demo.com", "resume_text": text})
+
+    exact = client.get(f"/api/jobs/{job['id']}/top-candidates").json()
+    pool = client.get(f"/api/jobs/{job['id']}/top-candidates", params={"mode": "pool"})
+    assert pool.status_code == 200
+    assert exact and pool.json() == exact
@@ -0,0 +1,17 @@
+import requests
+from config import API_URL
+
+PAGE_SIZE = 500
+
+
+def list_all(path: str, **params) -> list:
+	"""Todas as páginas de uma listagem da API, seguindo o cabeçalho X-Next-Cursor"""
+	items, cursor = [], None
+	while True:
+		page = {**params, "limit": PAGE_SIZE, **({"cursor": cursor} if cursor else {})}
+		resp = requests.get(f"{API_URL}{path}", params=page)
+		resp.raise_for_status()
+		items.extend(resp.json())
+		cursor = resp.headers.get("X-Next-Cursor")
+		if not cursor:
+			return items
@@ -1,12 +1,12 @@
 import streamlit as st
 import requests
 from config import API_URL
+from api import list_all
 
 st.title("👩‍💼 Dashboard do RH")
 
 # Listar vagas
-resp = requests.get(f"{API_URL}/jobs")
-jobs = resp.json()
+jobs = list_all("/jobs")
 
 st.subheader("Vagas cadastradas")
 
@@ -1,6 +1,7 @@
 import streamlit as st
 import requests
 from config import API_URL
+from api import list_all
 
 st.title("✍️ Criar nova vaga")
 
@@ -29,8 +30,7 @@ job_id = st.session_state.get("job_id")
 if job_id:
 	st.subheader("📄 Candidatos da vaga")
 
-	resp = requests.get(f"{API_URL}/applications/by-job/{job_id}")
-	apps = resp.json()
+	apps = list_all(f"/applications/by-job/{job_id}")
 
 	if not apps:
 		st.info("Nenhum candidato ainda.")
@@ -1,6 +1,7 @@
 import streamlit as st
 import requests
 from config import API_URL
+from api import list_all
 
 st.title("📄 Enviar Currículo")
 
@@ -9,7 +10,7 @@ email = st.text_input("Email")
 resume_text = st.text_area("Cole aqui o texto do currículo (PDF depois)")
 
 # Buscar vagas
-jobs = requests.get(f"{API_URL}/jobs").json()
+jobs = list_all("/jobs")
 job_titles = {job["title"]: job["id"] for job in jobs}
 
 selected = st.selectbox("Selecione a vaga", list(job_titles.keys()))
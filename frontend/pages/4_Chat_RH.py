@@ -1,3 +1,5 @@
+import json
+
 import streamlit as st
 import requests
 from config import API_URL
@@ -14,17 +16,31 @@ for msg in st.session_state.messages:
 	with st.chat_message(msg["role"]):
 		st.write(msg["content"])
 
+
+def stream_answer(question: str):
+	# Lê os eventos SSE de /chat/stream e devolve os pedaços da resposta
+	with requests.post(f"{API_URL}/chat/stream", json={
+		"user_id": USER_ID,
+		"question": question
+	}, stream=True, timeout=60) as resp:
+		resp.raise_for_status()
+		event = None
+		for line in resp.iter_lines():
+			line = line.decode("utf-8")
+			if line.startswith("event: "):
+				event = line[len("event: "):]
+			elif line.startswith("data: ") and event == "token":
+				yield json.loads(line[len("data: "):])["text"]
+
+
 question = st.chat_input("Digite sua pergunta...")
 
 if question:
 	st.session_state.messages.append({"role": "user", "content": question})
+	with st.chat_message("user"):
+		st.write(question)
 
-	resp = requests.post(f"{API_URL}/chat", json={
-		"user_id": USER_ID,
-		"question": question
-	})
-
-	answer = resp.json()["answer"]
+	with st.chat_message("assistant"):
+		answer = st.write_stream(stream_answer(question))
 
 	st.session_state.messages.append({"role": "assistant", "content": answer})
-	st.rerun()
@@ -6,10 +6,17 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent / "backend" / "src"))
 
 from app.db.session import SessionLocal, engine
-from app.db.models import Base, User, Job, Candidate, Application, Document, UserRole, ApplicationStatus
+from app.db.models import Base, User, Job, Candidate, CandidateToken, CandidateLSHBucket, TermStat, CorpusStat, Application, ApplicationStatusChange, JobStageStat, JobStageDuration, JobApplicationCount, ScoringTask, Document, UserRole, ApplicationStatus
 from app.core.auth import hash_password
 from app.services.ai_job_description import generate_full_job_description
-from app.services.ai_resume_match import compute_match_score, summarize_candidate
+from app.services.ai_resume_match import summarize_candidate
+from app.services.candidate_index import index_candidate
+from app.services.metrics import counters_enabled, rebuild_metric_counters
+from app.services.passages import store_passages
+from app.services.rollups import reset_rollups
+from app.services.scoring import get_scorer, score_one
+from app.services.status_history import record_transitions
+from app.services.token_store import job_tokens, store_job_tokens
 
 # Criar tabelas
 Base.metadata.create_all(bind=engine)
@@ -17,7 +24,17 @@ Base.metadata.create_all(bind=engine)
 db = SessionLocal()
 
 # Limpar dados existentes
+reset_rollups(db)
+db.query(ApplicationStatusChange).delete()
+db.query(JobStageStat).delete()
+db.query(JobStageDuration).delete()
+db.query(JobApplicationCount).delete()
+db.query(ScoringTask).delete()
 db.query(Application).delete()
+db.query(CandidateToken).delete()
+db.query(CandidateLSHBucket).delete()
+db.query(TermStat).delete()
+db.query(CorpusStat).delete()
 db.query(Candidate).delete()
 db.query(Job).delete()
 db.query(User).delete()
@@ -71,6 +88,7 @@ for job_data in jobs_data:
         full_description=full_desc,
         created_by=rh_user.id
     )
+    store_job_tokens(job)
     db.add(job)
     jobs.append(job)
 
@@ -110,13 +128,17 @@ for cand_data in candidates_data:
     db.add(cand)
     candidates.append(cand)
 
+db.flush()
+for cand in candidates:
+    index_candidate(db, cand)
 db.commit()
 
-# Criar aplicações com match scores
+# Criar aplicações com match scores (scorer configurado em MATCH_SCORER, como no seed da API)
+scorer = get_scorer()
 for job in jobs:
-    base_text = f"{job.title}\n{job.short_description}\n{job.full_description or ''}"
+    jt = job_tokens(job)
     for cand in candidates[:2]:  # 2 candidatos por vaga
-        score = compute_match_score(base_text, cand.resume_text)
+        score = score_one(scorer, db, job.id, jt, cand)
         summ = summarize_candidate(cand.resume_text)
         app = Application(
             job_id=job.id,
@@ -126,6 +148,8 @@ for job in jobs:
             status=ApplicationStatus.APLICADO
         )
         db.add(app)
+        db.flush()
+        record_transitions(db, [(app.id, job.id, None, app.status)])
 
 db.commit()
 
@@ -151,9 +175,16 @@ for doc_data in docs_data:
         content=doc_data["content"]
     )
     db.add(doc)
+    store_passages(db, doc)
 
 db.commit()
 
+# Com METRICS_MODE=counters, os contadores passam a refletir os dados acima
+if counters_enabled():
+    rebuild_metric_counters(db)
+    db.commit()
+
+# Os rollups do dashboard são refeitos (backfill) pela thread da API na subida
 print("✓ Demo data populada com sucesso!")
 print(f"  - {len(users)} usuários criados")
 print(f"  - {len(jobs)} vagas criadas")